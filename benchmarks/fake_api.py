@@ -0,0 +1,104 @@
+"""A local, in-process HTTP stand-in for the GoDaddy v1 domains API, used by the benchmarks.
+
+The API itself is emulated by `godaddypy.transport.SimulatedAccount`; this module only serves it over HTTP/1.1 on
+localhost, so the full client stack (connection pooling, concurrency, batching and retries) can be measured
+without network access.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from godaddypy.transport import SimulatedAccount
+
+__all__ = ["FakeGoDaddyAPI"]
+
+
+class FakeGoDaddyAPI(object):
+    """Serves a simulated account on 127.0.0.1 from a background thread.
+
+    >>> with FakeGoDaddyAPI(domains=10, records_per_domain=5) as api:
+    ...     client = Client(Account("key", "secret"), api_base_url=api.base_url)
+    """
+
+    def __init__(self, account=None, **kwargs):
+        """
+        :type account: godaddypy.transport.SimulatedAccount
+        :param account: the account to serve; one is created from kwargs (domains, records_per_domain, latency,
+            max_domains_page, max_records_page, fault_rate, fault_statuses, seed) if omitted
+        """
+        self.account = account if account is not None else SimulatedAccount(**kwargs)
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def zones(self):
+        return self.account.zones
+
+    @property
+    def requests(self):
+        return self.account.requests
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return "http://{}:{}/".format(host, port)
+
+    def start(self):
+        account = self.account
+
+        class Handler(_Handler):
+            simulated = account
+
+        self._server = _Server(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class _Server(ThreadingHTTPServer):
+    # the default backlog of 5 drops connection attempts from concurrent clients
+    request_queue_size = 128
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately; without this, Nagle's algorithm stalls keep-alive connections
+    disable_nagle_algorithm = True
+    simulated = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self):
+        url = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+
+        status, headers, payload = self.simulated.handle(self.command, url.path, query, body)
+
+        content = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_PATCH = do_PUT = do_DELETE = _handle
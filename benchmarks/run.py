@@ -0,0 +1,155 @@
+"""Offline throughput benchmarks for godaddypy.
+
+Runs the client against the local stand-in API in `benchmarks.fake_api`, so results only depend on the client and
+the configured server latency.  Run from the repository root:
+
+    $ python -m benchmarks.run --domains 200 --latency 0.005
+"""
+
+import argparse
+import logging
+import time
+from contextlib import contextmanager
+
+from godaddypy import Account, Client
+from godaddypy.retry import RetryPolicy
+from godaddypy.transport import InMemoryTransport
+
+from .fake_api import FakeGoDaddyAPI
+
+BENCHMARKS = []
+
+
+def benchmark(func):
+    BENCHMARKS.append(func)
+    return func
+
+
+@contextmanager
+def make_client(api, **kwargs):
+    with Client(Account("key", "secret"), log_level=logging.ERROR, api_base_url=api.base_url, **kwargs) as client:
+        yield client
+
+
+@benchmark
+def iter_domains(api, args):
+    with make_client(api) as client:
+        return len(list(client.iter_domains(page_size=args.page_size)))
+
+
+@benchmark
+def iter_domains_prefetch(api, args):
+    with make_client(api) as client:
+        return len(list(client.iter_domains(page_size=args.page_size, prefetch=True)))
+
+
+@benchmark
+def get_records(api, args):
+    with make_client(api) as client:
+        return sum(len(client.get_records(domain)) for domain in sorted(api.zones))
+
+
+@benchmark
+def get_records_no_keep_alive(api, args):
+    with make_client(api, keep_alive=False) as client:
+        return sum(len(client.get_records(domain)) for domain in sorted(api.zones))
+
+
+@benchmark
+def update_ip_serial(api, args):
+    with make_client(api) as client:
+        client.update_ip("192.0.2.1", domains=sorted(api.zones))
+        return len(api.zones)
+
+
+@benchmark
+def update_ip_concurrent(api, args):
+    with make_client(api, pool_maxsize=args.workers) as client:
+        report = client.update_ip("192.0.2.1", domains=sorted(api.zones), max_workers=args.workers)
+        return len(report)
+
+
+@benchmark
+def update_ip_in_memory(api, args):
+    # the same workload without any I/O, to separate client overhead from transport cost
+    transport = InMemoryTransport(api.account)
+    with make_client(api, transport=transport) as client:
+        client.update_ip("192.0.2.3", domains=sorted(api.zones))
+        return len(api.zones)
+
+
+@benchmark
+def add_record_one_by_one(api, args):
+    with make_client(api) as client:
+        domain = sorted(api.zones)[0]
+        for i in range(args.bulk):
+            client.add_record(domain, {"name": "bulk{}".format(i), "ttl": 600, "data": "192.0.2.2", "type": "A"})
+        return args.bulk
+
+
+@benchmark
+def add_records_bulk(api, args):
+    with make_client(api) as client:
+        domain = sorted(api.zones)[0]
+        records = [{"name": "bulk{}".format(i), "ttl": 600, "data": "192.0.2.2", "type": "A"} for i in range(args.bulk)]
+        client.add_records(domain, records)
+        return args.bulk
+
+
+@benchmark
+def add_record_batched(api, args):
+    with make_client(api) as client, client.batch_writer() as writer:
+        domain = sorted(api.zones)[0]
+        for i in range(args.bulk):
+            writer.add_record(domain, {"name": "bulk{}".format(i), "ttl": 600, "data": "192.0.2.2", "type": "A"})
+        return args.bulk
+
+
+@benchmark
+def get_records_with_retries(api, args):
+    api.account.fault_rate = max(api.account.fault_rate, 0.1)
+    with make_client(api, retry=RetryPolicy(max_attempts=10, backoff_base=0.001)) as client:
+        return sum(len(client.get_records(domain)) for domain in sorted(api.zones))
+
+
+def run(args):
+    selected = [b for b in BENCHMARKS if not args.only or b.__name__ in args.only]
+    print("{:<28} {:>10} {:>8} {:>10} {:>10}".format("benchmark", "seconds", "items", "api calls", "calls/s"))
+    for bench in selected:
+        best = None
+        for _ in range(args.repeat):
+            api = FakeGoDaddyAPI(
+                domains=args.domains,
+                records_per_domain=args.records,
+                latency=args.latency,
+                fault_rate=args.fault_rate,
+                max_domains_page=args.page_size,
+            )
+            with api:
+                start = time.perf_counter()
+                items = bench(api, args)
+                elapsed = time.perf_counter() - start
+            calls = sum(api.requests.values())
+            if best is None or elapsed < best[0]:
+                best = (elapsed, items, calls)
+
+        elapsed, items, calls = best
+        print("{:<28} {:>10.3f} {:>8} {:>10} {:>10.1f}".format(bench.__name__, elapsed, items, calls, calls / elapsed))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--domains", type=int, default=100, help="domains in the simulated account")
+    parser.add_argument("--records", type=int, default=10, help="A records per domain")
+    parser.add_argument("--latency", type=float, default=0.002, help="seconds of server latency per request")
+    parser.add_argument("--fault-rate", type=float, default=0.0, help="probability of an injected 429/503")
+    parser.add_argument("--page-size", type=int, default=50, help="domains per page")
+    parser.add_argument("--workers", type=int, default=16, help="threads for the concurrent benchmarks")
+    parser.add_argument("--bulk", type=int, default=200, help="records written by the bulk write benchmarks")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per benchmark, the best one is reported")
+    parser.add_argument("only", nargs="*", help="names of the benchmarks to run (default: all)")
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 from .client import Client
 from .account import Account
+from .async_client import AsyncClient
+from .record import Record
 
 __version__ = "2.5.2"
-__all__ = ["Client", "Account", "__version__"]
+__all__ = ["Client", "AsyncClient", "Account", "Record", "__version__"]
@@ -1,3 +1,69 @@
+import argparse
+import logging
+import signal
+
 from .account import Account
+from .client import Client
+from .ddns import DDNSState, DynamicDNS
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m godaddypy", description="GoDaddyPy command line tools.")
+    commands = parser.add_subparsers(dest="command")
+
+    commands.add_parser("configure", help="store the API key and secret (the default command)")
+
+    ddns = commands.add_parser("ddns", help="keep A/AAAA records pointed at this host's public IP address")
+    ddns.add_argument("-d", "--domain", action="append", dest="domains", help="domain to update (default: all)")
+    ddns.add_argument(
+        "-s", "--subdomain", action="append", dest="subdomains", help="record name to update (default: all)"
+    )
+    ddns.add_argument(
+        "-t",
+        "--type",
+        action="append",
+        dest="record_types",
+        choices=("A", "AAAA"),
+        help="record type to update, may be repeated (default: A)",
+    )
+    ddns.add_argument("-i", "--interval", type=float, default=300, help="seconds between checks (default: 300)")
+    ddns.add_argument("--state", help="file keeping the last pushed addresses (default: XDG state directory)")
+    ddns.add_argument("--workers", type=int, default=4, help="domains updated concurrently (default: 4)")
+    ddns.add_argument("--once", action="store_true", help="check once and exit")
+    ddns.add_argument("-v", "--verbose", action="store_true", help="log every check")
+    return parser
+
+
+def run_ddns(args):
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format="%(asctime)s %(message)s")
+    client = Client(Account(), log_level=logging.WARNING)
+    state = DDNSState(args.state) if args.state else DDNSState()
+    daemon = DynamicDNS(
+        client,
+        domains=args.domains,
+        subdomains=args.subdomains,
+        record_types=args.record_types or ("A",),
+        interval=args.interval,
+        state=state,
+        max_workers=args.workers,
+    )
+
+    def stop(signum, frame):
+        daemon.stop()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    with client:
+        daemon.run(iterations=1 if args.once else None)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "ddns":
+        run_ddns(args)
+    else:
+        Account.configure()
+
 
-Account.configure()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+import asyncio
+import json as jsonlib
+import logging
+
+from .client import GODADDY_API_BASE_URL, GODADDY_API_VERSION, BadResponse, _BaseClient
+from .record import Record, to_json_records
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+__all__ = ["AsyncClient"]
+
+DEFAULT_MAX_CONCURRENCY = 10
+
+
+class AsyncClient(_BaseClient):
+    """The GoDaddyPy asyncio Client.
+
+    Mirrors the `godaddypy.Client` API on top of `aiohttp`. All calls share one pooled `aiohttp.ClientSession`, and
+    the number of requests in flight at any time is bounded by `max_concurrency`.
+
+    Requires the optional `aiohttp` dependency (`pip install godaddypy[async]`).
+    """
+
+    def __init__(
+        self,
+        account=None,
+        log_level=None,
+        api_base_url=GODADDY_API_BASE_URL,
+        api_version=GODADDY_API_VERSION,
+        session=None,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        limit_per_host=0,
+    ):
+        """Create a new `godaddypy.AsyncClient` object
+
+        :type account: godaddypy.Account
+        :param account: The godaddypy.Account object to create auth headers with.
+
+        :type session: aiohttp.ClientSession
+        :param session: An optional pre-configured session. It is not closed by `close()`.
+        :param max_concurrency: maximum number of requests in flight at once
+        :param limit_per_host: maximum number of pooled connections per host (0 means only `max_concurrency` applies)
+        """
+        if aiohttp is None and session is None:
+            raise ImportError("AsyncClient requires aiohttp. Install it with `pip install godaddypy[async]`.")
+
+        super(AsyncClient, self).__init__(account, log_level, api_base_url, api_version)
+
+        self.max_concurrency = max_concurrency
+        self._limit_per_host = limit_per_host
+        self._session = session
+        self._owns_session = session is None
+        # Created lazily so they bind to the running event loop
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def _get_session(self):
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self._limit_per_host)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._owns_session = True
+        return self._session
+
+    def _get_semaphore(self):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def close(self):
+        """Close the pooled session owned by this client.  A session passed in by the caller is left open and keeps
+        being used."""
+        if not self._owns_session:
+            return
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
+
+    async def _get_json_from_response(self, url, json=None, **kwargs):
+        return jsonlib.loads(await self._request_submit("GET", url=url, json=json, **kwargs))
+
+    def _log_response_from_method(self, req_type, status, content):
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        self.logger.debug("[{req_type}] response: {status}".format(status=status, req_type=req_type.upper()))
+        self.logger.debug("Response data: {}".format(content))
+
+    async def _patch(self, url, json=None, **kwargs):
+        return await self._request_submit("PATCH", url=url, json=json, **kwargs)
+
+    async def _put(self, url, json=None, **kwargs):
+        return await self._request_submit("PUT", url=url, json=json, **kwargs)
+
+    async def _delete(self, url, json=None, **kwargs):
+        return await self._request_submit("DELETE", url=url, json=json, **kwargs)
+
+    async def _request_submit(self, method, url, **kwargs):
+        """A helper coroutine that will wrap any requests we make.
+
+        :param method: the HTTP method to invoke (eg. 'GET')
+        :param url: the URL to request
+        :param kwargs: any extra arguments that aiohttp.ClientSession.request takes
+
+        :return: the raw response body
+        """
+        async with self._get_semaphore():
+            async with self._get_session().request(method, url, headers=self._get_headers(), **kwargs) as resp:
+                content = await resp.read()
+        self._log_response_from_method(method, resp.status, content)
+        self._validate_response_success(resp.status, content)
+        return content
+
+    @staticmethod
+    def _validate_response_success(status, content):
+        """Only raise exceptions for 4xx/5xx errors because GoDaddy doesn't
+        always return 200 for a correct request"""
+        if status >= 400:
+            try:
+                message = jsonlib.loads(content)
+            except ValueError:
+                message = content
+            raise BadResponse(message)
+
+    async def add_record(self, domain, record):
+        """Adds the specified DNS record to a domain.
+
+        :param domain: the domain to add the record to
+        :param record: the record to add
+        """
+        return await self.add_records(domain, [record])
+
+    async def add_records(self, domain, records):
+        """Adds the specified DNS records to a domain.
+
+        :param domain: the domain to add the records to
+        :param records: the records to add
+        """
+        url = self.API_TEMPLATE + self.RECORDS.format(domain=domain)
+        await self._patch(url, json=to_json_records(records))
+        self.logger.debug("Added records @ {}".format(records))
+
+        # If we didn't get any exceptions, return True to let the user know
+        return True
+
+    async def get_domain_info(self, domain):
+        """Get the GoDaddy supplied information about a specific domain.
+
+        :param domain: The domain to obtain info about.
+        :type domain: str
+
+        :return A JSON string representing the domain information
+        """
+        url = self.API_TEMPLATE + self.DOMAIN_INFO.format(domain=domain)
+        return await self._get_json_from_response(url)
+
+    async def get_domains(self, limit=1000, marker=None, **params):
+        """Returns a list of domains for the authenticated user.
+
+        :param limit: maximum number of domains to return (max: 1000)
+        :param marker: marker domain to use as offset in results
+        :param params:   Dict of query params to send with the domains request
+        """
+        url = self.API_TEMPLATE + self.DOMAINS
+        params["limit"] = limit
+        if marker:
+            params["marker"] = marker
+        data = await self._get_json_from_response(url, params=params)
+        return [item["domain"] for item in data]
+
+    async def update_domain(self, domain, **kwargs):
+        """Update an existing domain via PATCH /v1/domains/{domain}. See `godaddypy.Client.update_domain`."""
+        url = self.API_TEMPLATE + self.DOMAIN_INFO.format(domain=domain)
+        await self._patch(url, json=dict(kwargs))
+        self.logger.info("Updated domain {} with {}".format(domain, kwargs))
+
+    async def get_records(self, domain, record_type=None, name=None, offset=1, limit=500, as_records=False):
+        """Returns records from a single domain.  If you specify a name you MUST also specify a type.
+
+        :param domain: the domain to get DNS information from
+        :param record_type: the type of record(s) to retrieve
+        :param name: the name of the record(s) to retrieve
+        :param offset: result page offset (starting at 1)
+        :param limit: maximum number of elements to return (max: 500)
+        :param as_records: return godaddypy.Record objects instead of dicts
+        """
+        url = self._build_record_url(domain, record_type=record_type, name=name)
+        data = await self._get_json_from_response(url, params=dict(limit=limit, offset=offset))
+        self.logger.debug("Retrieved {} record(s) from {}.".format(len(data), domain))
+
+        if as_records:
+            return [Record.from_json(item) for item in data]
+        return data
+
+    async def replace_records(self, domain, records, record_type=None, name=None):
+        """This will replace all records at the domain.  Record type and record name can be provided to filter
+        which records to replace.
+
+        :return: True if no exceptions occurred
+        """
+        url = self._build_record_url(domain, name=name, record_type=record_type)
+        await self._put(url, json=to_json_records(records))
+
+        # If we didn't get any exceptions, return True to let the user know
+        return True
+
+    async def update_ip(self, ip, record_type="A", domains=None, subdomains=None):
+        """Update the IP address in all records, specified by type, to the value of ip.  Domains are processed
+        concurrently, bounded by `max_concurrency`.  See `godaddypy.Client.update_ip`.
+
+        :return: True if no exceptions occurred
+        """
+        if domains is None:
+            domains = await self.get_domains()
+        else:
+            domains = self._normalize_domains(domains)
+
+        await asyncio.gather(*(self._update_domain_ip(domain, ip, record_type, subdomains) for domain in domains))
+
+        # If we didn't get any exceptions, return True to let the user know
+        return True
+
+    async def _update_domain_ip(self, domain, ip, record_type, subdomains):
+        records = await self._get_all_records(domain, record_type=record_type)
+        changed = self._apply_ip(records, ip, subdomains)
+        await asyncio.gather(
+            *(
+                self.replace_records(domain, batch, record_type=r_type, name=name)
+                for r_type, name, batch in self._group_record_writes(records, changed)
+            )
+        )
+
+    async def _get_all_records(self, domain, record_type=None, name=None, limit=500):
+        records, offset = [], 1
+        while True:
+            page = await self.get_records(domain, record_type=record_type, name=name, offset=offset, limit=limit)
+            records.extend(page)
+            if len(page) < limit:
+                return records
+            offset += 1
+
+    async def delete_records(self, domain, name, record_type="A"):
+        """Deletes records by name and type
+
+        :return: True if no exceptions occurred
+        """
+        url = self._build_record_url(domain=domain, record_type=record_type, name=name)
+        await self._delete(url=url)
+
+        # If we didn't get any exceptions, return True to let the user know
+        return True
+
+    async def update_record(self, domain, record, record_type=None, name=None):
+        """Call to GoDaddy API to update a single DNS record
+
+        :return: True if no exceptions occurred
+        """
+        if isinstance(record, Record):
+            record = record.to_json()
+        if record_type is None:
+            record_type = record["type"]
+        if name is None:
+            name = record["name"]
+
+        url = self.API_TEMPLATE + self.RECORDS_TYPE_NAME.format(domain=domain, type=record_type, name=name)
+        await self._put(url, json=[record])
+        self.logger.info("Updated record. Domain {} name {} type {}".format(domain, name, record_type))
+
+        # If we didn't get any exceptions, return True to let the user know
+        return True
+
+    async def update_record_ip(self, ip, domain, name, record_type):
+        """Update the IP address(es) for a domain specified by type and name.
+
+        :return: True if no exceptions occurred
+        """
+        records = await self.get_records(domain, name=name, record_type=record_type)
+        if self._apply_ip(records, ip):
+            await self.replace_records(domain, records, record_type=record_type, name=name)
+
+        # If we didn't get any exceptions, return True to let the user know
+        return True
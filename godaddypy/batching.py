@@ -0,0 +1,143 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+__all__ = ["BatchWriter"]
+
+
+class _Batch(object):
+    __slots__ = ("created", "entries")
+
+    def __init__(self, created):
+        self.created = created
+        self.entries = []
+
+
+class BatchWriter(object):
+    """Buffers `add_record` calls per domain and writes them with one `Client.add_records` PATCH per batch.
+
+    A domain's batch is sent once it holds `max_batch` records or its oldest record has waited `max_delay` seconds,
+    whichever comes first.  Every `add_record` returns a `concurrent.futures.Future` resolved once its batch was
+    written; if the PATCH fails, the futures of every record in that batch fail with the raised exception.
+
+    Records added under different `Client.priority` or deadline scopes are batched separately, and each batch is
+    written with the priority and deadline its records were added with.
+
+    >>> with BatchWriter(client) as writer:
+    ...     future = writer.add_record("example.com", {"name": "www", "data": "1.2.3.4", "type": "A", "ttl": 600})
+    >>> future.result()
+    True
+    """
+
+    def __init__(self, client, max_batch=100, max_delay=0.5, clock=time.monotonic):
+        """Create a new `godaddypy.batching.BatchWriter`
+
+        :type client: godaddypy.Client
+        :param client: the client the batches are written with
+        :param max_batch: records per domain that trigger an immediate write
+        :param max_delay: seconds a record may wait in the buffer before its batch is written
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+
+        self.logger = logging.getLogger("GoDaddyPy.BatchWriter")
+        self.client = client
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._pending = {}
+        self._closed = False
+        self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add_record(self, domain, record):
+        """Queues a DNS record to be added to a domain.
+
+        :param domain: the domain to add the record to
+        :param record: the record to add, as a dict or godaddypy.Record
+
+        :return: a Future resolved with True once the record was written
+        """
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BatchWriter is closed")
+            key = (domain, self.client._caller_context())
+            batch = self._pending.get(key)
+            if batch is None:
+                batch = self._pending[key] = _Batch(self._clock())
+            batch.entries.append((record, future))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="godaddypy-batch-writer", daemon=True)
+                self._thread.start()
+            # wake the writer to schedule a new batch or to send a full one
+            if len(batch.entries) == 1 or len(batch.entries) >= self.max_batch:
+                self._cond.notify()
+        return future
+
+    def pending(self):
+        """Returns the number of records waiting to be written."""
+        with self._cond:
+            return sum(len(batch.entries) for batch in self._pending.values())
+
+    def flush(self):
+        """Writes every buffered record now, from the calling thread."""
+        with self._cond:
+            batches, self._pending = self._pending, {}
+        for key, batch in batches.items():
+            self._write(key, batch.entries)
+
+    def close(self):
+        """Writes the remaining records and stops the background writer. No records can be added afterwards."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def _take_due(self):
+        """Removes and returns the batches that are full or have waited long enough, and the seconds until the
+        next one is due.  Must be called with the lock held."""
+        now = self._clock()
+        due, wait = {}, None
+        for key, batch in list(self._pending.items()):
+            remaining = batch.created + self.max_delay - now
+            if self._closed or remaining <= 0 or len(batch.entries) >= self.max_batch:
+                due[key] = self._pending.pop(key)
+            elif wait is None or remaining < wait:
+                wait = remaining
+        return due, wait
+
+    def _run(self):
+        while True:
+            with self._cond:
+                due, wait = self._take_due()
+                while not due and not self._closed:
+                    self._cond.wait(wait)
+                    due, wait = self._take_due()
+                closed = self._closed
+            for key, batch in due.items():
+                self._write(key, batch.entries)
+            if closed:
+                return
+
+    def _write(self, key, entries):
+        domain, context = key
+        try:
+            with self.client._context_scope(context):
+                self.client.add_records(domain, [record for record, _ in entries])
+        except Exception as e:
+            self.logger.error("Failed to add {} record(s) to {}: {}".format(len(entries), domain, e))
+            for _, future in entries:
+                future.set_exception(e)
+        else:
+            for _, future in entries:
+                future.set_result(True)
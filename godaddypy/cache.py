@@ -0,0 +1,110 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+__all__ = ["ResponseCache", "DEFAULT_TTLS"]
+
+DOMAINS = "domains"
+DOMAIN_INFO = "domain_info"
+RECORDS = "records"
+
+# Seconds a response stays fresh, per endpoint
+DEFAULT_TTLS = {
+    DOMAINS: 300.0,
+    DOMAIN_INFO: 60.0,
+    RECORDS: 60.0,
+}
+
+
+class ResponseCache(object):
+    """A thread-safe, size bounded LRU cache of API read responses with per-endpoint TTLs.
+
+    Entries are keyed by (endpoint, domain, *arguments) so every entry of a domain can be dropped at once when the
+    client writes to it.  Values are copied on the way in and out, so callers may freely mutate what they get back.
+
+    Each invalidation bumps the domain's generation.  A reader that passes the generation it saw before fetching to
+    `set` never stores a response that a concurrent write has already made stale.
+    """
+
+    def __init__(self, maxsize=1024, ttls=None, clock=time.monotonic):
+        """Create a new `godaddypy.cache.ResponseCache`
+
+        :param maxsize: maximum number of cached responses; the least recently used are evicted first
+        :param ttls: dict of endpoint ('domains', 'domain_info', 'records') to seconds, merged over DEFAULT_TTLS
+        """
+        self.maxsize = maxsize
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._by_domain = {}
+        self._generations = {}
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Returns (True, value) for a fresh entry, (False, None) otherwise.
+
+        :param key: a tuple of (endpoint, domain, *arguments)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, copy.deepcopy(entry[1])
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return False, None
+
+    def generation(self, domain):
+        """An opaque token that changes whenever the entries of `domain` are invalidated."""
+        with self._lock:
+            return self._epoch, self._generations.get(domain, 0)
+
+    def set(self, key, value, generation=None):
+        """Caches value under key.
+
+        :param generation: the `generation()` of the key's domain read before value was fetched; the value is
+            dropped if the domain was invalidated since
+        """
+        ttl = self.ttls.get(key[0], 0)
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            if generation is not None and generation != (self._epoch, self._generations.get(key[1], 0)):
+                return
+            self._entries[key] = (self._clock() + ttl, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            self._by_domain.setdefault(key[1], set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_domain(self, domain):
+        """Drops every cached response about `domain`."""
+        with self._lock:
+            self._generations[domain] = self._generations.get(domain, 0) + 1
+            for key in list(self._by_domain.get(domain, ())):
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._epoch += 1
+            self._generations.clear()
+            self._entries.clear()
+            self._by_domain.clear()
+
+    def _remove(self, key):
+        self._entries.pop(key, None)
+        keys = self._by_domain.get(key[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_domain[key[1]]
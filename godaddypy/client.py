@@ -1,11 +1,29 @@
 from __future__ import unicode_literals
 
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from enum import Enum
 
 import requests
 
+from . import cache as _cache
 from .account import Account
+from .batching import BatchWriter
+from .deadline import Deadline, DeadlineExceeded
+from .instrumentation import RequestEvent, match_endpoint
+from .ratelimit import RateLimiter
+from .reconcile import DEFAULT_IGNORE_TYPES, plan_zone_changes
+from .record import Record, to_json_records
+from .report import CANCELLED, FAILED, UNCHANGED, UPDATED, DomainResult, UpdateReport
+from .retry import RetryPolicy
+from .scheduler import INTERACTIVE, RequestScheduler
+from .singleflight import SingleFlight
+from .stats import StatsCollector
+from .transport import DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, RequestsTransport
+from .zone import ZoneView
 
 try:
     # python3.x
@@ -20,33 +38,18 @@ __all__ = ["Client", "BadResponse"]
 GODADDY_API_BASE_URL = "https://api.godaddy.com/"
 GODADDY_API_VERSION = "v1"
 
+# (connect, read) timeout in seconds for every request
+DEFAULT_TIMEOUT = (10.0, 60.0)
 
-class Client(object):
-    """The GoDaddyPy Client.
-
-    This client is used to connect to the GoDaddy API and to perform requests with said API.
-    """
 
-    class Domain(Enum):
-        AUTH_CODE = "authCode"
-        CONTACTS = "contacts"
-        NAME_SERVERS = "nameServers"
+class _BaseClient(object):
+    """Shared state of the sync and async clients: logging, auth headers and the API URL templates."""
 
     def __init__(
-        self,
-        account=None,
-        log_level=None,
-        api_base_url=GODADDY_API_BASE_URL,
-        api_version=GODADDY_API_VERSION,
+        self, account=None, log_level=None, api_base_url=GODADDY_API_BASE_URL, api_version=GODADDY_API_VERSION
     ):
-        """Create a new `godaddypy.Client` object
-
-        :type account: godaddypy.Account
-        :param account: The godaddypy.Account object to create auth headers with.
-        """
-
         # Logging setup
-        self.logger = logging.getLogger("GoDaddyPy.Client")
+        self.logger = logging.getLogger("GoDaddyPy." + type(self).__name__)
         # Explicit override of logging level
         if log_level is not None:
             self.logger.setLevel(log_level)
@@ -78,35 +81,451 @@ class Client(object):
     def _get_headers(self):
         return self.account.get_headers()
 
+    @staticmethod
+    def _normalize_domains(domains):
+        if isinstance(domains, str):
+            return [domains]
+        # we have a tuple, set, or something else, try to convert it to a list
+        return list(domains)
+
+    @staticmethod
+    def _subdomain_matches(name, subdomains):
+        # noinspection PyUnresolvedReferences
+        return subdomains is None or (isinstance(subdomains, str) and name == subdomains) or name in subdomains
+
+    @classmethod
+    def _apply_ip(cls, records, ip, subdomains=None):
+        """Sets the data of every matching record to ip, in place, and returns the records that changed."""
+        if subdomains is not None and not isinstance(subdomains, (str, set, frozenset)):
+            # set membership keeps matching linear in the number of records
+            subdomains = frozenset(subdomains)
+        changed = []
+        for record in records:
+            if not str(record["data"]) == ip and cls._subdomain_matches(str(record["name"]), subdomains):
+                record.update(data=str(ip))
+                changed.append(record)
+        return changed
+
+    @staticmethod
+    def _group_record_writes(records, changed, per_name=False):
+        """Groups changed records into as few replace_records calls as possible.
+
+        Each changed record type becomes one PUT: scoped to (type, name) when a single name of that type changed,
+        otherwise scoped to the whole type.  The submitted batches always contain every fetched record in the
+        scope, since a PUT replaces all of them.
+
+        :param per_name: always scope writes to (type, name), for records that may not hold the whole type
+        :return: a list of (record_type, name, records) tuples, name being None for type-wide writes
+        """
+        names_by_type = {}
+        for record in changed:
+            names_by_type.setdefault(record["type"], set()).add(str(record["name"]))
+
+        writes = []
+        for record_type, names in names_by_type.items():
+            scopes = sorted(names) if per_name or len(names) == 1 else [None]
+            for name in scopes:
+                batch = [
+                    record
+                    for record in records
+                    if record["type"] == record_type and (name is None or str(record["name"]) == name)
+                ]
+                writes.append((record_type, name, batch))
+        return writes
+
+
+class Client(_BaseClient):
+    """The GoDaddyPy Client.
+
+    This client is used to connect to the GoDaddy API and to perform requests with said API.
+    """
+
+    class Domain(Enum):
+        AUTH_CODE = "authCode"
+        CONTACTS = "contacts"
+        NAME_SERVERS = "nameServers"
+
+    def __init__(
+        self,
+        account=None,
+        log_level=None,
+        api_base_url=GODADDY_API_BASE_URL,
+        api_version=GODADDY_API_VERSION,
+        session=None,
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        pool_block=False,
+        keep_alive=True,
+        max_concurrency=None,
+        rate_limit=None,
+        rate_burst=1,
+        retry=None,
+        cache=None,
+        snapshots=None,
+        stats=False,
+        transport=None,
+        timeout=DEFAULT_TIMEOUT,
+        coalesce_reads=True,
+        scheduler=None,
+    ):
+        """Create a new `godaddypy.Client` object
+
+        Requests are sent through a `godaddypy.transport.Transport`.  By default that is a pooled `requests.Session`
+        which is reused for every API call, so repeated calls share TCP/TLS connections. The session is safe to
+        share between threads. Use the client as a context manager, or call `close()`, to release the pooled
+        connections.
+
+        :type account: godaddypy.Account
+        :param account: The godaddypy.Account object to create auth headers with.
+
+        :type transport: godaddypy.transport.Transport
+        :param transport: send requests through this transport instead of the default pooled requests transport
+            (eg. `godaddypy.transport.InMemoryTransport` for dry runs).  The session and pool arguments are ignored.
+
+        :type timeout: float or (float, float)
+        :param timeout: seconds to wait for each request, either one value or a (connect, read) tuple
+
+        :type session: requests.Session
+        :param session: An optional pre-configured session to use instead of the pooled default. It is not closed
+            by `close()`.
+        :param pool_connections: number of per-host connection pools to cache
+        :param pool_maxsize: maximum number of connections kept open per host
+        :param pool_block: block when no free connection is available instead of opening a throwaway one
+        :param keep_alive: keep connections open between requests (set False to send `Connection: close`)
+        :param max_concurrency: maximum number of requests in flight at once across all threads using this client
+
+        :type rate_limit: int or godaddypy.ratelimit.RateLimiter
+        :param rate_limit: client-side request quota.  Either a requests per minute value, in which case the limiter
+            is shared by every client using the same API key (the first client's settings win), or an explicit
+            RateLimiter.  None disables limiting.
+        :param rate_burst: requests that may be sent back to back when `rate_limit` is a number
+
+        :type retry: godaddypy.retry.RetryPolicy, int or bool
+        :param retry: how transient failures are retried.  An int is the maximum number of attempts with the default
+            policy, True the default policy.  None (or False) sends every request exactly once.
+
+        :type cache: godaddypy.cache.ResponseCache or bool
+        :param cache: an in-memory cache for get_domains, get_domain_info and get_records.  True uses a cache with
+            the default TTLs.  Cached entries of a domain are dropped whenever this client writes to it.
+
+        :type snapshots: godaddypy.snapshot.SnapshotStore
+        :param snapshots: an on-disk zone snapshot store used by get_zone and refresh_snapshots.  Snapshots of a
+            domain are dropped whenever this client writes to it.
+
+        :type stats: bool or godaddypy.stats.StatsCollector
+        :param stats: collect per-endpoint latency histograms, call, error and byte counts, see `stats()`
+
+        :param coalesce_reads: let concurrent identical GETs share a single in-flight request.  Every caller still
+            gets its own copy of the decoded response.
+
+        :type scheduler: godaddypy.scheduler.RequestScheduler or bool
+        :param scheduler: serve requests by priority class within the rate and concurrency limits, see `priority()`.
+            True creates a scheduler from rate_limit and max_concurrency.  A given scheduler is used as is, and
+            rejected with ValueError if it was not created with the same rate limiter and max_concurrency.
+        """
+        super(Client, self).__init__(account, log_level, api_base_url, api_version)
+
+        if transport is None:
+            transport = RequestsTransport(session, pool_connections, pool_maxsize, pool_block, keep_alive)
+        self.transport = transport
+        self.timeout = timeout
+        # the Deadline of the operation running on each thread, see _deadline_scope
+        self._local = threading.local()
+
+        self._concurrency = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+
+        if rate_limit is None or isinstance(rate_limit, RateLimiter):
+            self.rate_limiter = rate_limit
+        else:
+            self.rate_limiter = RateLimiter.for_account(self.account, rate_limit, rate_burst)
+
+        self.scheduler = self._make_scheduler(scheduler, max_concurrency)
+        if self.scheduler is not None:
+            # the scheduler enforces both limits itself
+            self._concurrency = None
+            self.rate_limiter = self.scheduler.rate_limiter
+
+        if retry is True:
+            retry = RetryPolicy()
+        elif isinstance(retry, int) and not isinstance(retry, bool):
+            retry = RetryPolicy(max_attempts=retry)
+        self.retry = retry or None
+
+        self.cache = _cache.ResponseCache() if cache is True else (cache or None)
+        self.snapshots = snapshots
+        self._flights = SingleFlight() if coalesce_reads else None
+
+        # Instrumentation, see add_request_hook and add_response_hook
+        self._request_hooks = []
+        self._response_hooks = []
+
+        self.stats_collector = StatsCollector() if stats is True else (stats or None)
+        if self.stats_collector is not None:
+            self.add_response_hook(self.stats_collector)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def session(self):
+        """The `requests.Session` of the default transport, or None for other transports."""
+        return getattr(self.transport, "session", None)
+
+    def close(self):
+        """Close the transport of this client, releasing its pooled connections."""
+        self.transport.close()
+
+    def _make_scheduler(self, scheduler, max_concurrency):
+        """Returns the scheduler for the `scheduler` argument.  A given scheduler may be shared with other clients,
+        so it is used as is and must already enforce the client's limits."""
+        if scheduler is True:
+            return RequestScheduler(self.rate_limiter, max_concurrency)
+        if not scheduler:
+            return None
+
+        if self.rate_limiter is not None and scheduler.rate_limiter is not self.rate_limiter:
+            raise ValueError(
+                "The scheduler does not use the client's rate limiter; create it with that limiter or pass "
+                "scheduler=True"
+            )
+        if max_concurrency and scheduler.max_in_flight != max_concurrency:
+            raise ValueError(
+                "The scheduler allows {} request(s) in flight, not max_concurrency={}; create it with that bound "
+                "or pass scheduler=True".format(scheduler.max_in_flight, max_concurrency)
+            )
+        return scheduler
+
+    def _cached_read(self, key, fetch):
+        """Returns the cached response for key, calling fetch() and caching its result on a miss."""
+        if self.cache is None:
+            return fetch()
+
+        # read before fetching, so a write invalidating the domain meanwhile keeps the stale response out
+        generation = self.cache.generation(key[1])
+        hit, value = self.cache.get(key)
+        if not hit:
+            value = fetch()
+            self.cache.set(key, value, generation)
+        return value
+
+    def _invalidate(self, domain):
+        if self._flights is not None:
+            self._flights.forget()
+        if self.cache is not None:
+            self.cache.invalidate_domain(domain)
+        if self.snapshots is not None:
+            self.snapshots.invalidate(domain)
+
     def _get_json_from_response(self, url, json=None, **kwargs):
-        return self._request_submit(requests.get, url=url, json=json, **kwargs).json()
+        if self._flights is None or json is not None:
+            return self._request_submit("GET", url=url, json=json, **kwargs).json()
+
+        # Concurrent identical reads share one request; each caller decodes its own copy of the body
+        key = (url, repr(sorted((kwargs.get("params") or {}).items())))
+        deadline = self._current_deadline()
+        timeout = deadline.remaining() if deadline is not None else None
+        resp = self._flights.do(key, lambda: self._request_submit("GET", url=url, json=json, **kwargs), timeout)
+        return resp.json()
 
     def _log_response_from_method(self, req_type, resp):
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         self.logger.debug("[{req_type}] response: {resp}".format(resp=resp, req_type=req_type.upper()))
         self.logger.debug("Response data: {}".format(resp.content))
 
+    def add_request_hook(self, hook):
+        """Registers hook(event) to be called with a godaddypy.instrumentation.RequestEvent before every request
+        attempt.  Requests are not instrumented at all while no hooks are registered."""
+        self._request_hooks = self._request_hooks + [hook]
+
+    def add_response_hook(self, hook):
+        """Registers hook(event) to be called with the completed godaddypy.instrumentation.RequestEvent (status,
+        latency, response bytes or error) after every request attempt."""
+        self._response_hooks = self._response_hooks + [hook]
+
+    def remove_hook(self, hook):
+        """Unregisters a request or response hook."""
+        self._request_hooks = [h for h in self._request_hooks if h is not hook]
+        self._response_hooks = [h for h in self._response_hooks if h is not hook]
+
+    def stats(self):
+        """Returns a snapshot of the per-endpoint stats collected by this client, keyed by
+        '<METHOD> <endpoint template>', with count, errors, retries, response_bytes and latency mean, p50, p95, p99
+        and max (seconds).  Use `stats_collector.to_prometheus()` for the Prometheus text format."""
+        if self.stats_collector is None:
+            raise ValueError("stats() requires a Client created with stats=True")
+        return self.stats_collector.snapshot()
+
+    def _emit(self, hooks, event):
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception:
+                self.logger.exception("Instrumentation hook {!r} failed".format(hook))
+
+    def _endpoint_for(self, url):
+        path = url[len(self.API_TEMPLATE) :] if url.startswith(self.API_TEMPLATE) else url
+        templates = (self.RECORDS_TYPE_NAME, self.RECORDS_TYPE, self.RECORDS, self.DOMAIN_INFO, self.DOMAINS)
+        return match_endpoint(path, templates)
+
     def _patch(self, url, json=None, **kwargs):
-        return self._request_submit(requests.patch, url=url, json=json, **kwargs)
+        return self._request_submit("PATCH", url=url, json=json, **kwargs)
 
     def _put(self, url, json=None, **kwargs):
-        return self._request_submit(requests.put, url=url, json=json, **kwargs)
+        return self._request_submit("PUT", url=url, json=json, **kwargs)
 
     def _delete(self, url, json=None, **kwargs):
-        return self._request_submit(requests.delete, url=url, json=json, **kwargs)
+        return self._request_submit("DELETE", url=url, json=json, **kwargs)
 
-    def _request_submit(self, func, **kwargs):
-        """A helper function that will wrap any requests we make.
+    def _request_submit(self, method, **kwargs):
+        """A helper function that will wrap any requests we make.  Transient failures are retried according to
+        `self.retry`.
 
-        :param func: a function reference to the requests method to invoke
-        :param kwargs: any extra arguments that requests.request takes
+        :param method: the HTTP method to invoke (eg. 'GET')
+        :param kwargs: any extra arguments that requests.Session.request takes
 
-        :type func: (url: Any, data: Any, json: Any, kwargs: Dict)
+        :type method: str
         """
-        resp = func(headers=self._get_headers(), **kwargs)
-        self._log_response_from_method(func.__name__, resp)
+        retry = self.retry
+        attempt = 1
+        while True:
+            try:
+                resp = self._send(method, attempt, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if retry is None or not retry.should_retry(method, attempt, error=e):
+                    raise
+                self.logger.warning("[{}] attempt {} failed: {}".format(method, attempt, e))
+                self._retry_wait(retry, attempt)
+            else:
+                if retry is None or not retry.should_retry(method, attempt, response=resp):
+                    break
+                self.logger.warning("[{}] attempt {} returned {}".format(method, attempt, resp.status_code))
+                self._retry_wait(retry, attempt, resp)
+            attempt += 1
+
+        self._log_response_from_method(method, resp)
         self._validate_response_success(resp)
         return resp
 
+    def _retry_wait(self, retry, attempt, response=None):
+        delay = retry.backoff(attempt, response)
+        deadline = self._current_deadline()
+        if deadline is not None and delay >= deadline.remaining():
+            raise DeadlineExceeded("Deadline of {}s exceeded while backing off".format(deadline.seconds))
+        if delay > 0:
+            retry.sleep(delay)
+
+    def _current_deadline(self):
+        return getattr(self._local, "deadline", None)
+
+    @contextmanager
+    def _deadline_scope(self, deadline):
+        """Bounds every request made by the current thread within the block by deadline (a no-op for None)."""
+        previous = self._current_deadline()
+        if deadline is not None:
+            self._local.deadline = deadline
+        try:
+            yield deadline
+        finally:
+            self._local.deadline = previous
+
+    @contextmanager
+    def priority(self, priority, flow=None):
+        """Sends the requests made by the current thread within the block with the given priority class.  Requests
+        default to interactive priority; background jobs should run as bulk so they yield to interactive calls.
+        Worker threads started within the block (eg. by `update_ip` with `max_workers`, prefetching iterators, zone
+        file exports and imports, update jobs and watches) send their requests with the same priority.
+
+        >>> with client.priority(godaddypy.scheduler.BULK):
+        ...     client.update_ip("192.0.2.1")
+
+        :param priority: godaddypy.scheduler.INTERACTIVE or godaddypy.scheduler.BULK
+        :param flow: requests of the same flow are queued together; flows of a class are served round-robin
+            (default: one flow per thread)
+        """
+        previous = getattr(self._local, "priority", None)
+        self._local.priority = (priority, flow)
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    def _caller_context(self):
+        """The (deadline, priority) of the calling thread, for work handed to other threads; both are thread-local
+        and would otherwise be lost in the worker."""
+        return self._current_deadline(), getattr(self._local, "priority", None)
+
+    @contextmanager
+    def _context_scope(self, context):
+        """Runs the block with a context captured by _caller_context."""
+        deadline, priority = context
+        previous = getattr(self._local, "priority", None)
+        self._local.priority = priority
+        try:
+            with self._deadline_scope(deadline):
+                yield
+        finally:
+            self._local.priority = previous
+
+    def _bind_context(self, func):
+        """Wraps func to run with the deadline and priority of the calling thread, wherever it is called from."""
+        context = self._caller_context()
+
+        def run(*args, **kwargs):
+            with self._context_scope(context):
+                return func(*args, **kwargs)
+
+        return run
+
+    def _send(self, method, attempt=1, **kwargs):
+        """Sends a single attempt of a request, within the rate and concurrency limits."""
+        if self.scheduler is not None:
+            priority, flow = getattr(self._local, "priority", None) or (INTERACTIVE, None)
+            deadline = self._current_deadline()
+            timeout = deadline.remaining() if deadline is not None else None
+            with self.scheduler.slot(priority, flow, timeout):
+                return self._send_instrumented(method, attempt, **kwargs)
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return self._send_instrumented(method, attempt, **kwargs)
+
+    def _send_instrumented(self, method, attempt, **kwargs):
+        if not (self._request_hooks or self._response_hooks):
+            return self._transport_request(method, **kwargs)
+
+        url = kwargs.get("url", "")
+        event = RequestEvent(method, self._endpoint_for(url), url, attempt)
+        self._emit(self._request_hooks, event)
+        start = time.perf_counter()
+        try:
+            resp = self._transport_request(method, **kwargs)
+        except Exception as e:
+            event.latency = time.perf_counter() - start
+            event.error = e
+            self._emit(self._response_hooks, event)
+            raise
+        event.latency = time.perf_counter() - start
+        event.status = resp.status_code
+        event.response_bytes = len(resp.content or b"")
+        self._emit(self._response_hooks, event)
+        return resp
+
+    def _transport_request(self, method, **kwargs):
+        timeout = kwargs.pop("timeout", self.timeout)
+        deadline = self._current_deadline()
+        if deadline is not None:
+            timeout = deadline.cap(timeout)
+        kwargs["timeout"] = timeout
+
+        if self._concurrency is not None:
+            with self._concurrency:
+                return self.transport.request(method, headers=self._get_headers(), **kwargs)
+        return self.transport.request(method, headers=self._get_headers(), **kwargs)
+
     @staticmethod
     def _validate_response_success(response):
         """Only raise exceptions for 4xx/5xx errors because GoDaddy doesn't
@@ -127,14 +546,27 @@ class Client(object):
         # If we didn't get any exceptions, return True to let the user know
         return True
 
+    def batch_writer(self, max_batch=100, max_delay=0.5):
+        """Returns a godaddypy.batching.BatchWriter that buffers add_record calls per domain and writes them with
+        one add_records call per batch.  Close it (or use it as a context manager) to write the remaining records.
+
+        :param max_batch: records per domain that trigger an immediate write
+        :param max_delay: seconds a record may wait in the buffer before its batch is written
+        """
+        return BatchWriter(self, max_batch, max_delay)
+
     def add_records(self, domain, records):
         """Adds the specified DNS records to a domain.
 
         :param domain: the domain to add the records to
-        :param records: the records to add
+        :param records: the records to add, as dicts or godaddypy.Record objects
         """
+        records = to_json_records(records)
         url = self.API_TEMPLATE + self.RECORDS.format(domain=domain)
-        self._patch(url, json=records)
+        try:
+            self._patch(url, json=records)
+        finally:
+            self._invalidate(domain)
         self.logger.debug("Added records @ {}".format(records))
 
         # If we didn't get any exceptions, return True to let the user know
@@ -149,7 +581,7 @@ class Client(object):
         :return A JSON string representing the domain information
         """
         url = self.API_TEMPLATE + self.DOMAIN_INFO.format(domain=domain)
-        return self._get_json_from_response(url)
+        return self._cached_read((_cache.DOMAIN_INFO, domain), lambda: self._get_json_from_response(url))
 
     def get_domains(self, limit=1000, marker=None, **params):
         """Returns a list of domains for the authenticated user.
@@ -162,7 +594,8 @@ class Client(object):
         params["limit"] = limit
         if marker:
             params["marker"] = marker
-        data = self._get_json_from_response(url, params=params)
+        key = (_cache.DOMAINS, None, repr(sorted(params.items())))
+        data = self._cached_read(key, lambda: self._get_json_from_response(url, params=params))
         domains = list()
         for item in data:
             domain = item["domain"]
@@ -171,6 +604,92 @@ class Client(object):
 
         return domains
 
+    def iter_domains(self, page_size=1000, prefetch=False, deadline=None, **params):
+        """Lazily yields every domain of the authenticated user, following the `marker` cursor page by page.
+
+        :param page_size: number of domains requested per page (max: 1000)
+        :param prefetch: fetch the next page in a background thread while the current page is being consumed
+        :param deadline: seconds (or a godaddypy.deadline.Deadline) after which iteration stops early
+        :param params: Dict of query params to send with each domains request
+        """
+
+        def fetch(marker):
+            return self.get_domains(limit=page_size, marker=marker, **params)
+
+        fetch = self._fetch_within(fetch, Deadline.coerce(deadline))
+        if prefetch:
+            fetch = self._bind_context(fetch)
+        return self._paginate(fetch, None, lambda marker, page: page[-1], page_size, prefetch)
+
+    def iter_records(
+        self, domain, record_type=None, name=None, page_size=500, prefetch=False, as_records=False, deadline=None
+    ):
+        """Lazily yields every record of a domain, following the `offset` cursor page by page.
+
+        :param domain: the domain to get DNS information from
+        :param record_type: the type of record(s) to retrieve
+        :param name: the name of the record(s) to retrieve
+        :param page_size: number of records requested per page (max: 500)
+        :param prefetch: fetch the next page in a background thread while the current page is being consumed
+        :param as_records: yield godaddypy.Record objects instead of dicts
+        :param deadline: seconds (or a godaddypy.deadline.Deadline) after which iteration stops early
+        """
+
+        def fetch(offset):
+            return self.get_records(domain, record_type=record_type, name=name, offset=offset, limit=page_size)
+
+        fetch = self._fetch_within(fetch, Deadline.coerce(deadline))
+        if prefetch:
+            fetch = self._bind_context(fetch)
+        records = self._paginate(fetch, 1, lambda offset, page: offset + 1, page_size, prefetch)
+        return map(Record.from_json, records) if as_records else records
+
+    def _fetch_within(self, fetch, deadline):
+        """Wraps a page fetch so it runs under deadline, returning an empty (last) page once it is exceeded."""
+        if deadline is None:
+            return fetch
+
+        def fetch_within(cursor):
+            with self._deadline_scope(deadline):
+                try:
+                    return fetch(cursor)
+                except DeadlineExceeded:
+                    self.logger.warning("Deadline exceeded, stopping pagination at {!r}".format(cursor))
+                    return []
+
+        return fetch_within
+
+    @staticmethod
+    def _paginate(fetch, cursor, advance, page_size, prefetch):
+        """Generator shared by the `iter_*` methods. Only the current page (plus at most one prefetched page) is
+        held in memory.
+
+        :param fetch: callable returning the page for a cursor
+        :param cursor: the cursor of the first page
+        :param advance: callable returning the cursor following (cursor, page)
+        :param page_size: pages shorter than this are the last page
+        :param prefetch: fetch the next page on a background thread while yielding the current one
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            page = fetch(cursor)
+            while page:
+                next_cursor = advance(cursor, page) if len(page) >= page_size else None
+                pending = None
+                if next_cursor is not None and executor is not None:
+                    pending = executor.submit(fetch, next_cursor)
+
+                for item in page:
+                    yield item
+
+                if next_cursor is None:
+                    return
+                page = pending.result() if pending is not None else fetch(next_cursor)
+                cursor = next_cursor
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
     def update_domain(self, domain, **kwargs):
         """
          Update an existing domain via PATCH /v1/domains/{domain}
@@ -189,10 +708,13 @@ class Client(object):
         for k, v in kwargs.items():
             update[k] = v
         url = self.API_TEMPLATE + self.DOMAIN_INFO.format(domain=domain)
-        self._patch(url, json=update)
+        try:
+            self._patch(url, json=update)
+        finally:
+            self._invalidate(domain)
         self.logger.info("Updated domain {} with {}".format(domain, update))
 
-    def get_records(self, domain, record_type=None, name=None, offset=1, limit=500):
+    def get_records(self, domain, record_type=None, name=None, offset=1, limit=500, as_records=False):
         """Returns records from a single domain.  You can specify type/name as filters for the records returned.  If
         you specify a name you MUST also specify a type.
 
@@ -201,76 +723,243 @@ class Client(object):
         :param name: the name of the record(s) to retrieve
         :param offset: result page offset (starting at 1)
         :param limit: maximum number of elements to return (max: 500)
+        :param as_records: return godaddypy.Record objects instead of dicts
         """
 
         url = self._build_record_url(domain, record_type=record_type, name=name)
-        data = self._get_json_from_response(url, params=dict(limit=limit, offset=offset))
+        key = (_cache.RECORDS, domain, record_type, name, offset, limit)
+        data = self._cached_read(
+            key, lambda: self._get_json_from_response(url, params=dict(limit=limit, offset=offset))
+        )
         self.logger.debug("Retrieved {} record(s) from {}.".format(len(data), domain))
 
+        if as_records:
+            return [Record.from_json(item) for item in data]
         return data
 
+    def get_zone(self, domain, max_age=None):
+        """Returns every record of a domain.  With a snapshot store configured, a fresh snapshot is returned
+        without calling the API; otherwise the zone is fetched and the snapshot refreshed.
+
+        :param domain: the domain to get DNS information from
+        :param max_age: maximum snapshot age in seconds (defaults to the store's max_age)
+        """
+        if self.snapshots is not None:
+            snapshot = self.snapshots.get(domain)
+            if self.snapshots.is_fresh(snapshot, max_age):
+                return snapshot.records
+
+        records = list(self.iter_records(domain))
+        if self.snapshots is not None:
+            self.snapshots.put(domain, records)
+        return records
+
+    def refresh_snapshots(self, domains=None, max_age=None):
+        """Re-fetches the zones whose snapshot is missing or stale.  If no domains are provided, all domains
+        returned from self.iter_domains() are considered.
+
+        :param domains: the domains to refresh (eg. ['123.com','abc.net'])
+        :param max_age: maximum snapshot age in seconds (defaults to the store's max_age)
+
+        :return: the domains whose records changed since their previous snapshot
+        """
+        if self.snapshots is None:
+            raise ValueError("refresh_snapshots requires a Client created with a SnapshotStore")
+
+        domains = self.iter_domains() if domains is None else self._normalize_domains(domains)
+        changed = []
+        for domain in self.snapshots.stale_domains(domains, max_age):
+            if self.snapshots.put(domain, list(self.iter_records(domain))):
+                changed.append(domain)
+        self.logger.info("Refreshed snapshots, {} zone(s) changed".format(len(changed)))
+
+        return changed
+
     def replace_records(self, domain, records, record_type=None, name=None):
         """This will replace all records at the domain.  Record type and record name can be provided to filter
         which records to replace.
 
         :param domain: the domain to replace records at
-        :param records: the records you will be saving
+        :param records: the records you will be saving, as dicts or godaddypy.Record objects
         :param record_type: the type of records you want to replace (eg. only replace 'A' records)
         :param name: the name of records you want to replace (eg. only replace records with name 'test')
 
         :return: True if no exceptions occurred
         """
 
+        records = to_json_records(records)
         url = self._build_record_url(domain, name=name, record_type=record_type)
-        self._put(url, json=records)
+        try:
+            self._put(url, json=records)
+        finally:
+            self._invalidate(domain)
 
         # If we didn't get any exceptions, return True to let the user know
         return True
 
-    def update_ip(self, ip, record_type="A", domains=None, subdomains=None):
+    def update_ip(
+        self,
+        ip,
+        record_type="A",
+        domains=None,
+        subdomains=None,
+        max_workers=None,
+        executor=None,
+        zones=None,
+        deadline=None,
+    ):
         """Update the IP address in all records, specified by type, to the value of ip.  Returns True if no
         exceptions occurred during the update.  If no domains are provided, all domains returned from
         self.get_domains() will be updated.  By default, only A records are updated.
 
+        When `max_workers`, `executor` or `deadline` is given, a `godaddypy.report.UpdateReport` is returned
+        instead of True.  Failing domains do not raise; they are reported with status 'failed' and the raised
+        `BadResponse`.  Domains that could not be finished before the deadline are reported as 'cancelled'.
+
         :param record_type: The type of records to update (eg. 'A')
         :param ip: The new IP address (eg. '123.1.2.255')
         :param domains: A list of the domains you want to update (eg. ['123.com','abc.net'])
         :param subdomains: A list of the subdomains you want to update (eg. ['www','dev'])
+        :param max_workers: number of threads used to update domains concurrently
+        :param executor: a `concurrent.futures.Executor` to update domains on (takes precedence over max_workers)
+        :param zones: already fetched godaddypy.zone.ZoneView(s) to update from instead of reading the records
+            again.  If no domains are provided, the domains of the zones are updated.  Writes from a view are scoped
+            to the (type, name) of the changed records, so a view older than the zone cannot delete records added
+            since it was built, but a stale view still overwrites later changes to the names it updates.
+        :param deadline: time budget in seconds (or a godaddypy.deadline.Deadline) for the whole update.  Requests
+            and retry back-offs are cut short so the call returns once the budget is spent.
 
         :type record_type: str or unicode
         :type ip: str or unicode
         :type domains: str, list of str
         :type subdomains: str, list of str
+        :type zones: godaddypy.zone.ZoneView, list of godaddypy.zone.ZoneView
+        :type deadline: float or godaddypy.deadline.Deadline
 
-        :return: True if no exceptions occurred
+        :return: True if no exceptions occurred, or an UpdateReport in concurrent or deadline mode
         """
 
+        if isinstance(zones, ZoneView):
+            zones = [zones]
+        zones = {zone.domain: zone for zone in zones or ()}
+        deadline = Deadline.coerce(deadline)
+
         if domains is None:
-            domains = self.get_domains()
-        elif isinstance(domains, str):
-            domains = [domains]
+            with self._deadline_scope(deadline):
+                domains = list(zones) if zones else self.get_domains()
         else:
-            # we have a tuple, set, or something else, try to convert it to a list
-            domains = list(domains)
-
-        for domain in domains:
-            a_records = self.get_records(domain, record_type=record_type)
-            for record in a_records:
-                r_name = str(record["name"])
-                r_ip = str(record["data"])
-
-                if not r_ip == ip:
-                    # noinspection PyUnresolvedReferences
-                    if (
-                        subdomains is None
-                        or (isinstance(subdomains, str) and r_name == subdomains)
-                        or r_name in subdomains
-                    ):
-                        record.update(data=str(ip))
-                        self.update_record(domain, record)
+            domains = self._normalize_domains(domains)
 
-        # If we didn't get any exceptions, return True to let the user know
-        return True
+        if max_workers is None and executor is None and deadline is None:
+            for domain in domains:
+                self._update_domain_ip(domain, ip, record_type, subdomains, zones.get(domain))
+
+            # If we didn't get any exceptions, return True to let the user know
+            return True
+
+        def update(domain):
+            return self._update_domain_result(domain, ip, record_type, subdomains, zones.get(domain), deadline)
+
+        update = self._bind_context(update)
+
+        report = UpdateReport()
+        if max_workers is None and executor is None:
+            results = [update(domain) for domain in domains]
+        elif executor is not None:
+            results = self._map_within(executor, update, domains, deadline)
+        else:
+            pool = ThreadPoolExecutor(max_workers=max_workers)
+            try:
+                results = self._map_within(pool, update, domains, deadline)
+            finally:
+                # don't wait for workers still blocked on a request past the deadline
+                pool.shutdown(wait=deadline is None)
+        for result in results:
+            report.add(result)
+
+        return report
+
+    def _update_domain_result(self, domain, ip, record_type, subdomains, zone, deadline):
+        """Runs _update_domain_ip for one domain within deadline and returns its DomainResult."""
+        try:
+            with self._deadline_scope(deadline):
+                if deadline is not None:
+                    deadline.check()
+                updated = self._update_domain_ip(domain, ip, record_type, subdomains, zone)
+        except DeadlineExceeded as e:
+            self.logger.warning("Cancelled update of {}: {}".format(domain, e))
+            return DomainResult(domain, CANCELLED, error=e)
+        except (BadResponse, requests.RequestException) as e:
+            self.logger.error("Failed to update {}: {}".format(domain, e))
+            return DomainResult(domain, FAILED, error=e)
+        return DomainResult(domain, UPDATED if updated else UNCHANGED, records=updated)
+
+    @staticmethod
+    def _map_within(executor, update, domains, deadline):
+        """Maps update over domains on executor, giving up on the domains still pending when deadline expires."""
+        if deadline is None:
+            return list(executor.map(update, domains))
+
+        futures = [executor.submit(update, domain) for domain in domains]
+        wait(futures, timeout=deadline.remaining())
+        results = []
+        for domain, future in zip(domains, futures):
+            if future.done() and not future.cancelled():
+                results.append(future.result())
+            else:
+                future.cancel()
+                error = DeadlineExceeded("Deadline of {}s exceeded".format(deadline.seconds))
+                results.append(DomainResult(domain, CANCELLED, error=error))
+        return results
+
+    def _update_domain_ip(self, domain, ip, record_type, subdomains, zone=None):
+        """Updates the matching records of a single domain and returns the records that were changed.  Changes are
+        written with one replace_records call per record type rather than one update_record call per record."""
+        if zone is not None:
+            return self._update_zone_ip(zone, ip, record_type, subdomains)
+
+        records = list(self.iter_records(domain, record_type=record_type))
+        changed = self._apply_ip(records, ip, subdomains)
+        for r_type, name, batch in self._group_record_writes(records, changed):
+            self.replace_records(domain, batch, record_type=r_type, name=name)
+
+        return changed
+
+    def _update_zone_ip(self, zone, ip, record_type, subdomains):
+        """_update_domain_ip for records read from a ZoneView.  The changes are applied to copies, and only copied
+        back into the view once their (type, name) scoped write succeeded."""
+        fetched = zone.filter(types=record_type)
+        records = [dict(record) for record in fetched]
+        in_view = {id(record): original for record, original in zip(records, fetched)}
+
+        changed = self._apply_ip(records, ip, subdomains)
+        for r_type, name, batch in self._group_record_writes(records, changed, per_name=True):
+            self.replace_records(zone.domain, batch, record_type=r_type, name=name)
+            for record in batch:
+                in_view[id(record)].update(record)
+
+        return changed
+
+    def reconcile(self, domain, records, dry_run=False, prune=True, ignore_types=DEFAULT_IGNORE_TYPES):
+        """Bring the records of a domain to a desired state with the fewest writes.  The zone is read once and
+        diffed against `records` by (type, name); unchanged zones cost a single GET and no writes.
+
+        :param domain: the domain to reconcile (eg. 'example.com')
+        :param records: the desired records of the domain
+        :param dry_run: only compute the plan, don't apply it
+        :param prune: delete (type, name) sets that are not part of the desired records
+        :param ignore_types: record types which are never pruned (eg. the GoDaddy managed 'SOA' and 'NS')
+
+        :return: the godaddypy.reconcile.ReconcilePlan that was (or would be) applied
+        """
+        current = list(self.iter_records(domain))
+        plan = plan_zone_changes(domain, current, records, prune=prune, ignore_types=ignore_types)
+        self.logger.info("Reconcile plan for {}: {} change(s)".format(domain, len(plan.changes)))
+
+        if not dry_run:
+            plan.apply(self)
+
+        return plan
 
     def delete_records(self, domain, name, record_type="A"):
         """Deletes records by name and type
@@ -282,7 +971,10 @@ class Client(object):
         :return: True if no exceptions occurred
         """
         url = self._build_record_url(domain=domain, record_type=record_type, name=name)
-        self._delete(url=url)
+        try:
+            self._delete(url=url)
+        finally:
+            self._invalidate(domain)
 
         # If we didn't get any exceptions, return True to let the user know
         return True
@@ -294,37 +986,54 @@ class Client(object):
         :param record_type: only required if the record is None (deletion)
         :param domain: the domain where the DNS belongs to (eg. 'example.com')
         :param record: dict with record info (ex. {'name': 'dynamic', 'ttl': 3600, 'data': '1.1.1.1', 'type': 'A'})
+            or a godaddypy.Record
 
         :return: True if no exceptions occurred
         """
+        if isinstance(record, Record):
+            record = record.to_json()
         if record_type is None:
             record_type = record["type"]
         if name is None:
             name = record["name"]
 
         url = self.API_TEMPLATE + self.RECORDS_TYPE_NAME.format(domain=domain, type=record_type, name=name)
-        self._put(url, json=[record])
+        try:
+            self._put(url, json=[record])
+        finally:
+            self._invalidate(domain)
         self.logger.info("Updated record. Domain {} name {} type {}".format(domain, name, record_type))
 
         # If we didn't get any exceptions, return True to let the user know
         return True
 
-    def update_record_ip(self, ip, domain, name, record_type):
-        """Update the IP address(es) for (a) domain(s) specified by type and name.
+    def update_record_ip(self, ip, domain, name, record_type, zone=None, deadline=None):
+        """Update the IP address(es) for (a) domain(s) specified by type and name.  All records sharing the type
+        and name are written back with a single replace_records call.
 
         :param ip: the new IP for the DNS record (ex. '123.1.2.255')
         :param domain: the domain where the DNS belongs to (ex. 'example.com')
         :param name: the DNS record name to be updated (ex. 'dynamic')
         :param record_type: Record type (ex. 'CNAME', 'A'...)
+        :param zone: an already fetched godaddypy.zone.ZoneView of the domain to read the records from
+        :param deadline: time budget in seconds (or a godaddypy.deadline.Deadline) for the read and the write
+
+        :raises godaddypy.deadline.DeadlineExceeded: if the deadline expires first
 
         :return: True if no exceptions occurred
         """
 
-        records = self.get_records(domain, name=name, record_type=record_type)
-        data = {"data": str(ip)}
-        for rec in records:
-            rec.update(data)
-            self.update_record(domain, rec)
+        with self._deadline_scope(Deadline.coerce(deadline)):
+            if zone is not None:
+                # the view is only updated once the write succeeded
+                records = [dict(record) for record in zone.get(record_type, name)]
+            else:
+                records = self.get_records(domain, name=name, record_type=record_type)
+            if self._apply_ip(records, ip):
+                self.replace_records(domain, records, record_type=record_type, name=name)
+                if zone is not None:
+                    for record, written in zip(zone.get(record_type, name), records):
+                        record.update(written)
 
         # If we didn't get any exceptions, return True to let the user know
         return True
@@ -0,0 +1,201 @@
+import hashlib
+import ipaddress
+import json
+import logging
+import os
+import threading
+from os import environ, path
+from pathlib import Path
+
+import requests
+
+__all__ = ["DynamicDNS", "DDNSState", "get_public_ip", "IP_SERVICES"]
+
+# Services returning the caller's public address as plain text, by IP version
+IP_SERVICES = {
+    4: ("https://api.ipify.org", "https://ipv4.icanhazip.com", "https://v4.ident.me"),
+    6: ("https://api6.ipify.org", "https://ipv6.icanhazip.com", "https://v6.ident.me"),
+}
+
+RECORD_VERSIONS = {"A": 4, "AAAA": 6}
+
+DEFAULT_STATE_PATH = Path(path.expanduser(environ.get("XDG_STATE_HOME", "~/.local/state")), "godaddypy/ddns.json")
+
+logger = logging.getLogger("GoDaddyPy.DynamicDNS")
+
+
+def get_public_ip(version=4, services=None, session=None, timeout=5):
+    """Returns the public IP address of this host, asking each service in turn until one answers.
+
+    :param version: 4 or 6
+    :param services: URLs answering with the caller's address as plain text (default: IP_SERVICES[version])
+    :type session: requests.Session
+
+    :return: the address, or None if no service returned a valid address of that version
+    """
+    http = session or requests
+    for url in services or IP_SERVICES[version]:
+        try:
+            resp = http.get(url, timeout=timeout)
+            resp.raise_for_status()
+            address = ipaddress.ip_address(resp.text.strip())
+        except (requests.RequestException, ValueError) as e:
+            logger.debug("Unable to get the public IPv{} address from {}: {}".format(version, url, e))
+            continue
+        if address.version == version:
+            return str(address)
+    return None
+
+
+class DDNSState(object):
+    """The addresses last pushed to the DNS, persisted as a small JSON file.
+
+    The state is tied to the set of targets (domains, subdomains) it was written for, so changing the targets
+    forces the next check to push the current address again.
+    """
+
+    def __init__(self, file_path=DEFAULT_STATE_PATH):
+        self.path = Path(file_path) if file_path is not None else None
+        self.targets = None
+        self.addresses = {}
+        self._load()
+
+    def _load(self):
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, mode="r") as state_file:
+                data = json.load(state_file)
+            self.targets = data.get("targets")
+            self.addresses = dict(data.get("addresses") or {})
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable state file {}: {}".format(self.path, e))
+
+    def get(self, targets, record_type):
+        if targets != self.targets:
+            return None
+        return self.addresses.get(record_type)
+
+    def set(self, targets, record_type, address):
+        if targets != self.targets:
+            self.targets = targets
+            self.addresses = {}
+        self.addresses[record_type] = address
+        self._save()
+
+    def _save(self):
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, mode="w") as state_file:
+            json.dump({"targets": self.targets, "addresses": self.addresses}, state_file)
+        # atomic, so a crash never leaves a truncated state behind
+        os.replace(tmp_path, self.path)
+
+
+class DynamicDNS(object):
+    """Keeps the A/AAAA records of a set of domains pointed at this host's public address.
+
+    Each check detects the public address and compares it with the address last pushed, kept in a local
+    `DDNSState`, so nothing is sent to the API while the address is unchanged.  When it changes, every targeted
+    domain is updated concurrently with `Client.update_ip`, which writes one batch per domain and record type.
+    """
+
+    def __init__(
+        self,
+        client,
+        domains=None,
+        subdomains=None,
+        record_types=("A",),
+        interval=300,
+        state=None,
+        detect=get_public_ip,
+        max_workers=4,
+    ):
+        """Create a new `godaddypy.ddns.DynamicDNS`
+
+        :type client: godaddypy.Client
+        :param domains: the domains to update (default: every domain of the account)
+        :param subdomains: the record names to update (default: every record of the type)
+        :param record_types: 'A' and/or 'AAAA'
+        :param interval: seconds between checks in `run()`
+        :type state: godaddypy.ddns.DDNSState
+        :param state: where the last pushed addresses are kept (default: the user's XDG state directory)
+        :param detect: callable(version) returning the public address of that IP version, or None
+        :param max_workers: domains updated concurrently
+        """
+        unknown = set(record_types) - set(RECORD_VERSIONS)
+        if unknown:
+            raise ValueError("Unsupported record types for dynamic DNS: {}".format(", ".join(sorted(unknown))))
+
+        self.client = client
+        self.domains = sorted(client._normalize_domains(domains)) if domains is not None else None
+        self.subdomains = sorted(client._normalize_domains(subdomains)) if subdomains is not None else None
+        self.record_types = tuple(record_types)
+        self.interval = interval
+        self.state = state if state is not None else DDNSState()
+        self.detect = detect
+        self.max_workers = max_workers
+        self._stop = threading.Event()
+
+    @property
+    def targets(self):
+        """A digest of the targeted domains and subdomains, stored with the state."""
+        key = json.dumps([self.domains, self.subdomains])
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def check(self):
+        """Pushes the current public address of each record type if it changed since the last push.
+
+        :return: dict of record type to the godaddypy.report.UpdateReport of the types that were pushed
+        """
+        reports = {}
+        targets = self.targets
+        for record_type in self.record_types:
+            address = self.detect(RECORD_VERSIONS[record_type])
+            if address is None:
+                logger.warning(
+                    "No public IPv{} address found, skipping {} records".format(
+                        RECORD_VERSIONS[record_type], record_type
+                    )
+                )
+                continue
+            if address == self.state.get(targets, record_type):
+                logger.debug("{} address unchanged ({})".format(record_type, address))
+                continue
+
+            logger.info("{} address changed to {}, updating records".format(record_type, address))
+            report = self.client.update_ip(
+                address,
+                record_type=record_type,
+                domains=self.domains,
+                subdomains=self.subdomains,
+                max_workers=self.max_workers,
+            )
+            reports[record_type] = report
+            if report.ok:
+                self.state.set(targets, record_type, address)
+            else:
+                # keep the old state, so the failed domains are retried on the next check
+                logger.error("Failed to update {}".format(", ".join(r.domain for r in report.failed)))
+        return reports
+
+    def run(self, iterations=None):
+        """Checks every `interval` seconds until `stop()` is called (or `iterations` checks were made).
+
+        Errors of a single check are logged and retried on the next one.
+        """
+        count = 0
+        while not self._stop.is_set():
+            try:
+                self.check()
+            except Exception as e:
+                logger.exception("Dynamic DNS check failed: {}".format(e))
+            count += 1
+            if iterations is not None and count >= iterations:
+                break
+            self._stop.wait(self.interval)
+
+    def stop(self):
+        self._stop.set()
@@ -0,0 +1,56 @@
+import time
+
+import requests
+
+__all__ = ["Deadline", "DeadlineExceeded"]
+
+
+class DeadlineExceeded(requests.Timeout):
+    """Raised when the time budget of an operation ran out before a request could be sent."""
+
+
+class Deadline(object):
+    """A time budget shared by every request of a multi-call operation."""
+
+    def __init__(self, seconds, clock=time.monotonic):
+        """Create a new `godaddypy.deadline.Deadline`
+
+        :param seconds: the budget, starting now
+        """
+        self.seconds = seconds
+        self._clock = clock
+        self._expires = clock() + seconds
+
+    @classmethod
+    def coerce(cls, value):
+        """Returns value as a Deadline: None stays None, numbers are budgets in seconds."""
+        if value is None or isinstance(value, Deadline):
+            return value
+        return cls(value)
+
+    def __repr__(self):
+        return "Deadline({:.3f}s remaining)".format(self.remaining())
+
+    def remaining(self):
+        return max(0.0, self._expires - self._clock())
+
+    @property
+    def expired(self):
+        return self._clock() >= self._expires
+
+    def check(self):
+        if self.expired:
+            raise DeadlineExceeded("Deadline of {}s exceeded".format(self.seconds))
+
+    def cap(self, timeout):
+        """Returns a requests timeout (seconds or a (connect, read) tuple) bounded by the remaining budget.
+
+        :raises DeadlineExceeded: if the budget is already exhausted
+        """
+        self.check()
+        remaining = self.remaining()
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+        return min(timeout, remaining)
@@ -0,0 +1,149 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import requests
+
+from .client import BadResponse, Client
+
+__all__ = ["AccountResult", "FanoutReport", "MultiAccountExecutor"]
+
+
+@dataclass
+class AccountResult:
+    """The outcome of a multi-account operation for a single account."""
+
+    account: str
+    value: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+class FanoutReport(dict):
+    """Per-account results of a multi-account operation, keyed by account label."""
+
+    def add(self, result):
+        self[result.account] = result
+
+    @property
+    def values_by_account(self):
+        """Returns a dict of account label to the value returned for it, for the accounts that succeeded."""
+        return {label: result.value for label, result in self.items() if result.ok}
+
+    @property
+    def failed(self):
+        return [result for result in self.values() if not result.ok]
+
+    @property
+    def ok(self):
+        return not self.failed
+
+
+class MultiAccountExecutor(object):
+    """Runs the same operation across many accounts (or delegated shoppers) in parallel.
+
+    Each account gets its own `godaddypy.Client`, created on first use and kept for the executor's lifetime, so
+    its pooled connections are reused by every task.  With `rate_limit`, the clients of accounts sharing an API
+    key share one request budget (see `godaddypy.ratelimit.RateLimiter.for_account`), while different keys are
+    limited independently.  `max_concurrency` bounds the requests in flight per account.
+
+    >>> accounts = {shopper: Account(key, secret, delegate=shopper) for shopper in shoppers}
+    >>> with MultiAccountExecutor(accounts, rate_limit=60) as executor:
+    ...     report = executor.map(lambda client: client.get_domains())
+    """
+
+    def __init__(
+        self, accounts, max_workers=16, max_concurrency=4, rate_limit=None, rate_burst=1, priority=None, **client_kwargs
+    ):
+        """Create a new `godaddypy.fanout.MultiAccountExecutor`
+
+        :param accounts: a dict of label to godaddypy.Account, or a list of accounts (labelled by their delegate,
+            or by position for accounts without one)
+        :param max_workers: tasks run concurrently across all accounts
+        :param max_concurrency: requests in flight at once per account
+        :param rate_limit: requests per minute allowed per API key (default: no client-side limit)
+        :param rate_burst: requests per API key that may be sent back to back
+        :param priority: the `godaddypy.scheduler` priority class tasks run with (default: interactive).  Setting
+            it gives every client a scheduler of its own, as `scheduler=True` in client_kwargs does.
+        :param client_kwargs: further keyword arguments for every Client (eg. retry, timeout, cache)
+        """
+        if not isinstance(accounts, dict):
+            accounts = {account._delegate or str(i): account for i, account in enumerate(accounts)}
+        if client_kwargs.get("scheduler") not in (None, False, True):
+            raise ValueError(
+                "A scheduler instance cannot be shared by the clients of different accounts; pass scheduler=True "
+                "to give each client its own"
+            )
+        if priority is not None:
+            client_kwargs.setdefault("scheduler", True)
+
+        self.logger = logging.getLogger("GoDaddyPy.MultiAccountExecutor")
+        self.accounts = dict(accounts)
+        self.priority = priority
+        self._client_kwargs = dict(
+            client_kwargs, max_concurrency=max_concurrency, rate_limit=rate_limit, rate_burst=rate_burst
+        )
+        self._clients = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="godaddypy-fanout")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def client(self, label):
+        """Returns the pooled client of an account, creating it on first use."""
+        with self._lock:
+            client = self._clients.get(label)
+            if client is None:
+                client = self._clients[label] = Client(self.accounts[label], **self._client_kwargs)
+            return client
+
+    def submit(self, label, func, *args, **kwargs):
+        """Schedules func(client, *args, **kwargs) with the client of one account.
+
+        :return: a concurrent.futures.Future of func's return value
+        """
+        return self._pool.submit(self._run, label, func, *args, **kwargs)
+
+    def _run(self, label, func, *args, **kwargs):
+        client = self.client(label)
+        if self.priority is None:
+            return func(client, *args, **kwargs)
+        with client.priority(self.priority, flow=label):
+            return func(client, *args, **kwargs)
+
+    def map(self, func, labels=None, *args, **kwargs):
+        """Runs func(client, *args, **kwargs) for every account in parallel.  Failures of single accounts do not
+        stop the others; API errors are reported, any other exception is raised.
+
+        :param labels: the accounts to run on (default: all)
+
+        :return: a godaddypy.fanout.FanoutReport
+        """
+        labels = list(self.accounts) if labels is None else list(labels)
+        futures = [(label, self.submit(label, func, *args, **kwargs)) for label in labels]
+
+        report = FanoutReport()
+        for label, future in futures:
+            try:
+                report.add(AccountResult(label, value=future.result()))
+            except (BadResponse, requests.RequestException) as e:
+                self.logger.error("Failed on account {}: {}".format(label, e))
+                report.add(AccountResult(label, error=e))
+        return report
+
+    def close(self):
+        """Waits for the scheduled tasks and closes every client."""
+        self._pool.shutdown(wait=True)
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        for client in clients.values():
+            client.close()
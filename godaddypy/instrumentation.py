@@ -0,0 +1,45 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+__all__ = ["RequestEvent", "match_endpoint"]
+
+
+@dataclass
+class RequestEvent:
+    """Describes one attempt of an API request.
+
+    Request hooks receive the event before it is sent; response hooks receive the same event once `status` (or
+    `error`), `latency` and `response_bytes` are known.
+    """
+
+    method: str
+    endpoint: str
+    url: str
+    attempt: int = 1
+    status: Optional[int] = None
+    latency: Optional[float] = None
+    response_bytes: int = 0
+    error: Optional[Exception] = None
+
+    @property
+    def retries(self):
+        return self.attempt - 1
+
+    @property
+    def ok(self):
+        return self.error is None and self.status is not None and self.status < 400
+
+
+@lru_cache(maxsize=64)
+def _template_regex(template):
+    return re.compile("^" + re.sub(r"\\{[^}]+\\}", "[^/]+", re.escape(template)) + "$")
+
+
+def match_endpoint(path, templates):
+    """Returns the first URL template (eg. '/domains/{domain}/records/{type}') matching path, or path itself."""
+    for template in templates:
+        if _template_regex(template).match(path):
+            return template
+    return path
@@ -0,0 +1,164 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from .client import BadResponse
+from .report import FAILED, UNCHANGED, UPDATED, DomainResult, UpdateReport
+
+__all__ = ["Journal", "DomainUpdateJob", "DONE"]
+
+DONE = "done"
+
+logger = logging.getLogger("GoDaddyPy.DomainUpdateJob")
+
+
+class Journal(object):
+    """An append-only journal of per-domain job outcomes, one JSON object per line.
+
+    Entries are flushed as soon as they are written, so a crash loses at most the entry being written; a truncated
+    last line is ignored when the journal is read back.
+    """
+
+    def __init__(self, path, fsync=False):
+        """Create a new `godaddypy.jobs.Journal`
+
+        :param path: the journal file, created if missing
+        :param fsync: also fsync every entry, which survives power loss at the cost of a disk sync per domain
+        """
+        self.path = path
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def entries(self):
+        """Yields every complete entry of the journal, oldest first."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, mode="r") as journal_file:
+            for line in journal_file:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    logger.warning("Ignoring a truncated entry in {}".format(self.path))
+
+    def completed(self, job_id):
+        """Returns the set of domains the job has completed."""
+        return {entry["domain"] for entry in self.entries() if entry.get("job") == job_id and entry["status"] == DONE}
+
+    def append(self, job_id, domain, status, error=None):
+        entry = {"job": job_id, "domain": domain, "status": status, "time": time.time()}
+        if error is not None:
+            entry["error"] = str(error)
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = self._open()
+            self._file.write(line)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+    def _open(self):
+        journal_file = open(self.path, mode="a+b")
+        journal_file.seek(0, os.SEEK_END)
+        if journal_file.tell():
+            journal_file.seek(-1, os.SEEK_END)
+            # terminate an entry truncated by a crash, so it doesn't swallow the next one
+            if journal_file.read(1) != b"\n":
+                journal_file.write(b"\n")
+        journal_file.close()
+        return open(self.path, mode="a")
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class DomainUpdateJob(object):
+    """Applies the same `Client.update_domain` settings to many domains, resumably.
+
+    Domains are updated on a bounded thread pool and every outcome is appended to a `Journal`.  Running the job
+    again with the same journal and settings skips the domains already done, so an interrupted migration resumes
+    where it stopped.  The job is identified by a digest of its settings; changing them starts a new job.
+
+    >>> job = DomainUpdateJob(client, domains, "migration.journal", nameServers=["ns1.example.net"])
+    >>> report = job.run()
+    """
+
+    def __init__(self, client, domains, journal, max_workers=8, **settings):
+        """Create a new `godaddypy.jobs.DomainUpdateJob`
+
+        :type client: godaddypy.Client
+        :param domains: the domains to update
+        :type journal: godaddypy.jobs.Journal or str
+        :param journal: the journal, or the path of its file
+        :param max_workers: domains updated concurrently
+        :param settings: the update_domain keyword arguments (eg. nameServers, locked, renewAuto)
+        """
+        if not settings:
+            raise ValueError("DomainUpdateJob requires at least one setting to update")
+
+        self.client = client
+        self.domains = client._normalize_domains(domains)
+        self.journal = journal if isinstance(journal, Journal) else Journal(journal)
+        self.max_workers = max_workers
+        self.settings = settings
+
+    @property
+    def job_id(self):
+        digest = hashlib.sha256(json.dumps(self.settings, sort_keys=True).encode("utf-8")).hexdigest()
+        return digest[:16]
+
+    def pending(self):
+        """Returns the domains the journal has not recorded as done, in order."""
+        completed = self.journal.completed(self.job_id)
+        return [domain for domain in self.domains if domain not in completed]
+
+    def run(self):
+        """Updates every pending domain.  Failures do not stop the job; they are journaled, reported and retried
+        by the next run.
+
+        :return: a godaddypy.report.UpdateReport: 'updated' for domains updated by this run, 'unchanged' for
+            domains a previous run already did and 'failed' for the others
+        """
+        job_id = self.job_id
+        pending = self.pending()
+        report = UpdateReport()
+        for domain in self.domains:
+            report.add(DomainResult(domain, UNCHANGED))
+
+        logger.info("Job {}: {} of {} domain(s) pending".format(job_id, len(pending), len(self.domains)))
+
+        def update(domain):
+            try:
+                self.client.update_domain(domain, **self.settings)
+            except (BadResponse, requests.RequestException) as e:
+                logger.error("Failed to update {}: {}".format(domain, e))
+                self.journal.append(job_id, domain, FAILED, e)
+                return DomainResult(domain, FAILED, error=e)
+            self.journal.append(job_id, domain, DONE)
+            return DomainResult(domain, UPDATED)
+
+        # workers send their requests with the caller's priority (eg. within `client.priority(BULK)`)
+        update = self.client._bind_context(update)
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for result in pool.map(update, pending):
+                    report.add(result)
+        finally:
+            self.journal.close()
+        return report
@@ -0,0 +1,97 @@
+import hashlib
+import logging
+import threading
+import time
+
+__all__ = ["RateLimiter", "DEFAULT_REQUESTS_PER_MINUTE"]
+
+# GoDaddy allows 60 requests per minute per API key and endpoint
+DEFAULT_REQUESTS_PER_MINUTE = 60
+
+logger = logging.getLogger("GoDaddyPy.RateLimiter")
+
+
+class RateLimiter(object):
+    """A thread-safe token bucket.
+
+    Tokens refill continuously at `requests_per_minute / 60` per second up to `burst`.  Callers reserve a token and
+    sleep until it becomes available, so waiting callers are served in the order they arrived and the request rate
+    never exceeds the configured quota.
+    """
+
+    _registry = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self, requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE, burst=1, clock=time.monotonic, sleep=time.sleep
+    ):
+        """Create a new `godaddypy.ratelimit.RateLimiter`
+
+        :param requests_per_minute: the sustained request rate
+        :param burst: how many requests may be sent back to back after an idle period
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.requests_per_minute = requests_per_minute
+        self.burst = burst
+        self._rate = requests_per_minute / 60.0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = clock()
+
+    @classmethod
+    def for_account(cls, account, requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE, burst=1):
+        """Returns the limiter shared by every client authenticating with the same API key as `account`.  The
+        limiter is created with the given settings by the first caller; later callers get the existing one, and a
+        warning is logged when they ask for different settings, since the quota is enforced per key.
+
+        :type account: godaddypy.Account
+        """
+        auth = account.get_headers()["Authorization"]
+        key = hashlib.sha256(auth.encode("utf-8")).hexdigest()
+        with cls._registry_lock:
+            limiter = cls._registry.get(key)
+            if limiter is None:
+                limiter = cls._registry[key] = cls(requests_per_minute, burst)
+            elif (limiter.requests_per_minute, limiter.burst) != (requests_per_minute, burst):
+                logger.warning(
+                    "Ignoring rate limit of {}/min (burst {}): this API key is already limited to {}/min "
+                    "(burst {})".format(requests_per_minute, burst, limiter.requests_per_minute, limiter.burst)
+                )
+            return limiter
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def reserve(self, tokens=1):
+        """Takes `tokens` from the bucket, and returns how many seconds the caller must wait before using them."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self._rate)
+
+    def peek(self, tokens=1):
+        """Returns how many seconds until `tokens` are available, without taking them."""
+        with self._lock:
+            self._refill(self._clock())
+            return max(0.0, (tokens - self._tokens) / self._rate)
+
+    def acquire(self, tokens=1):
+        """Blocks until `tokens` requests may be sent.
+
+        :return: the number of seconds spent waiting
+        """
+        wait = self.reserve(tokens)
+        if wait:
+            self.sleep(wait)
+        return wait
+
+    def sleep(self, seconds):
+        """Waits for seconds with the limiter's sleep function, for callers that reserve() tokens themselves."""
+        self._sleep(seconds)
@@ -0,0 +1,131 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .record import to_json_records
+
+__all__ = ["Change", "ReconcilePlan", "plan_zone_changes", "ADD", "REPLACE", "DELETE", "DEFAULT_IGNORE_TYPES"]
+
+ADD = "add"
+REPLACE = "replace"
+DELETE = "delete"
+
+# Record types GoDaddy manages for the zone itself; left alone unless the desired records mention them
+DEFAULT_IGNORE_TYPES = ("SOA", "NS")
+
+
+@dataclass
+class Change:
+    """A single write needed to bring a (type, name) record set to its desired state."""
+
+    action: str
+    record_type: str
+    name: str
+    records: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class ReconcilePlan:
+    """The minimal set of writes that turns the current records of a domain into the desired ones.
+
+    All additions are sent with a single PATCH, every changed (type, name) set with one PUT and every removed
+    (type, name) set with one DELETE.  Deletions go first, so a name can change type (eg. from A to CNAME)
+    without the new records conflicting with the old ones.
+    """
+
+    domain: str
+    changes: List[Change] = field(default_factory=list)
+    applied: bool = False
+
+    def __bool__(self):
+        return bool(self.changes)
+
+    def _with_action(self, action):
+        return [change for change in self.changes if change.action == action]
+
+    @property
+    def additions(self):
+        return self._with_action(ADD)
+
+    @property
+    def replacements(self):
+        return self._with_action(REPLACE)
+
+    @property
+    def deletions(self):
+        return self._with_action(DELETE)
+
+    def apply(self, client):
+        """Executes the plan with the given `godaddypy.Client`.
+
+        :return: True if no exceptions occurred
+        """
+        for change in self.deletions:
+            client.delete_records(self.domain, change.name, record_type=change.record_type)
+
+        for change in self.replacements:
+            client.replace_records(self.domain, change.records, record_type=change.record_type, name=change.name)
+
+        additions = [record for change in self.additions for record in change.records]
+        if additions:
+            client.add_records(self.domain, additions)
+
+        self.applied = True
+        return True
+
+
+def _group(records):
+    groups = {}
+    for record in records:
+        groups.setdefault((record["type"], str(record["name"])), []).append(record)
+    return groups
+
+
+def _matches(desired, current):
+    # Only the fields given in the desired record are compared, so API defaults (eg. ttl) don't cause churn
+    return all(str(current.get(key)) == str(value) for key, value in desired.items())
+
+
+def _same_records(desired, current):
+    if len(desired) != len(current):
+        return False
+
+    unmatched = list(current)
+    for record in desired:
+        for candidate in unmatched:
+            if _matches(record, candidate):
+                unmatched.remove(candidate)
+                break
+        else:
+            return False
+    return True
+
+
+def plan_zone_changes(domain, current, desired, prune=True, ignore_types=DEFAULT_IGNORE_TYPES):
+    """Diffs the current records of a domain against the desired ones, keyed by (type, name).
+
+    :param domain: the domain the records belong to
+    :param current: the records currently in the zone, as returned by `Client.get_records`
+    :param desired: the records the zone should contain, as dicts or godaddypy.Record objects; each needs at least
+        'type' and 'name'
+    :param prune: delete (type, name) sets that exist in the zone but not in the desired records
+    :param ignore_types: record types which are never pruned
+
+    :return: a ReconcilePlan
+    """
+    current_groups = _group(current)
+    desired_groups = _group(to_json_records(desired))
+
+    changes: List[Change] = []
+    for (record_type, name), records in desired_groups.items():
+        existing: Optional[list] = current_groups.get((record_type, name))
+        if existing is None:
+            changes.append(Change(ADD, record_type, name, records))
+        elif not _same_records(records, existing):
+            changes.append(Change(REPLACE, record_type, name, records))
+
+    if prune:
+        for (record_type, name), records in current_groups.items():
+            if (record_type, name) not in desired_groups and record_type not in ignore_types:
+                changes.append(Change(DELETE, record_type, name, records))
+
+    return ReconcilePlan(domain, changes)
@@ -0,0 +1,58 @@
+__all__ = ["Record", "to_json_records"]
+
+
+class Record(object):
+    """A DNS record.
+
+    A compact, slotted alternative to the JSON dicts returned by the API; convert with `Record.from_json` and
+    `Record.to_json`.  Optional fields that are unset are None and left out of the JSON.
+    """
+
+    __slots__ = ("type", "name", "data", "ttl", "priority", "port", "weight", "protocol", "service")
+
+    def __init__(self, type, name, data, ttl=None, priority=None, port=None, weight=None, protocol=None, service=None):
+        self.type = type
+        self.name = name
+        self.data = data
+        self.ttl = ttl
+        self.priority = priority
+        self.port = port
+        self.weight = weight
+        self.protocol = protocol
+        self.service = service
+
+    @classmethod
+    def from_json(cls, data):
+        """Builds a Record from an API record dict.  Unknown keys are ignored."""
+        get = data.get
+        return cls(
+            get("type"),
+            get("name"),
+            get("data"),
+            get("ttl"),
+            get("priority"),
+            get("port"),
+            get("weight"),
+            get("protocol"),
+            get("service"),
+        )
+
+    def to_json(self):
+        """Returns the API record dict of this Record."""
+        return {slot: getattr(self, slot) for slot in self.__slots__ if getattr(self, slot) is not None}
+
+    def __eq__(self, other):
+        if not isinstance(other, Record):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, slot) for slot in self.__slots__))
+
+    def __repr__(self):
+        return "Record({})".format(", ".join("{}={!r}".format(k, v) for k, v in self.to_json().items()))
+
+
+def to_json_records(records):
+    """Converts any Record objects in records to API record dicts, leaving dicts untouched."""
+    return [record.to_json() if isinstance(record, Record) else record for record in records]
@@ -0,0 +1,53 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+__all__ = ["DomainResult", "UpdateReport", "UPDATED", "UNCHANGED", "FAILED", "CANCELLED"]
+
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+@dataclass
+class DomainResult:
+    """The outcome of a multi-domain operation for a single domain."""
+
+    domain: str
+    status: str
+    records: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self):
+        return self.status not in (FAILED, CANCELLED)
+
+
+class UpdateReport(dict):
+    """Per-domain results of a multi-domain operation, keyed by domain name."""
+
+    def add(self, result):
+        self[result.domain] = result
+
+    def _with_status(self, status):
+        return [result for result in self.values() if result.status == status]
+
+    @property
+    def updated(self):
+        return self._with_status(UPDATED)
+
+    @property
+    def unchanged(self):
+        return self._with_status(UNCHANGED)
+
+    @property
+    def failed(self):
+        return self._with_status(FAILED)
+
+    @property
+    def cancelled(self):
+        return self._with_status(CANCELLED)
+
+    @property
+    def ok(self):
+        return not self.failed and not self.cancelled
@@ -0,0 +1,119 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+
+from .deadline import DeadlineExceeded
+
+__all__ = ["RetryPolicy"]
+
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+IDEMPOTENT_METHODS = ("GET", "PUT", "DELETE", "HEAD", "OPTIONS")
+
+
+class RetryPolicy(object):
+    """Decides whether a failed request is retried and how long to wait before the next attempt.
+
+    Waits grow exponentially (`backoff_base * 2 ** (attempt - 1)`, capped at `backoff_cap`) with full jitter, unless
+    the response carries a `Retry-After` header, which is honored as is.
+
+    Non-idempotent methods (eg. the PATCH sent by `add_records`) are only retried when the server rejected the
+    request without processing it (429), since repeating them after a 5xx or a dropped connection could apply the
+    same change twice.
+    """
+
+    def __init__(
+        self,
+        max_attempts=3,
+        backoff_base=0.5,
+        backoff_cap=30.0,
+        jitter=True,
+        retry_statuses=DEFAULT_RETRY_STATUSES,
+        idempotent_methods=IDEMPOTENT_METHODS,
+        respect_retry_after=True,
+        sleep=time.sleep,
+    ):
+        """Create a new `godaddypy.retry.RetryPolicy`
+
+        :param max_attempts: total number of attempts per request, including the first one
+        :param backoff_base: wait in seconds before the first retry
+        :param backoff_cap: maximum computed wait in seconds (a `Retry-After` header may ask for longer)
+        :param jitter: randomize waits between 0 and the computed backoff
+        :param retry_statuses: HTTP statuses considered transient
+        :param idempotent_methods: methods that are safe to repeat after a 5xx, connection error or timeout
+        :param respect_retry_after: wait as long as the `Retry-After` response header asks
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_methods = frozenset(m.upper() for m in idempotent_methods)
+        self.respect_retry_after = respect_retry_after
+        self.sleep = sleep
+
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.exhausted = 0
+
+    def should_retry(self, method, attempt, response=None, error=None):
+        """Whether the request that just failed on `attempt` (starting at 1) should be sent again.
+
+        :param method: the HTTP method of the request
+        :param response: the `requests.Response` received, if any
+        :param error: the exception raised while sending, if any
+        """
+        if response is not None:
+            retryable = response.status_code in self.retry_statuses and (
+                response.status_code == 429 or method.upper() in self.idempotent_methods
+            )
+        elif isinstance(error, DeadlineExceeded):
+            # the caller's time budget is spent; another attempt cannot fit in it
+            retryable = False
+        else:
+            retryable = isinstance(error, (requests.ConnectionError, requests.Timeout)) and (
+                isinstance(error, requests.ConnectTimeout) or method.upper() in self.idempotent_methods
+            )
+
+        if not retryable:
+            return False
+
+        with self._lock:
+            if attempt >= self.max_attempts:
+                self.exhausted += 1
+                return False
+            self.retries += 1
+        return True
+
+    def backoff(self, attempt, response=None):
+        """Seconds to wait before the attempt following `attempt`."""
+        if self.respect_retry_after and response is not None:
+            retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after
+
+        delay = min(self.backoff_cap, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    @staticmethod
+    def _parse_retry_after(value):
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            # "-0000" means UTC with no known local offset, which parsedate_to_datetime returns as naive
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
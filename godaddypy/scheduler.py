@@ -0,0 +1,132 @@
+import itertools
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
+from .deadline import DeadlineExceeded
+
+__all__ = ["RequestScheduler", "INTERACTIVE", "BULK", "PRIORITIES"]
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+# Priority classes, highest first
+PRIORITIES = (INTERACTIVE, BULK)
+
+
+class RequestScheduler(object):
+    """Hands out request slots by priority class, within a shared rate limit and concurrency bound.
+
+    Waiting requests of a higher class are always served first, so interactive calls never queue behind a bulk job;
+    bulk requests get every slot interactive ones leave unused.  Within a class, requests are grouped into flows
+    (by default one per thread) that are served round-robin, so one busy flow cannot starve the others.
+    """
+
+    def __init__(self, rate_limiter=None, max_in_flight=None, clock=time.monotonic):
+        """Create a new `godaddypy.scheduler.RequestScheduler`
+
+        :type rate_limiter: godaddypy.ratelimit.RateLimiter
+        :param rate_limiter: the request budget slots are taken from (default: unlimited)
+        :param max_in_flight: maximum number of requests holding a slot at once (default: unbounded)
+        """
+        self.rate_limiter = rate_limiter
+        self.max_in_flight = max_in_flight
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._queues = {priority: OrderedDict() for priority in PRIORITIES}
+        self._tickets = itertools.count()
+        self._in_flight = 0
+        self.granted = {priority: 0 for priority in PRIORITIES}
+
+    def waiting(self, priority=None):
+        """Returns the number of requests waiting for a slot, optionally of one priority class only."""
+        with self._cond:
+            queues = self._queues.values() if priority is None else [self._queues[priority]]
+            return sum(len(flow) for queue in queues for flow in queue.values())
+
+    @contextmanager
+    def slot(self, priority=INTERACTIVE, flow=None, timeout=None):
+        """Holds a request slot for the duration of the block, see acquire."""
+        self.acquire(priority, flow, timeout)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def acquire(self, priority=INTERACTIVE, flow=None, timeout=None):
+        """Blocks until the caller may send a request.  Release the slot with release() once the response arrived.
+
+        :param priority: INTERACTIVE or BULK
+        :param flow: the flow the request belongs to (default: the calling thread)
+        :param timeout: seconds to wait at most
+
+        :raises godaddypy.deadline.DeadlineExceeded: if no slot was granted within timeout
+        """
+        if priority not in self._queues:
+            raise ValueError("Unknown priority {!r}, expected one of {}".format(priority, ", ".join(PRIORITIES)))
+        flow = threading.get_ident() if flow is None else flow
+        expires = None if timeout is None else self._clock() + timeout
+
+        with self._cond:
+            ticket = next(self._tickets)
+            self._queues[priority].setdefault(flow, deque()).append(ticket)
+            self._cond.notify_all()
+            try:
+                wait = self._wait_for_turn(ticket, expires)
+            except BaseException:
+                self._remove(priority, flow, ticket)
+                self._cond.notify_all()
+                raise
+            self._grant(priority, flow)
+
+        # another limiter user may have taken the token we saw; honour the budget anyway
+        if wait:
+            self.rate_limiter.sleep(wait)
+
+    def release(self):
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def _wait_for_turn(self, ticket, expires):
+        """Waits, with the lock held, until ticket is served next and a slot is free; returns the extra seconds the
+        rate limiter asks for."""
+        while True:
+            wait = None
+            if self._head() == ticket and (self.max_in_flight is None or self._in_flight < self.max_in_flight):
+                if self.rate_limiter is None:
+                    return 0.0
+                wait = self.rate_limiter.peek()
+                if wait <= 0:
+                    return self.rate_limiter.reserve()
+            if expires is not None:
+                remaining = expires - self._clock()
+                if remaining <= 0:
+                    raise DeadlineExceeded("No request slot was granted in time")
+                wait = remaining if wait is None else min(wait, remaining)
+            self._cond.wait(wait)
+
+    def _head(self):
+        for queue in self._queues.values():
+            for tickets in queue.values():
+                return tickets[0]
+        return None
+
+    def _grant(self, priority, flow):
+        queue = self._queues[priority]
+        queue[flow].popleft()
+        if queue[flow]:
+            # round-robin: the flow's next request queues behind the other flows of its class
+            queue.move_to_end(flow)
+        else:
+            del queue[flow]
+        self._in_flight += 1
+        self.granted[priority] += 1
+        self._cond.notify_all()
+
+    def _remove(self, priority, flow, ticket):
+        queue = self._queues[priority]
+        queue[flow].remove(ticket)
+        if not queue[flow]:
+            del queue[flow]
@@ -0,0 +1,63 @@
+import threading
+
+from .deadline import DeadlineExceeded
+
+__all__ = ["SingleFlight"]
+
+
+class _Call(object):
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Coalesces concurrent calls for the same key: the first caller runs the function, callers arriving while
+    it is in flight wait for it and share its result (or exception)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.coalesced = 0
+
+    def do(self, key, func, timeout=None):
+        """Returns func(), or the result of the in-flight call for key.
+
+        :param timeout: seconds a waiting caller waits for the in-flight call
+
+        :raises godaddypy.deadline.DeadlineExceeded: if the in-flight call did not finish within timeout
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise DeadlineExceeded("Gave up waiting for the in-flight request after {}s".format(timeout))
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def forget(self):
+        """Stops later callers from joining the calls currently in flight, eg. after a write made them stale."""
+        with self._lock:
+            self._calls.clear()
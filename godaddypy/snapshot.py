@@ -0,0 +1,121 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+__all__ = ["Snapshot", "SnapshotStore", "DEFAULT_MAX_AGE"]
+
+# Seconds after which a zone snapshot is considered stale
+DEFAULT_MAX_AGE = 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS zones (
+    domain TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    digest TEXT NOT NULL,
+    records TEXT NOT NULL
+)
+"""
+
+
+@dataclass
+class Snapshot:
+    """The records of a domain as they were at `fetched_at` (seconds since the epoch)."""
+
+    domain: str
+    records: List[Dict[str, Any]]
+    fetched_at: float
+    digest: str
+
+    def age(self, now=None):
+        return (time.time() if now is None else now) - self.fetched_at
+
+
+class SnapshotStore(object):
+    """A file-backed (SQLite) store of zone snapshots, keyed by domain.
+
+    Snapshots survive across processes, so short-lived jobs can answer lookups locally and only re-fetch the zones
+    whose snapshot is older than `max_age`.  Each snapshot records its fetch time and a SHA-256 digest of its
+    records, which tells whether a refresh actually changed anything.
+    """
+
+    def __init__(self, path, max_age=DEFAULT_MAX_AGE, clock=time.time):
+        """Create a new `godaddypy.snapshot.SnapshotStore`
+
+        :param path: the SQLite database file (created if missing), or ':memory:'
+        :param max_age: default age in seconds after which snapshots are stale
+        """
+        self.path = path
+        self.max_age = max_age
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def digest(records):
+        canonical = json.dumps(records, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, domain):
+        """Returns the Snapshot of domain, or None if there is none."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at, digest, records FROM zones WHERE domain = ?", (domain,)
+            ).fetchone()
+        if row is None:
+            return None
+        return Snapshot(domain, json.loads(row[2]), row[0], row[1])
+
+    def put(self, domain, records):
+        """Stores the records of domain as fetched now.
+
+        :return: True if the content differs from the previous snapshot
+        """
+        digest = self.digest(records)
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT digest FROM zones WHERE domain = ?", (domain,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO zones (domain, fetched_at, digest, records) VALUES (?, ?, ?, ?)",
+                (domain, self._clock(), digest, json.dumps(records)),
+            )
+        return row is None or row[0] != digest
+
+    def invalidate(self, domain):
+        """Drops the snapshot of domain, so the next read fetches it again."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM zones WHERE domain = ?", (domain,))
+
+    def domains(self):
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT domain FROM zones ORDER BY domain")]
+
+    def is_fresh(self, snapshot, max_age=None):
+        max_age = self.max_age if max_age is None else max_age
+        return snapshot is not None and snapshot.age(self._clock()) <= max_age
+
+    def stale_domains(self, domains, max_age=None):
+        """Returns the domains, out of `domains`, without a fresh snapshot."""
+        max_age = self.max_age if max_age is None else max_age
+        with self._lock:
+            fresh = {
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT domain FROM zones WHERE fetched_at >= ?", (self._clock() - max_age,)
+                )
+            }
+        return [domain for domain in domains if domain not in fresh]
@@ -0,0 +1,137 @@
+import bisect
+import threading
+
+__all__ = ["LatencyHistogram", "StatsCollector", "DEFAULT_BUCKETS"]
+
+# Upper bounds, in seconds, of the latency buckets (the Prometheus client defaults)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+
+class LatencyHistogram(object):
+    """A fixed-bucket latency histogram.  Percentiles are interpolated within buckets, so memory stays constant no
+    matter how many observations are recorded."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def percentile(self, p):
+        """Estimates the p-th percentile (0-100) of the observed values."""
+        if not self.count:
+            return 0.0
+
+        rank = p / 100.0 * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.max
+                return min(self.max, lower + (upper - lower) * (rank - seen) / count)
+            seen += count
+        return self.max
+
+    def cumulative(self):
+        """Yields (upper bound, cumulative count) pairs, ending with ('+Inf', total)."""
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield bound, total
+        yield "+Inf", self.count
+
+
+class _EndpointStats(object):
+    def __init__(self, buckets):
+        self.latency = LatencyHistogram(buckets)
+        self.errors = 0
+        self.retries = 0
+        self.response_bytes = 0
+
+    def snapshot(self):
+        latency = self.latency
+        return {
+            "count": latency.count,
+            "errors": self.errors,
+            "retries": self.retries,
+            "response_bytes": self.response_bytes,
+            "mean": latency.sum / latency.count if latency.count else 0.0,
+            "p50": latency.percentile(50),
+            "p95": latency.percentile(95),
+            "p99": latency.percentile(99),
+            "max": latency.max,
+        }
+
+
+class StatsCollector(object):
+    """Aggregates per-endpoint call counts, error counts, bytes and latency histograms.
+
+    Register it on a client with `client.add_response_hook(collector)`, or create the client with `stats=True`.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def __call__(self, event):
+        key = (event.method, event.endpoint)
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = _EndpointStats(self._buckets)
+            stats.latency.observe(event.latency or 0.0)
+            stats.response_bytes += event.response_bytes
+            if not event.ok:
+                stats.errors += 1
+            if event.retries:
+                stats.retries += 1
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self):
+        """Returns a dict of '<METHOD> <endpoint template>' to that endpoint's stats."""
+        with self._lock:
+            return {
+                "{} {}".format(method, endpoint): stats.snapshot()
+                for (method, endpoint), stats in sorted(self._endpoints.items())
+            }
+
+    def to_prometheus(self, prefix="godaddypy"):
+        """Renders the collected stats in the Prometheus text exposition format."""
+        lines = [
+            "# HELP {}_request_duration_seconds GoDaddy API request latency.".format(prefix),
+            "# TYPE {}_request_duration_seconds histogram".format(prefix),
+        ]
+        counters = []
+        with self._lock:
+            for (method, endpoint), stats in sorted(self._endpoints.items()):
+                labels = 'method="{}",endpoint="{}"'.format(method, endpoint.replace('"', '\\"'))
+                for bound, count in stats.latency.cumulative():
+                    lines.append(
+                        '{}_request_duration_seconds_bucket{{{},le="{}"}} {}'.format(prefix, labels, bound, count)
+                    )
+                lines.append("{}_request_duration_seconds_sum{{{}}} {}".format(prefix, labels, stats.latency.sum))
+                lines.append("{}_request_duration_seconds_count{{{}}} {}".format(prefix, labels, stats.latency.count))
+                counters.append((labels, stats))
+
+        for name, help_text, attr in (
+            ("request_errors_total", "GoDaddy API request attempts that failed.", "errors"),
+            ("request_retries_total", "GoDaddy API request attempts that were retries.", "retries"),
+            ("response_bytes_total", "GoDaddy API response bytes received.", "response_bytes"),
+        ):
+            lines.append("# HELP {}_{} {}".format(prefix, name, help_text))
+            lines.append("# TYPE {}_{} counter".format(prefix, name))
+            for labels, stats in counters:
+                lines.append("{}_{}{{{}}} {}".format(prefix, name, labels, getattr(stats, attr)))
+
+        return "\n".join(lines) + "\n"
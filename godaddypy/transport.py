@@ -0,0 +1,296 @@
+import json as jsonlib
+import random
+import re
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+__all__ = [
+    "Transport",
+    "RequestsTransport",
+    "InMemoryTransport",
+    "SimulatedAccount",
+    "Response",
+    "DEFAULT_POOL_CONNECTIONS",
+    "DEFAULT_POOL_MAXSIZE",
+]
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
+class Transport(object):
+    """The interface `godaddypy.Client` sends its HTTP requests through.
+
+    Implementations return an object with the `requests.Response` attributes the client uses: `status_code`,
+    `headers`, `content`, `json()` and `raise_for_status()`.
+    """
+
+    def request(self, method, url, headers=None, params=None, json=None, **kwargs):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class RequestsTransport(Transport):
+    """The default transport: a pooled, thread-safe `requests.Session`, created on first use."""
+
+    def __init__(
+        self,
+        session=None,
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        pool_block=False,
+        keep_alive=True,
+    ):
+        """Create a new `godaddypy.transport.RequestsTransport`
+
+        :type session: requests.Session
+        :param session: An optional pre-configured session to use instead of the pooled default. It is not closed
+            by `close()`.
+        :param pool_connections: number of per-host connection pools to cache
+        :param pool_maxsize: maximum number of connections kept open per host
+        :param pool_block: block when no free connection is available instead of opening a throwaway one
+        :param keep_alive: keep connections open between requests (set False to send `Connection: close`)
+        """
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._keep_alive = keep_alive
+        self._session = session
+        self._owns_session = session is None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self):
+        """The `requests.Session` used for all requests, created on first use."""
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._build_session()
+                session = self._session
+        return session
+
+    def _build_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            pool_block=self._pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self._keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def request(self, method, url, headers=None, params=None, json=None, **kwargs):
+        return self.session.request(method, url=url, headers=headers, params=params, json=json, **kwargs)
+
+    def close(self):
+        """Close the pooled session. A new session is created if the transport is used again.  A session passed in
+        by the caller is left open and keeps being used."""
+        if not self._owns_session:
+            return
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+
+class Response(object):
+    """A minimal `requests.Response` look-alike returned by the in-memory transport."""
+
+    def __init__(self, status_code, content=b"", headers=None, url=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.url = url
+
+    def __repr__(self):
+        return "<Response [{}]>".format(self.status_code)
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def json(self):
+        return jsonlib.loads(self.content)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError("{} Error for url: {}".format(self.status_code, self.url), response=self)
+
+
+_VERSION_PREFIX = re.compile(r"^/v\d+")
+_DOMAIN_PATH = re.compile(r"^/domains/(?P<domain>[^/]+)$")
+_RECORDS_PATH = re.compile(r"^/domains/(?P<domain>[^/]+)/records(?:/(?P<type>[^/]+)(?:/(?P<name>[^/]+))?)?$")
+
+
+class SimulatedAccount(object):
+    """An in-memory GoDaddy account: domains, their settings and their DNS records.
+
+    Implements the semantics of the `/v1/domains` endpoints used by `godaddypy.Client` (marker and offset
+    pagination, PATCH/PUT/DELETE on records and domains), with optional latency and 429/5xx fault injection.
+    """
+
+    def __init__(
+        self,
+        domains=100,
+        records_per_domain=10,
+        latency=0.0,
+        max_domains_page=1000,
+        max_records_page=500,
+        fault_rate=0.0,
+        fault_statuses=(429, 503),
+        seed=0,
+    ):
+        """Create a new `godaddypy.transport.SimulatedAccount`
+
+        :param domains: number of domains to generate, or a dict of domain to records
+        :param records_per_domain: number of A records generated per domain
+        :param latency: seconds added to every response
+        :param max_domains_page: largest page the domains endpoint returns, whatever the requested limit
+        :param max_records_page: largest page the records endpoints return, whatever the requested limit
+        :param fault_rate: probability (0-1) that a request fails with one of fault_statuses
+        :param fault_statuses: statuses returned by injected faults (429 responses carry `Retry-After: 0`)
+        """
+        if isinstance(domains, dict):
+            self.zones = {domain: [dict(record) for record in records] for domain, records in domains.items()}
+        else:
+            self.zones = {
+                "domain{:05d}.example".format(i): [
+                    {"name": "host{}".format(j), "ttl": 600, "data": "10.0.0.{}".format(j % 250), "type": "A"}
+                    for j in range(records_per_domain)
+                ]
+                for i in range(domains)
+            }
+        self.domain_info = {domain: {"locked": True, "renewAuto": True, "nameServers": []} for domain in self.zones}
+        self.latency = latency
+        self.max_domains_page = max_domains_page
+        self.max_records_page = max_records_page
+        self.fault_rate = fault_rate
+        self.fault_statuses = tuple(fault_statuses)
+        self.requests = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def reset_counts(self):
+        with self._lock:
+            self.requests.clear()
+
+    def handle(self, method, path, query, body):
+        """Serves one request.
+
+        :param path: the URL path, with or without the API version prefix (eg. '/v1/domains')
+        :param query: dict of query parameters
+        :param body: the decoded JSON body, or None
+
+        :return: a (status, headers, payload) tuple; payload is None for empty responses
+        """
+        with self._lock:
+            self.requests[method] += 1
+            fault = self.fault_rate and self._random.random() < self.fault_rate
+            status = self._random.choice(self.fault_statuses) if fault else None
+
+        if self.latency:
+            time.sleep(self.latency)
+        if status is not None:
+            headers = {"Retry-After": "0"} if status == 429 else {}
+            return status, headers, {"code": "INJECTED_FAULT", "message": "Injected {}".format(status)}
+
+        with self._lock:
+            return self._route(method, _VERSION_PREFIX.sub("", path), query, body)
+
+    def _route(self, method, path, query, body):
+        if path == "/domains" and method == "GET":
+            return self._list_domains(query)
+
+        match = _DOMAIN_PATH.match(path)
+        if match:
+            domain = match.group("domain")
+            if domain not in self.zones:
+                return _not_found(domain)
+            if method == "GET":
+                return 200, {}, dict(self.domain_info[domain], domain=domain, status="ACTIVE")
+            if method == "PATCH":
+                self.domain_info[domain].update(body or {})
+                return 204, {}, None
+
+        match = _RECORDS_PATH.match(path)
+        if match:
+            domain, record_type, name = match.group("domain", "type", "name")
+            if domain not in self.zones:
+                return _not_found(domain)
+            return self._records(method, domain, record_type, name, query, body)
+
+        return 404, {}, {"code": "NOT_FOUND", "message": "Unknown endpoint {} {}".format(method, path)}
+
+    def _list_domains(self, query):
+        limit = min(int(query.get("limit", 1000)), self.max_domains_page)
+        marker = query.get("marker")
+        domains = sorted(self.zones)
+        if marker:
+            domains = [domain for domain in domains if domain > marker]
+        return 200, {}, [{"domain": domain, "status": "ACTIVE"} for domain in domains[:limit]]
+
+    def _records(self, method, domain, record_type, name, query, body):
+        zone = self.zones[domain]
+
+        def in_scope(record):
+            return (record_type is None or record["type"] == record_type) and (name is None or record["name"] == name)
+
+        if method == "GET":
+            limit = min(int(query.get("limit", 500)), self.max_records_page)
+            offset = int(query.get("offset", 1))
+            matching = [record for record in zone if in_scope(record)]
+            return 200, {}, matching[(offset - 1) * limit : offset * limit]
+        if method == "PATCH" and record_type is None:
+            zone.extend(body)
+            return 200, {}, None
+        if method == "PUT":
+            kept = [record for record in zone if not in_scope(record)]
+            self.zones[domain] = kept + [dict(record, type=record.get("type", record_type)) for record in body]
+            return 200, {}, None
+        if method == "DELETE" and name is not None:
+            kept = [record for record in zone if not in_scope(record)]
+            if len(kept) == len(zone):
+                return 404, {}, {"code": "NOT_FOUND", "message": "No matching records"}
+            self.zones[domain] = kept
+            return 204, {}, None
+
+        return 405, {}, {"code": "METHOD_NOT_ALLOWED", "message": method}
+
+
+def _not_found(domain):
+    return 404, {}, {"code": "UNKNOWN_DOMAIN", "message": "Unknown domain {}".format(domain)}
+
+
+class InMemoryTransport(Transport):
+    """Serves requests from a `SimulatedAccount` without any I/O.
+
+    Bodies go through a JSON round trip, so the client never shares objects with the simulated account.
+    """
+
+    def __init__(self, account=None, **kwargs):
+        """Create a new `godaddypy.transport.InMemoryTransport`
+
+        :type account: godaddypy.transport.SimulatedAccount
+        :param account: the account to serve; one is created from kwargs if omitted
+        """
+        self.account = account if account is not None else SimulatedAccount(**kwargs)
+
+    def request(self, method, url, headers=None, params=None, json=None, **kwargs):
+        query = {key: str(value) for key, value in (params or {}).items()}
+        body = None if json is None else jsonlib.loads(jsonlib.dumps(json))
+
+        status, response_headers, payload = self.account.handle(method.upper(), urlparse(url).path, query, body)
+
+        content = b"" if payload is None else jsonlib.dumps(payload).encode("utf-8")
+        return Response(status, content, response_headers, url)
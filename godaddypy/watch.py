@@ -0,0 +1,225 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import requests
+
+from .client import BadResponse
+from .deadline import DeadlineExceeded
+from .ratelimit import RateLimiter
+from .record import Record
+
+__all__ = ["PropagationWatcher"]
+
+
+class _Watch(object):
+    __slots__ = ("key", "fetch", "matches", "future", "interval", "expires", "last")
+
+    def __init__(self, key, fetch, matches, interval, expires):
+        self.key = key
+        self.fetch = fetch
+        self.matches = matches
+        self.future = Future()
+        self.interval = interval
+        self.expires = expires
+        self.last = None
+
+
+def _subset(expected, actual):
+    return all(actual.get(key) == value for key, value in expected.items())
+
+
+class PropagationWatcher(object):
+    """Polls many domains on one shared scheduler until changes are observed.
+
+    Each watch is polled after `min_interval` seconds, and the interval grows by `backoff` up to `max_interval`
+    while nothing changes; it drops back to `min_interval` as soon as the observed state moves.  Polls are spread
+    over `max_workers` threads and, with `polls_per_minute`, held to a request budget of their own on top of the
+    client's rate limiter.  Every watch returns a `concurrent.futures.Future` resolved with the observed state, or
+    failed with `godaddypy.deadline.DeadlineExceeded` once its timeout passes; use `Future.add_done_callback` for
+    callbacks.  API errors are retried on the next poll, any other error (eg. raised by an `expected` callable)
+    fails the watch.  Polls are sent with the `Client.priority` of the thread that added the watch.
+
+    >>> with PropagationWatcher(client) as watcher:
+    ...     future = watcher.watch_domain("example.com", {"nameServers": ["ns1.example.net"]}, timeout=900)
+    ...     info = future.result()
+    """
+
+    def __init__(
+        self,
+        client,
+        min_interval=5.0,
+        max_interval=120.0,
+        backoff=2.0,
+        max_workers=4,
+        polls_per_minute=None,
+        clock=time.monotonic,
+    ):
+        """Create a new `godaddypy.watch.PropagationWatcher`
+
+        :type client: godaddypy.Client
+        :param min_interval: seconds before the first poll, and between polls while the state is changing
+        :param max_interval: the longest wait between two polls of the same watch
+        :param backoff: factor the interval grows by after each poll that observed no change
+        :param max_workers: polls made concurrently
+        :param polls_per_minute: request budget of the watcher (default: only the client's limits apply)
+        """
+        self.logger = logging.getLogger("GoDaddyPy.PropagationWatcher")
+        self.client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.budget = RateLimiter(polls_per_minute) if polls_per_minute else None
+        self._clock = clock
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="godaddypy-watch")
+        self._cond = threading.Condition()
+        self._queue = []
+        self._sequence = itertools.count()
+        self._closed = False
+        self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def watch_domain(self, domain, expected, timeout=None):
+        """Watches get_domain_info(domain) until it matches expected.
+
+        :param expected: a dict of settings that must all be observed (eg. {'locked': False}), or a callable
+            taking the domain info and returning True once it is as expected
+        :param timeout: seconds after which the watch fails with DeadlineExceeded
+
+        :return: a Future resolved with the domain info
+        """
+        matches = expected if callable(expected) else lambda info: _subset(expected, info)
+
+        def fetch():
+            self._forget_cached(domain)
+            return self.client.get_domain_info(domain)
+
+        return self._add(domain, fetch, matches, timeout)
+
+    def watch_records(self, domain, records, record_type=None, name=None, timeout=None):
+        """Watches the records of a domain until every expected record is present.
+
+        :param records: the expected records, as dicts or godaddypy.Record objects; only the fields they set are
+            compared
+        :param record_type: only fetch records of this type
+        :param name: only fetch records with this name (requires record_type)
+        :param timeout: seconds after which the watch fails with DeadlineExceeded
+
+        :return: a Future resolved with the fetched records
+        """
+        expected = [record.to_json() if isinstance(record, Record) else record for record in records]
+
+        def fetch():
+            self._forget_cached(domain)
+            return self.client.get_records(domain, record_type=record_type, name=name)
+
+        def matches(current):
+            return all(any(_subset(record, actual) for actual in current) for record in expected)
+
+        return self._add(domain, fetch, matches, timeout)
+
+    def pending(self):
+        """Returns the number of watches waiting for their next poll."""
+        with self._cond:
+            return len(self._queue)
+
+    def close(self):
+        """Stops polling and cancels the watches still pending."""
+        with self._cond:
+            self._closed = True
+            queue, self._queue = self._queue, []
+            self._cond.notify()
+        for _, _, watch in queue:
+            watch.future.cancel()
+        if self._thread is not None:
+            self._thread.join()
+        self._pool.shutdown(wait=True)
+
+    def _forget_cached(self, domain):
+        if self.client.cache is not None:
+            self.client.cache.invalidate_domain(domain)
+
+    def _add(self, key, fetch, matches, timeout):
+        # polls run on the watcher's threads with the priority and deadline of the thread adding the watch
+        fetch = self.client._bind_context(fetch)
+        now = self._clock()
+        watch = _Watch(key, fetch, matches, self.min_interval, None if timeout is None else now + timeout)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("PropagationWatcher is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="godaddypy-watch-scheduler", daemon=True)
+                self._thread.start()
+            self._schedule(watch, now + self.min_interval)
+        return watch.future
+
+    def _schedule(self, watch, due):
+        """Queues watch to be polled at due.  Must be called with the lock held."""
+        if watch.expires is not None:
+            due = min(due, watch.expires)
+        heapq.heappush(self._queue, (due, next(self._sequence), watch))
+        self._cond.notify()
+
+    def _run(self):
+        with self._cond:
+            while not self._closed:
+                if not self._queue:
+                    self._cond.wait()
+                    continue
+                wait = self._queue[0][0] - self._clock()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+                _, _, watch = heapq.heappop(self._queue)
+                self._pool.submit(self._poll, watch)
+
+    def _poll(self, watch):
+        if watch.future.cancelled():
+            return
+        if self.budget is not None:
+            self.budget.acquire()
+        try:
+            state = watch.fetch()
+            matched = watch.matches(state)
+        except (BadResponse, requests.RequestException) as e:
+            self.logger.warning("Polling {} failed: {}".format(watch.key, e))
+            state, matched = watch.last, False
+        except Exception as e:
+            # anything else (eg. a failing predicate) won't go away by polling again
+            self.logger.error("Watching {} failed: {!r}".format(watch.key, e))
+            if watch.future.set_running_or_notify_cancel():
+                watch.future.set_exception(e)
+            return
+
+        if matched:
+            if watch.future.set_running_or_notify_cancel():
+                watch.future.set_result(state)
+            return
+        self._reschedule(watch, state)
+
+    def _reschedule(self, watch, state):
+        now = self._clock()
+        if watch.expires is not None and now >= watch.expires:
+            if watch.future.set_running_or_notify_cancel():
+                watch.future.set_exception(DeadlineExceeded("{} did not converge in time".format(watch.key)))
+            return
+
+        # back off while nothing moves, poll eagerly again once the state starts changing
+        if state == watch.last:
+            watch.interval = min(self.max_interval, watch.interval * self.backoff)
+        else:
+            watch.interval = self.min_interval
+        watch.last = state
+        with self._cond:
+            if not self._closed:
+                self._schedule(watch, now + watch.interval)
+                return
+        watch.future.cancel()
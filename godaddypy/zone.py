@@ -0,0 +1,83 @@
+from .record import to_json_records
+
+__all__ = ["ZoneView"]
+
+
+class ZoneView(object):
+    """An indexed view of the records of one domain, as they were when it was built.
+
+    Records are indexed by type, by name and by (type, name), so lookups cost O(1) regardless of the zone size.
+    The record dicts are shared with the view, so in-place updates are reflected; `Client.update_ip` and
+    `Client.update_record_ip` update the records of a view once the write succeeded.  Changes made to the zone by
+    anyone else are not, so rebuild the view rather than keep it around.
+    """
+
+    def __init__(self, domain, records):
+        """Create a new `godaddypy.zone.ZoneView`
+
+        :param domain: the domain the records belong to
+        :param records: the records of the domain, as dicts or godaddypy.Record objects
+        """
+        self.domain = domain
+        self.records = to_json_records(records)
+        self._by_type = {}
+        self._by_name = {}
+        self._by_key = {}
+        for record in self.records:
+            record_type, name = record["type"], str(record["name"])
+            self._by_type.setdefault(record_type, []).append(record)
+            self._by_name.setdefault(name, []).append(record)
+            self._by_key.setdefault((record_type, name), []).append(record)
+
+    @classmethod
+    def fetch(cls, client, domain):
+        """Builds the view of a domain from a single read of its records.
+
+        :type client: godaddypy.Client
+        """
+        return cls(domain, list(client.iter_records(domain)))
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, key):
+        return key in self._by_key
+
+    def __repr__(self):
+        return "ZoneView({!r}, {} record(s))".format(self.domain, len(self.records))
+
+    def types(self):
+        return set(self._by_type)
+
+    def names(self):
+        return set(self._by_name)
+
+    def by_type(self, record_type):
+        return list(self._by_type.get(record_type, ()))
+
+    def by_name(self, name):
+        return list(self._by_name.get(name, ()))
+
+    def get(self, record_type, name):
+        """Returns the records matching both type and name."""
+        return list(self._by_key.get((record_type, name), ()))
+
+    def filter(self, types=None, names=None):
+        """Returns the records whose type is in `types` and whose name is in `names`.  None matches everything.
+
+        :type types: str or iterable of str
+        :type names: str or iterable of str
+        """
+        types = {types} if isinstance(types, str) else (None if types is None else set(types))
+        names = {names} if isinstance(names, str) else (None if names is None else set(names))
+
+        if types is None and names is None:
+            return list(self.records)
+        if names is None:
+            return [record for t in types for record in self._by_type.get(t, ())]
+        if types is None:
+            return [record for n in names for record in self._by_name.get(n, ())]
+        return [record for t in types for record in self._by_type.get(t, ()) if str(record["name"]) in names]
@@ -0,0 +1,390 @@
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .reconcile import DEFAULT_IGNORE_TYPES
+from .record import Record
+from .report import FAILED, UPDATED, DomainResult, UpdateReport
+
+__all__ = [
+    "ZoneFileParser",
+    "format_record",
+    "write_zone",
+    "export_zone",
+    "export_zones",
+    "import_zone",
+    "import_zones",
+    "DEFAULT_TTL",
+]
+
+DEFAULT_TTL = 3600
+ZONE_SUFFIX = ".zone"
+
+# record types whose data is a host name
+_HOST_TYPES = frozenset(("CNAME", "NS", "PTR"))
+_TTL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+_TTL_PATTERN = re.compile(r"^(?:\d+[smhdw]?)+$", re.IGNORECASE)
+_CLASSES = frozenset(("IN", "CH", "HS", "CS"))
+_TXT_CHUNK = 255
+
+logger = logging.getLogger("GoDaddyPy.ZoneFile")
+
+
+def _fqdn(host):
+    """Host names with a dot are absolute in the API; mark them so in the zone file."""
+    if host is None or host == "@" or host.endswith(".") or "." not in host:
+        return host
+    return host + "."
+
+
+def _quote(text):
+    text = text or ""
+    # split before escaping, so no chunk ends in the middle of an escape sequence
+    chunks = [text[i : i + _TXT_CHUNK] for i in range(0, len(text), _TXT_CHUNK)] or [""]
+    return " ".join('"{}"'.format(chunk.replace("\\", "\\\\").replace('"', '\\"')) for chunk in chunks)
+
+
+def _owner(record):
+    name = record.name if record.name not in (None, "") else "@"
+    if record.type == "SRV" and record.service and record.protocol:
+        labels = [record.service, record.protocol] + ([] if name == "@" else [name])
+        return ".".join(labels)
+    return name
+
+
+def format_record(record):
+    """Returns the zone file line of a record (a dict or godaddypy.Record), without a line break."""
+    if not isinstance(record, Record):
+        record = Record.from_json(record)
+
+    if record.type == "MX":
+        data = "{} {}".format(record.priority or 0, _fqdn(record.data))
+    elif record.type == "SRV":
+        data = "{} {} {} {}".format(record.priority or 0, record.weight or 0, record.port or 0, _fqdn(record.data))
+    elif record.type == "TXT":
+        data = _quote(record.data)
+    elif record.type in _HOST_TYPES:
+        data = _fqdn(record.data)
+    else:
+        data = record.data
+
+    ttl = "" if record.ttl is None else record.ttl
+    return "{}\t{}\tIN\t{}\t{}".format(_owner(record), ttl, record.type, data)
+
+
+def write_zone(stream, domain, records, default_ttl=DEFAULT_TTL):
+    """Writes records to a text stream in BIND zone file format, one record at a time.
+
+    :return: the number of records written
+    """
+    stream.write("; {} exported by godaddypy\n".format(domain))
+    stream.write("$ORIGIN {}.\n$TTL {}\n".format(domain.rstrip("."), default_ttl))
+    count = 0
+    for record in records:
+        stream.write(format_record(record))
+        stream.write("\n")
+        count += 1
+    return count
+
+
+def export_zone(client, domain, path, page_size=500):
+    """Streams every record of a domain to a zone file, page by page.  The file is replaced atomically once all
+    records were written, so a failed export never leaves a truncated zone behind.
+
+    :type client: godaddypy.Client
+    :return: the number of records written
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, mode="w") as stream:
+            records = client.iter_records(domain, page_size=page_size, prefetch=True)
+            count = write_zone(stream, domain, records)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return count
+
+
+def export_zones(client, directory, domains=None, max_workers=8, page_size=500):
+    """Exports the zones of many domains concurrently to `<directory>/<domain>.zone`.
+
+    :param domains: the domains to export (default: every domain of the account)
+    :param max_workers: zones fetched and written concurrently
+    :param page_size: records fetched per request
+
+    :return: a godaddypy.report.UpdateReport; exported zones have status 'updated'
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    domains = client.iter_domains() if domains is None else client._normalize_domains(domains)
+
+    def export(domain):
+        return export_zone(client, domain, directory / (domain + ZONE_SUFFIX), page_size)
+
+    return _run_all(client._bind_context(export), domains, max_workers, "export")
+
+
+class ZoneFileParser(object):
+    """An incremental BIND zone file parser yielding godaddypy.Record objects.
+
+    Handles $ORIGIN and $TTL, comments, quoted strings, multi-line records in parentheses, inherited owners,
+    relative and absolute names and optional TTL/class fields.  Names are returned relative to the zone apex,
+    with '@' for the apex itself, the way the API expects them.  The apex is the `origin` passed in, or else the
+    first $ORIGIN of the file; relative names and '@' are resolved against the current $ORIGIN, so after
+    `$ORIGIN sub.example.com.` in the example.com zone, 'host' becomes 'host.sub' and '@' becomes 'sub'.
+    """
+
+    def __init__(self, origin=None, default_ttl=DEFAULT_TTL):
+        self.apex = origin.rstrip(".") if origin else None
+        self.origin = self.apex
+        self.default_ttl = default_ttl
+        self._owner = None
+
+    def parse(self, lines):
+        """Yields a Record for every record in lines (an open file or any iterable of lines)."""
+        for starts_blank, tokens in _logical_lines(lines):
+            if tokens[0].startswith("$"):
+                self._directive(tokens)
+                continue
+            if not starts_blank:
+                self._owner = self._relative(tokens.pop(0))
+            elif self._owner is None:
+                raise ValueError("Record without an owner name: {}".format(" ".join(tokens)))
+            yield self._record(self._owner, tokens)
+
+    def _directive(self, tokens):
+        directive = tokens[0].upper()
+        if directive == "$ORIGIN":
+            origin = tokens[1]
+            if not origin.endswith(".") and self.origin is not None:
+                origin = "{}.{}".format(origin, self.origin)
+            self.origin = origin.rstrip(".")
+            if self.apex is None:
+                self.apex = self.origin
+        elif directive == "$TTL":
+            self.default_ttl = _parse_ttl(tokens[1])
+        else:
+            raise ValueError("Unsupported zone file directive {}".format(tokens[0]))
+
+    def _relative(self, name):
+        if name.endswith("."):
+            name = name.rstrip(".")
+        elif self.origin is None or self.origin == self.apex:
+            return name
+        elif name == "@":
+            name = self.origin
+        else:
+            name = "{}.{}".format(name, self.origin)
+
+        if self.apex is None:
+            return name
+        if name.lower() == self.apex.lower():
+            return "@"
+        suffix = "." + self.apex.lower()
+        if not name.lower().endswith(suffix):
+            raise ValueError("{} is outside of the zone {}".format(name, self.apex))
+        return name[: -len(suffix)]
+
+    def _record(self, owner, tokens):
+        ttl = None
+        while tokens and (tokens[0].upper() in _CLASSES or _TTL_PATTERN.match(tokens[0])):
+            token = tokens.pop(0)
+            if token.upper() not in _CLASSES:
+                ttl = _parse_ttl(token)
+        if not tokens:
+            raise ValueError("Record {} has no type".format(owner))
+
+        record = Record(tokens[0].upper(), owner, None, ttl if ttl is not None else self.default_ttl)
+        _set_rdata(record, tokens[1:])
+        return record
+
+
+def _set_rdata(record, rdata):
+    if record.type == "MX":
+        record.priority, record.data = int(rdata[0]), _host(rdata[1])
+    elif record.type == "SRV":
+        labels = record.name.split(".")
+        if len(labels) >= 2 and labels[0].startswith("_") and labels[1].startswith("_"):
+            record.service, record.protocol = labels[0], labels[1]
+            record.name = ".".join(labels[2:]) or "@"
+        record.priority, record.weight, record.port = (int(value) for value in rdata[:3])
+        record.data = _host(rdata[3])
+    elif record.type == "TXT":
+        record.data = "".join(rdata)
+    elif record.type in _HOST_TYPES:
+        record.data = _host(rdata[0])
+    else:
+        record.data = " ".join(rdata)
+
+
+def _host(name):
+    return name if name == "@" else name.rstrip(".")
+
+
+def _parse_ttl(token):
+    if token.isdigit():
+        return int(token)
+    if not _TTL_PATTERN.match(token):
+        raise ValueError("Invalid TTL {}".format(token))
+    return sum(int(value) * _TTL_UNITS[unit.lower()] for value, unit in re.findall(r"(\d+)([smhdw])", token, re.I))
+
+
+def _tokenize(line, tokens):
+    """Appends the tokens of one physical line to tokens and returns the change in parenthesis depth."""
+    depth, i, length = 0, 0, len(line)
+    while i < length:
+        char = line[i]
+        if char == ";":
+            break
+        if char == '"':
+            i, text = _read_quoted(line, i + 1)
+            tokens.append(text)
+            continue
+        if char in "()":
+            depth += 1 if char == "(" else -1
+        elif not char.isspace():
+            start = i
+            while i < length and not line[i].isspace() and line[i] not in '();"':
+                i += 1
+            tokens.append(line[start:i])
+            continue
+        i += 1
+    return depth
+
+
+def _read_quoted(line, i):
+    """Reads a quoted string starting after its opening quote; returns the index after it and its text."""
+    chars = []
+    while i < len(line) and line[i] != '"':
+        if line[i] == "\\" and i + 1 < len(line):
+            i += 1
+        chars.append(line[i])
+        i += 1
+    return i + 1, "".join(chars)
+
+
+def _logical_lines(lines):
+    """Yields (starts with blank, tokens) for every logical line, joining lines continued in parentheses."""
+    tokens, depth, starts_blank = [], 0, False
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if depth == 0:
+            starts_blank = line[:1].isspace()
+        depth += _tokenize(line, tokens)
+        if depth == 0 and tokens:
+            yield starts_blank, tokens
+            tokens = []
+    if tokens:
+        raise ValueError("Unbalanced parentheses at the end of the zone file")
+
+
+class _ZoneWriter(object):
+    """Applies parsed records with bounded memory: records are buffered per type, the first batch of a type
+    replaces the existing records of that type and later batches are added to it."""
+
+    def __init__(self, client, domain, batch_size, replace):
+        self.client = client
+        self.domain = domain
+        self.batch_size = batch_size
+        self.replace = replace
+        self.buffers = {}
+        self.replaced = set()
+        self.count = 0
+
+    def add(self, record):
+        buffer = self.buffers.setdefault(record.type, [])
+        buffer.append(record)
+        if len(buffer) >= self.batch_size:
+            self.flush(record.type)
+
+    def flush(self, record_type):
+        batch = self.buffers.pop(record_type, None)
+        if not batch:
+            return
+        if self.replace and record_type not in self.replaced:
+            self.client.replace_records(self.domain, batch, record_type=record_type)
+            self.replaced.add(record_type)
+        else:
+            self.client.add_records(self.domain, batch)
+        self.count += len(batch)
+
+    def close(self):
+        for record_type in list(self.buffers):
+            self.flush(record_type)
+
+
+def import_zone(client, source, domain=None, replace=True, batch_size=500, ignore_types=DEFAULT_IGNORE_TYPES):
+    """Applies a zone file to a domain while it is being parsed, so whole zones never have to fit in memory.
+
+    With `replace`, the records of every type present in the file replace the existing records of that type
+    (types missing from the file are left alone); otherwise the records are added.  Writes are batched: one
+    replace_records or add_records call per `batch_size` records of a type.  The import is not atomic, a failure
+    leaves the batches written so far in place.
+
+    :type client: godaddypy.Client
+    :param source: a path, or an iterable of lines such as an open file
+    :param domain: the domain to import to (default: the first $ORIGIN of the file)
+    :param ignore_types: record types that are skipped (by default SOA and NS, which GoDaddy manages)
+
+    :return: the number of records written
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, mode="r") as stream:
+            return import_zone(client, stream, domain, replace, batch_size, ignore_types)
+
+    parser = ZoneFileParser(origin=domain)
+    writer = None
+    for record in parser.parse(source):
+        if record.type in ignore_types:
+            continue
+        if writer is None:
+            if not (domain or parser.apex):
+                raise ValueError("No domain given and the zone file has no $ORIGIN")
+            writer = _ZoneWriter(client, domain or parser.apex, batch_size, replace)
+        writer.add(record)
+
+    if writer is None:
+        return 0
+    writer.close()
+    return writer.count
+
+
+def import_zones(client, directory, domains=None, max_workers=4, **kwargs):
+    """Imports `<directory>/<domain>.zone` files concurrently, see import_zone for the keyword arguments.
+
+    :param domains: the domains to import (default: every .zone file of the directory)
+    :param max_workers: zones applied concurrently
+
+    :return: a godaddypy.report.UpdateReport; imported zones have status 'updated'
+    """
+    directory = Path(directory)
+    if domains is None:
+        domains = sorted(path.name[: -len(ZONE_SUFFIX)] for path in directory.glob("*" + ZONE_SUFFIX))
+    else:
+        domains = client._normalize_domains(domains)
+
+    def apply(domain):
+        return import_zone(client, directory / (domain + ZONE_SUFFIX), domain, **kwargs)
+
+    return _run_all(client._bind_context(apply), domains, max_workers, "import")
+
+
+def _run_all(func, domains, max_workers, action):
+    def run(domain):
+        try:
+            count = func(domain)
+        except Exception as e:
+            logger.error("Failed to {} {}: {}".format(action, domain, e))
+            return DomainResult(domain, FAILED, error=e)
+        logger.debug("{}ed {} record(s) of {}".format(action.capitalize(), count, domain))
+        return DomainResult(domain, UPDATED)
+
+    report = UpdateReport()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for result in pool.map(run, domains):
+            report.add(result)
+    return report
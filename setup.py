@@ -39,6 +39,7 @@ setup(
     packages=["godaddypy"],
     install_requires=get_reqs('requirements.txt'),
     tests_require=get_reqs('requirements-dev.txt'),
+    extras_require={"async": ["aiohttp>=3.8"]},
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -0,0 +1,38 @@
+import logging
+
+import pytest
+
+from godaddypy import Account, Client
+from godaddypy.transport import InMemoryTransport
+
+
+class FakeClock(object):
+    """A clock that only moves when told to; `sleep` advances it instead of blocking."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def make_client():
+    """Returns a factory of clients serving a `SimulatedAccount` in memory.  Other keyword arguments are passed to
+    `Client`, so a client can also be pointed at an explicit `transport` or `api_base_url` instead."""
+
+    def make(account=None, **kwargs):
+        if account is not None:
+            kwargs["transport"] = InMemoryTransport(account)
+        kwargs.setdefault("log_level", logging.ERROR)
+        return Client(Account("key", "secret"), **kwargs)
+
+    return make
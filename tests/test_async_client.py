@@ -0,0 +1,161 @@
+import asyncio
+import logging
+
+# noinspection PyPackageRequirements
+from callee import EndsWith
+
+# noinspection PyPackageRequirements
+from mock import AsyncMock, patch
+
+from godaddypy import Account, AsyncClient
+from godaddypy.client import BadResponse
+
+
+class TestAsyncClient(object):
+    account: Account
+    client: AsyncClient
+
+    @classmethod
+    def setup_class(cls):
+        cls.account = Account("key", "secret")
+        cls.client = AsyncClient(cls.account, log_level=logging.WARNING)
+        cls.client.API_TEMPLATE = "https://api.ote-godaddy.com/v1"
+
+        cls.fake_records = [
+            {"name": "test1", "ttl": 3600, "data": "127.0.0.1", "type": "A"},
+            {"name": "test2", "ttl": 3600, "data": "192.168.0.1", "type": "A"},
+        ]
+
+    @patch.object(AsyncClient, "_get_json_from_response", new_callable=AsyncMock)
+    def test_get_domains(self, mock):
+        mock.return_value = [{"domain": "123.com"}, {"domain": "abc.edu"}]
+
+        domains = asyncio.run(self.client.get_domains())
+
+        assert domains == ["123.com", "abc.edu"]
+        mock.assert_awaited_once_with(EndsWith("/v1/domains"), params={"limit": 1000})
+
+    @patch.object(AsyncClient, "_put", new_callable=AsyncMock)
+    def test_update_record(self, put_mock):
+        asyncio.run(self.client.update_record("test.com", self.fake_records[0]))
+
+        put_mock.assert_awaited_once_with(EndsWith("/v1/domains/test.com/records/A/test1"), json=[self.fake_records[0]])
+
+    @patch.object(AsyncClient, "replace_records", new_callable=AsyncMock)
+    @patch.object(AsyncClient, "get_records", new_callable=AsyncMock)
+    def test_update_ip_across_domains(self, get_mock, replace_mock):
+        get_mock.side_effect = lambda domain, **kwargs: [dict(r) for r in self.fake_records]
+
+        assert asyncio.run(self.client.update_ip("1.2.3.4", domains=["a.com", "b.com"], subdomains=["test1"]))
+
+        assert sorted(c.args[0] for c in replace_mock.await_args_list) == ["a.com", "b.com"]
+        for call in replace_mock.await_args_list:
+            assert call.args[1] == [{"name": "test1", "ttl": 3600, "data": "1.2.3.4", "type": "A"}]
+            assert call.kwargs == {"record_type": "A", "name": "test1"}
+
+    def test_bad_response(self):
+        raised = False
+
+        try:
+            AsyncClient._validate_response_success(422, b'{"code": "INVALID_BODY"}')
+        except BadResponse as resp:
+            raised = True
+            assert resp.message == {"code": "INVALID_BODY"}
+
+        assert raised
+
+    def test_session_closed_by_context_manager(self):
+        async def run():
+            async with AsyncClient(self.account) as client:
+                session = client._get_session()
+                assert client._get_session() is session
+            return session
+
+        assert asyncio.run(run()).closed
+
+
+class FakeResponse(object):
+    def __init__(self, session, status, content):
+        self.session = session
+        self.status = status
+        self.content = content
+
+    async def __aenter__(self):
+        self.session.in_flight += 1
+        self.session.peak = max(self.session.peak, self.session.in_flight)
+        await asyncio.sleep(0.01)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.session.in_flight -= 1
+
+    async def read(self):
+        return self.content
+
+
+class FakeSession(object):
+    """Stands in for aiohttp.ClientSession, recording requests and how many were in flight at once."""
+
+    def __init__(self, status=200, content=b"[]"):
+        self.status = status
+        self.content = content
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return FakeResponse(self, self.status, self.content)
+
+
+class TestAsyncClientRequests(object):
+    def test_requests_carry_auth_headers(self):
+        session = FakeSession(content=b'[{"name": "www", "ttl": 600, "data": "1.1.1.1", "type": "A"}]')
+        client = AsyncClient(Account("key", "secret"), session=session)
+
+        records = asyncio.run(client.get_records("a.com", record_type="A"))
+
+        assert records == [{"name": "www", "ttl": 600, "data": "1.1.1.1", "type": "A"}]
+        method, url, kwargs = session.calls[0]
+        assert method == "GET"
+        assert url.endswith("/v1/domains/a.com/records/A")
+        assert kwargs["headers"]["Authorization"] == "sso-key key:secret"
+        assert kwargs["params"] == {"limit": 500, "offset": 1}
+
+    def test_close_leaves_passed_session_in_use(self):
+        session = FakeSession()
+        client = AsyncClient(Account("key", "secret"), session=session)
+
+        async def run():
+            await client.close()
+            return await client.get_domains()
+
+        assert asyncio.run(run()) == []
+        assert client._get_session() is session
+        assert len(session.calls) == 1
+
+    def test_concurrency_is_bounded(self):
+        session = FakeSession()
+        client = AsyncClient(Account("key", "secret"), session=session, max_concurrency=3)
+
+        async def run():
+            await asyncio.gather(*(client.get_domain_info("d{}.com".format(i)) for i in range(10)))
+
+        asyncio.run(run())
+
+        assert len(session.calls) == 10
+        assert session.peak == 3
+
+    def test_error_responses_raise_bad_response(self):
+        session = FakeSession(status=404, content=b'{"code": "UNKNOWN_DOMAIN"}')
+        client = AsyncClient(Account("key", "secret"), session=session)
+
+        raised = False
+        try:
+            asyncio.run(client.delete_records("a.com", "www"))
+        except BadResponse as resp:
+            raised = True
+            assert resp.message == {"code": "UNKNOWN_DOMAIN"}
+
+        assert raised
+        assert session.calls[0][0] == "DELETE"
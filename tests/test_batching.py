@@ -0,0 +1,78 @@
+# noinspection PyPackageRequirements
+from mock import MagicMock
+
+from godaddypy.batching import BatchWriter
+from godaddypy.client import BadResponse
+from godaddypy.scheduler import BULK, INTERACTIVE
+from godaddypy.transport import SimulatedAccount
+
+
+def record(name):
+    return {"name": name, "ttl": 600, "data": "192.0.2.1", "type": "A"}
+
+
+class TestBatchWriter(object):
+    def test_records_are_written_in_one_batch_per_domain(self, make_client):
+        account = SimulatedAccount({"a.com": [], "b.com": []})
+        client = make_client(account)
+
+        with client.batch_writer(max_delay=60) as writer:
+            futures = [writer.add_record("a.com", record("a{}".format(i))) for i in range(5)]
+            futures.append(writer.add_record("b.com", record("b")))
+            assert writer.pending() == 6
+
+        assert [future.result() for future in futures] == [True] * 6
+        assert account.requests == {"PATCH": 2}
+        assert [r["name"] for r in account.zones["a.com"]] == ["a0", "a1", "a2", "a3", "a4"]
+
+    def test_batches_keep_the_priority_they_were_added_with(self, make_client):
+        client = make_client(SimulatedAccount({"a.com": []}), scheduler=True)
+
+        with client.batch_writer(max_delay=60) as writer:
+            with client.priority(BULK):
+                bulk = [writer.add_record("a.com", record("b{}".format(i))) for i in range(3)]
+            interactive = writer.add_record("a.com", record("i"))
+
+        assert all(future.result() for future in bulk + [interactive])
+        assert client.scheduler.granted == {INTERACTIVE: 1, BULK: 1}
+
+    def test_full_batch_is_written_without_waiting(self):
+        client = MagicMock()
+        writer = BatchWriter(client, max_batch=2, max_delay=60)
+
+        first = writer.add_record("a.com", record("a"))
+        second = writer.add_record("a.com", record("b"))
+
+        assert second.result(timeout=5) and first.done()
+        client.add_records.assert_called_once_with("a.com", [record("a"), record("b")])
+        writer.close()
+
+    def test_batch_is_written_after_max_delay(self):
+        client = MagicMock()
+        writer = BatchWriter(client, max_delay=0.01)
+
+        assert writer.add_record("a.com", record("a")).result(timeout=5)
+        writer.close()
+
+    def test_failed_batch_fails_its_futures(self):
+        client = MagicMock()
+        client.add_records.side_effect = BadResponse({"code": "INVALID_BODY"})
+        writer = BatchWriter(client, max_delay=60)
+
+        future = writer.add_record("a.com", record("a"))
+        writer.flush()
+
+        assert isinstance(future.exception(), BadResponse)
+        writer.close()
+
+    def test_closed_writer_rejects_records(self):
+        writer = BatchWriter(MagicMock())
+        writer.close()
+
+        raised = False
+        try:
+            writer.add_record("a.com", record("a"))
+        except RuntimeError:
+            raised = True
+
+        assert raised
@@ -0,0 +1,29 @@
+from benchmarks.fake_api import FakeGoDaddyAPI
+from godaddypy.client import BadResponse
+from godaddypy.retry import RetryPolicy
+
+
+class TestFakeAPI(object):
+    def test_client_round_trip(self, make_client):
+        with FakeGoDaddyAPI(domains=5, records_per_domain=3, max_domains_page=2) as api:
+            with make_client(api_base_url=api.base_url) as client:
+                domains = list(client.iter_domains(page_size=2))
+                report = client.update_ip("192.0.2.1", domains=domains, subdomains="host1", max_workers=4)
+
+                assert len(domains) == 5 and len(report.updated) == 5
+                assert client.get_records(domains[0], record_type="A", name="host1")[0]["data"] == "192.0.2.1"
+                assert [r["data"] for r in client.get_records(domains[0])] == ["10.0.0.0", "10.0.0.2", "192.0.2.1"]
+
+    def test_errors_and_faults(self, make_client):
+        with FakeGoDaddyAPI(domains=1, fault_rate=0.5) as api:
+            retry = RetryPolicy(max_attempts=20, backoff_base=0)
+            with make_client(api_base_url=api.base_url, retry=retry) as client:
+                assert len(client.get_records("domain00000.example")) == 10
+
+                raised = False
+                try:
+                    client.get_records("unknown.example")
+                except BadResponse as e:
+                    raised = True
+                    assert e.message["code"] in ("UNKNOWN_DOMAIN", "INJECTED_FAULT")
+                assert raised
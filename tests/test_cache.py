@@ -0,0 +1,91 @@
+import logging
+
+# noinspection PyPackageRequirements
+from mock import patch
+
+from godaddypy import Account, Client
+from godaddypy.cache import ResponseCache
+
+
+class TestResponseCache(object):
+    def test_entries_expire_per_endpoint(self, clock):
+        cache = ResponseCache(ttls={"records": 10, "domains": 100}, clock=clock)
+        cache.set(("records", "a.com"), [1])
+        cache.set(("domains", None), ["a.com"])
+
+        clock.now = 50
+        assert cache.get(("records", "a.com")) == (False, None)
+        assert cache.get(("domains", None)) == (True, ["a.com"])
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(maxsize=2)
+        cache.set(("records", "a.com"), 1)
+        cache.set(("records", "b.com"), 2)
+        cache.get(("records", "a.com"))
+        cache.set(("records", "c.com"), 3)
+
+        assert cache.get(("records", "b.com"))[0] is False
+        assert cache.get(("records", "a.com"))[0] is True
+        assert len(cache) == 2
+
+    def test_values_are_copied(self):
+        cache = ResponseCache()
+        records = [{"name": "www", "data": "1.1.1.1"}]
+        cache.set(("records", "a.com"), records)
+        records[0]["data"] = "2.2.2.2"
+
+        hit, value = cache.get(("records", "a.com"))
+        value[0]["data"] = "3.3.3.3"
+
+        assert cache.get(("records", "a.com"))[1] == [{"name": "www", "data": "1.1.1.1"}]
+
+    def test_stale_responses_are_not_stored(self):
+        cache = ResponseCache()
+        generation = cache.generation("a.com")
+        cache.invalidate_domain("a.com")
+        cache.set(("records", "a.com"), [1], generation)
+        cache.set(("records", "b.com"), [2], cache.generation("b.com"))
+
+        assert cache.get(("records", "a.com")) == (False, None)
+        assert cache.get(("records", "b.com")) == (True, [2])
+
+        generation = cache.generation("b.com")
+        cache.clear()
+        cache.set(("records", "b.com"), [3], generation)
+        assert cache.get(("records", "b.com")) == (False, None)
+
+
+class TestClientCache(object):
+    @patch.object(Client, "_put")
+    @patch.object(Client, "_get_json_from_response")
+    def test_reads_are_cached_and_invalidated_by_writes(self, get_mock, put_mock):
+        client = Client(Account("key", "secret"), log_level=logging.WARNING, cache=True)
+        get_mock.return_value = [{"name": "www", "ttl": 600, "data": "1.1.1.1", "type": "A"}]
+
+        client.get_records("a.com", record_type="A")
+        client.get_records("a.com", record_type="A")
+        client.get_records("b.com", record_type="A")
+        assert get_mock.call_count == 2
+
+        client.replace_records("a.com", [], record_type="A")
+        client.get_records("a.com", record_type="A")
+        client.get_records("b.com", record_type="A")
+        assert get_mock.call_count == 3
+
+    @patch.object(Client, "_put")
+    @patch.object(Client, "_get_json_from_response")
+    def test_read_racing_a_write_is_not_cached(self, get_mock, put_mock):
+        client = Client(Account("key", "secret"), log_level=logging.WARNING, cache=True)
+
+        def read_then_write(url, **kwargs):
+            # the write lands while the read is in flight
+            client.replace_records("a.com", [], record_type="A")
+            return [{"name": "www", "ttl": 600, "data": "1.1.1.1", "type": "A"}]
+
+        get_mock.side_effect = read_then_write
+        client.get_records("a.com", record_type="A")
+        get_mock.side_effect = None
+        get_mock.return_value = []
+
+        assert client.get_records("a.com", record_type="A") == []
+        assert get_mock.call_count == 2
@@ -6,7 +6,7 @@ import logging
 from callee import EndsWith
 
 # noinspection PyPackageRequirements
-from mock import patch
+from mock import Mock, patch
 
 from godaddypy import Account, Client
 from godaddypy.client import BadResponse
@@ -63,9 +63,9 @@ class TestClient(object):
             json=[self.fake_records[0]],
         )
 
-    @patch.object(Client, "update_record")
+    @patch.object(Client, "replace_records")
     @patch.object(Client, "get_records")
-    def test_update_ip(self, get_mock, update_mock):
+    def test_update_ip(self, get_mock, replace_mock):
         new_ip = "1.2.3.4"
 
         get_mock.return_value = [self.fake_records[0]]
@@ -74,7 +74,42 @@ class TestClient(object):
 
         expected = self.fake_records[0].copy()
         expected.update(data=new_ip)
-        update_mock.assert_called_once_with("abc.com", expected)
+        replace_mock.assert_called_once_with("abc.com", [expected], record_type="A", name="test1")
+
+    @patch.object(Client, "replace_records")
+    @patch.object(Client, "get_records")
+    def test_update_ip_batches_records_per_type(self, get_mock, replace_mock):
+        records = [
+            {"name": "www", "ttl": 600, "data": "10.0.0.1", "type": "A"},
+            {"name": "dev", "ttl": 600, "data": "10.0.0.2", "type": "A"},
+            {"name": "api", "ttl": 600, "data": "1.2.3.4", "type": "A"},
+        ]
+        get_mock.return_value = records
+
+        self.client.update_ip("1.2.3.4", domains="abc.com")
+
+        replace_mock.assert_called_once_with("abc.com", records, record_type="A", name=None)
+        assert [r["data"] for r in records] == ["1.2.3.4"] * 3
+
+    @patch.object(Client, "replace_records")
+    @patch.object(Client, "get_records")
+    def test_update_record_ip_single_put(self, get_mock, replace_mock):
+        get_mock.return_value = [
+            {"name": "www", "ttl": 600, "data": "10.0.0.1", "type": "A"},
+            {"name": "www", "ttl": 600, "data": "10.0.0.2", "type": "A"},
+        ]
+
+        self.client.update_record_ip("1.2.3.4", "abc.com", "www", "A")
+
+        replace_mock.assert_called_once_with(
+            "abc.com",
+            [
+                {"name": "www", "ttl": 600, "data": "1.2.3.4", "type": "A"},
+                {"name": "www", "ttl": 600, "data": "1.2.3.4", "type": "A"},
+            ],
+            record_type="A",
+            name="www",
+        )
 
     @patch.object(Client, "_delete")
     @patch.object(Client, "get_records")
@@ -150,3 +185,89 @@ class TestClient(object):
             raised = True
 
         assert raised
+
+    def test_session_is_pooled_and_reused(self):
+        client = Client(self.account, pool_connections=3, pool_maxsize=7)
+        session = client.session
+
+        assert client.session is session
+        adapter = session.get_adapter("https://api.godaddy.com/v1/domains")
+        assert adapter._pool_connections == 3
+        assert adapter._pool_maxsize == 7
+
+    @patch("requests.Session.request")
+    def test_request_submit_uses_session(self, request_mock):
+        request_mock.return_value.status_code = 200
+        request_mock.return_value.json.return_value = []
+
+        with Client(self.account) as client:
+            client.get_records("test.com")
+            client.delete_records("test.com", "test1")
+
+        assert [c.args[0] for c in request_mock.call_args_list] == ["GET", "DELETE"]
+        assert client.transport._session is None
+
+    def test_close_leaves_passed_session_open(self):
+        session = Mock()
+        session.request.return_value.status_code = 200
+        session.request.return_value.json.return_value = []
+        client = Client(self.account, session=session)
+        assert client.session is session
+
+        client.close()
+        client.get_domains()
+
+        session.close.assert_not_called()
+        assert client.session is session
+        assert session.request.call_args[0][0] == "GET"
+
+    @patch.object(Client, "get_domains")
+    def test_iter_domains_follows_marker(self, get_mock):
+        pages = {None: ["a.com", "b.com"], "b.com": ["c.com", "d.com"], "d.com": ["e.com"]}
+        get_mock.side_effect = lambda limit, marker: pages[marker]
+
+        for prefetch in (False, True):
+            assert list(self.client.iter_domains(page_size=2, prefetch=prefetch)) == [
+                "a.com",
+                "b.com",
+                "c.com",
+                "d.com",
+                "e.com",
+            ]
+
+    @patch.object(Client, "get_records")
+    def test_iter_records_is_lazy(self, get_mock):
+        get_mock.side_effect = (
+            lambda domain, record_type, name, offset, limit: [{"name": "r{}".format(offset), "type": "A"}] * limit
+        )
+
+        records = self.client.iter_records("test.com", page_size=2)
+        assert [next(records) for _ in range(3)] == [
+            {"name": "r1", "type": "A"},
+            {"name": "r1", "type": "A"},
+            {"name": "r2", "type": "A"},
+        ]
+        assert get_mock.call_count == 2
+
+    @patch.object(Client, "replace_records")
+    @patch.object(Client, "get_records")
+    def test_update_ip_concurrent_report(self, get_mock, replace_mock):
+        def get_records(domain, **kwargs):
+            if domain == "bad.com":
+                raise BadResponse({"code": "NOT_FOUND"})
+            if domain == "same.com":
+                return [{"name": "test1", "ttl": 3600, "data": "1.2.3.4", "type": "A"}]
+            return [{"name": "test1", "ttl": 3600, "data": "127.0.0.1", "type": "A"}]
+
+        get_mock.side_effect = get_records
+
+        report = self.client.update_ip("1.2.3.4", domains=["abc.com", "same.com", "bad.com"], max_workers=3)
+
+        assert [r.domain for r in report.updated] == ["abc.com"]
+        assert [r.domain for r in report.unchanged] == ["same.com"]
+        assert [r.domain for r in report.failed] == ["bad.com"]
+        assert isinstance(report["bad.com"].error, BadResponse)
+        assert not report.ok
+        replace_mock.assert_called_once_with(
+            "abc.com", [{"name": "test1", "ttl": 3600, "data": "1.2.3.4", "type": "A"}], record_type="A", name="test1"
+        )
@@ -0,0 +1,111 @@
+import pytest
+
+# noinspection PyPackageRequirements
+from mock import Mock, patch
+
+from godaddypy.__main__ import build_parser
+from godaddypy.ddns import DDNSState, DynamicDNS, get_public_ip
+from godaddypy.transport import SimulatedAccount
+
+
+def zones():
+    return {
+        "a.com": [
+            {"name": "www", "ttl": 600, "data": "10.0.0.1", "type": "A"},
+            {"name": "mail", "ttl": 600, "data": "10.0.0.1", "type": "A"},
+            {"name": "www", "ttl": 600, "data": "::1", "type": "AAAA"},
+        ],
+        "b.com": [{"name": "www", "ttl": 600, "data": "10.0.0.1", "type": "A"}],
+    }
+
+
+class TestDynamicDNS(object):
+    @pytest.fixture(autouse=True)
+    def setup_client(self, make_client):
+        self.account = SimulatedAccount(zones())
+        self.client = make_client(self.account)
+        self.addresses = {4: "192.0.2.1", 6: "2001:db8::1"}
+
+    def data(self, domain, name):
+        return {record["data"] for record in self.account.zones[domain] if record["name"] == name}
+
+    def make_daemon(self, state, **kwargs):
+        return DynamicDNS(self.client, state=state, detect=self.addresses.get, **kwargs)
+
+    def test_updates_records_only_when_the_address_changes(self, tmp_path):
+        state = DDNSState(tmp_path / "ddns.json")
+        daemon = self.make_daemon(state, subdomains="www", record_types=("A", "AAAA"))
+
+        reports = daemon.check()
+        requests = sum(self.account.requests.values())
+
+        assert reports["A"].ok and reports["AAAA"].ok
+        assert self.data("a.com", "mail") == {"10.0.0.1"}
+        assert self.data("a.com", "www") == {"192.0.2.1", "2001:db8::1"}
+        assert daemon.check() == {}
+        assert sum(self.account.requests.values()) == requests
+
+        self.addresses[4] = "192.0.2.2"
+        assert list(daemon.check()) == ["A"]
+        assert self.data("b.com", "www") == {"192.0.2.2"}
+
+    def test_state_survives_restarts(self, tmp_path):
+        self.make_daemon(DDNSState(tmp_path / "ddns.json"), domains="a.com").check()
+        self.account.reset_counts()
+
+        daemon = self.make_daemon(DDNSState(tmp_path / "ddns.json"), domains="a.com")
+
+        assert daemon.check() == {}
+        assert not self.account.requests
+
+    def test_changed_targets_push_again(self, tmp_path):
+        self.make_daemon(DDNSState(tmp_path / "ddns.json"), domains="a.com").check()
+
+        reports = self.make_daemon(DDNSState(tmp_path / "ddns.json"), domains=["a.com", "b.com"]).check()
+
+        assert sorted(reports["A"]) == ["a.com", "b.com"]
+
+    def test_failed_update_is_retried(self):
+        state = DDNSState(None)
+        daemon = self.make_daemon(state, domains=["a.com", "missing.com"])
+
+        assert not daemon.check()["A"].ok
+        assert state.get(daemon.targets, "A") is None
+        assert "A" in daemon.check()
+
+    def test_missing_address_is_skipped(self):
+        self.addresses[6] = None
+        daemon = self.make_daemon(DDNSState(None), record_types=("AAAA",))
+
+        assert daemon.check() == {}
+        assert not self.account.requests
+
+    def test_run_logs_errors(self):
+        daemon = self.make_daemon(DDNSState(None), interval=0)
+
+        with patch.object(daemon, "check", side_effect=[RuntimeError("boom"), {}]) as check:
+            daemon.run(iterations=2)
+
+        assert check.call_count == 2
+
+
+class TestPublicIP(object):
+    def test_falls_back_to_the_next_service(self):
+        session = Mock()
+        session.get.side_effect = [Mock(text="not an address"), Mock(text="2001:db8::1\n"), Mock(text="192.0.2.1\n")]
+
+        assert get_public_ip(4, services=["a", "b", "c"], session=session) == "192.0.2.1"
+        assert get_public_ip(4, services=["a"], session=Mock(**{"get.return_value.text": "::1"})) is None
+
+
+class TestCommandLine(object):
+    def test_ddns_arguments(self):
+        args = build_parser().parse_args(["ddns", "-d", "a.com", "-s", "www", "-t", "A", "-t", "AAAA", "--once"])
+
+        assert args.command == "ddns"
+        assert args.domains == ["a.com"]
+        assert args.record_types == ["A", "AAAA"]
+        assert args.once
+
+    def test_configure_is_the_default(self):
+        assert build_parser().parse_args([]).command is None
@@ -0,0 +1,133 @@
+import threading
+
+# noinspection PyPackageRequirements
+from mock import Mock
+
+from godaddypy.client import DEFAULT_TIMEOUT
+from godaddypy.deadline import Deadline, DeadlineExceeded
+from godaddypy.report import CANCELLED, UPDATED
+from godaddypy.retry import RetryPolicy
+from godaddypy.transport import Response, SimulatedAccount
+
+
+class TestDeadline(object):
+    def test_cap_bounds_timeouts(self, clock):
+        deadline = Deadline(5, clock=clock)
+        clock.now = 2
+
+        assert deadline.remaining() == 3
+        assert deadline.cap(None) == 3
+        assert deadline.cap(10) == 3
+        assert deadline.cap(1) == 1
+        assert deadline.cap((1, 60)) == (1, 3)
+
+    def test_cap_raises_once_expired(self, clock):
+        deadline = Deadline(1, clock=clock)
+        clock.now = 1
+
+        raised = False
+        try:
+            deadline.cap(10)
+        except DeadlineExceeded:
+            raised = True
+
+        assert raised
+        assert deadline.expired
+
+    def test_coerce(self):
+        deadline = Deadline(1)
+
+        assert Deadline.coerce(None) is None
+        assert Deadline.coerce(deadline) is deadline
+        assert Deadline.coerce(2).seconds == 2
+
+
+class TestClientDeadlines(object):
+    @staticmethod
+    def ok_transport():
+        transport = Mock()
+        transport.request.return_value = Response(200, b"[]")
+        return transport
+
+    def test_default_timeout_is_sent(self, make_client):
+        transport = self.ok_transport()
+
+        make_client(transport=transport).get_records("a.com")
+
+        assert transport.request.call_args.kwargs["timeout"] == DEFAULT_TIMEOUT
+
+    def test_timeout_is_capped_by_deadline(self, make_client):
+        transport = self.ok_transport()
+        client = make_client(transport=transport, timeout=30)
+
+        with client._deadline_scope(Deadline(2)):
+            client.get_records("a.com")
+
+        assert transport.request.call_args.kwargs["timeout"] <= 2
+
+    def test_backoff_longer_than_deadline_gives_up(self, make_client):
+        transport = Mock()
+        transport.request.return_value = Response(503, b"{}")
+        sleep = Mock()
+        client = make_client(transport=transport, retry=RetryPolicy(backoff_base=10, jitter=False, sleep=sleep))
+
+        raised = False
+        try:
+            client.update_record_ip("1.1.1.1", "a.com", "www", "A", deadline=5)
+        except DeadlineExceeded:
+            raised = True
+
+        assert raised
+        assert transport.request.call_count == 1
+        sleep.assert_not_called()
+
+    def test_update_ip_cancels_domains_past_deadline(self, make_client):
+        account = SimulatedAccount(domains=2, records_per_domain=1)
+        client = make_client(account)
+        domains = sorted(account.zones)
+        deadline = Deadline(60)
+        update_domain_ip = client._update_domain_ip
+
+        def expire_after_first(*args, **kwargs):
+            changed = update_domain_ip(*args, **kwargs)
+            deadline._expires = 0
+            return changed
+
+        client._update_domain_ip = expire_after_first
+        report = client.update_ip("192.0.2.1", domains=domains, deadline=deadline)
+
+        assert report[domains[0]].status == UPDATED
+        assert report[domains[1]].status == CANCELLED
+        assert report.cancelled == [report[domains[1]]]
+        assert not report.ok
+
+    def test_concurrent_update_ip_returns_at_deadline(self, make_client):
+        account = SimulatedAccount(domains=2, records_per_domain=1)
+        client = make_client(account)
+        release = threading.Event()
+        update_domain_ip = client._update_domain_ip
+
+        def slow(domain, *args, **kwargs):
+            if domain == "domain00001.example":
+                release.wait(5)
+            return update_domain_ip(domain, *args, **kwargs)
+
+        client._update_domain_ip = slow
+        try:
+            report = client.update_ip("192.0.2.1", domains=sorted(account.zones), max_workers=2, deadline=0.2)
+        finally:
+            release.set()
+
+        assert report["domain00000.example"].status == UPDATED
+        assert report["domain00001.example"].status == CANCELLED
+
+    def test_iter_records_stops_at_deadline(self, clock, make_client):
+        client = make_client(SimulatedAccount(domains=1, records_per_domain=5))
+        deadline = Deadline(1, clock=clock)
+
+        records = client.iter_records("domain00000.example", page_size=2, deadline=deadline)
+        first = [next(records), next(records)]
+        clock.now = 2
+
+        assert len(first) == 2
+        assert list(records) == []
@@ -0,0 +1,88 @@
+import logging
+
+from godaddypy import Account
+from godaddypy.client import BadResponse
+from godaddypy.fanout import MultiAccountExecutor
+from godaddypy.scheduler import BULK, INTERACTIVE, RequestScheduler
+from godaddypy.transport import InMemoryTransport, SimulatedAccount
+
+
+class TestMultiAccountExecutor(object):
+    def setup_method(self):
+        self.account = SimulatedAccount(domains=2, records_per_domain=1)
+        self.accounts = {
+            "shopper1": Account("fanout-key", "secret", delegate="shopper1"),
+            "shopper2": Account("fanout-key", "secret", delegate="shopper2"),
+            "other": Account("fanout-other-key", "secret"),
+        }
+
+    def make_executor(self, **kwargs):
+        return MultiAccountExecutor(
+            self.accounts, log_level=logging.ERROR, transport=InMemoryTransport(self.account), **kwargs
+        )
+
+    def test_map_runs_on_every_account(self):
+        with self.make_executor() as executor:
+            report = executor.map(
+                lambda client: (client.account.get_headers().get("X-Shopper-Id"), client.get_domains())
+            )
+
+        assert report.ok
+        assert report.values_by_account["shopper1"] == ("shopper1", sorted(self.account.zones))
+        assert report.values_by_account["other"] == (None, sorted(self.account.zones))
+        assert self.account.requests == {"GET": 3}
+
+    def test_clients_are_reused_per_account(self):
+        with self.make_executor() as executor:
+            first = executor.map(lambda client: client)
+            second = executor.map(lambda client: client, labels=["shopper1"])
+
+        assert second["shopper1"].value is first["shopper1"].value
+        assert first["shopper1"].value is not first["shopper2"].value
+
+    def test_rate_budget_is_per_api_key(self):
+        with self.make_executor(rate_limit=600) as executor:
+            limiters = executor.map(lambda client: client.rate_limiter).values_by_account
+
+        assert limiters["shopper1"] is limiters["shopper2"]
+        assert limiters["shopper1"] is not limiters["other"]
+
+    def test_tasks_run_with_the_executor_priority(self):
+        with self.make_executor(priority=BULK, rate_limit=600) as executor:
+            report = executor.map(lambda client: (client.get_domains(), client.scheduler))
+
+        assert report.ok
+        schedulers = [scheduler for _, scheduler in report.values_by_account.values()]
+        # one scheduler per client, each using the budget of its API key
+        assert len({id(scheduler) for scheduler in schedulers}) == 3
+        assert len({id(scheduler.rate_limiter) for scheduler in schedulers}) == 2
+        assert all(scheduler.granted == {INTERACTIVE: 0, BULK: 1} for scheduler in schedulers)
+
+    def test_shared_scheduler_is_rejected(self):
+        raised = False
+        try:
+            self.make_executor(rate_limit=60, scheduler=RequestScheduler())
+        except ValueError:
+            raised = True
+
+        assert raised
+
+    def test_failures_are_reported_per_account(self):
+        def get_records(client):
+            if client.account.get_headers().get("X-Shopper-Id") == "shopper2":
+                return client.get_records("missing.example")
+            return client.get_records("domain00000.example")
+
+        with self.make_executor() as executor:
+            report = executor.map(get_records)
+
+        assert not report.ok
+        assert [result.account for result in report.failed] == ["shopper2"]
+        assert isinstance(report["shopper2"].error, BadResponse)
+        assert len(report.values_by_account) == 2
+
+    def test_accounts_list_is_labelled_by_delegate(self):
+        executor = MultiAccountExecutor([self.accounts["shopper1"], self.accounts["other"]])
+        executor.close()
+
+        assert sorted(executor.accounts) == ["1", "shopper1"]
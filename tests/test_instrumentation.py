@@ -0,0 +1,57 @@
+import logging
+
+# noinspection PyPackageRequirements
+from mock import Mock, patch
+
+from godaddypy import Account, Client
+from godaddypy.instrumentation import match_endpoint
+
+
+class TestInstrumentation(object):
+    def test_match_endpoint(self):
+        templates = ["/domains/{domain}/records/{type}/{name}", "/domains/{domain}/records/{type}", "/domains"]
+
+        assert match_endpoint("/domains/a.com/records/A", templates) == "/domains/{domain}/records/{type}"
+        assert match_endpoint("/domains/a.com/records/A/www", templates) == templates[0]
+        assert match_endpoint("/other", templates) == "/other"
+
+    @patch("requests.Session.request")
+    def test_hooks_receive_events(self, request_mock):
+        request_mock.return_value = Mock(status_code=200, content=b"[]")
+        client = Client(Account("key", "secret"), log_level=logging.WARNING)
+        before, after = [], []
+        client.add_request_hook(lambda e: before.append(e.status))
+        client.add_response_hook(after.append)
+
+        client.delete_records("test.com", "www")
+
+        assert before == [None]
+        event = after[0]
+        assert event.method == "DELETE"
+        assert event.endpoint == "/domains/{domain}/records/{type}/{name}"
+        assert event.status == 200 and event.response_bytes == 2 and event.latency >= 0
+        assert event.ok and event.retries == 0
+
+    @patch("requests.Session.request")
+    def test_no_work_without_hooks(self, request_mock):
+        request_mock.return_value = Mock(status_code=200)
+        client = Client(Account("key", "secret"), log_level=logging.WARNING)
+        hook = Mock()
+        client.add_response_hook(hook)
+        client.remove_hook(hook)
+
+        with patch.object(Client, "_endpoint_for") as endpoint_mock:
+            client.delete_records("test.com", "www")
+
+        endpoint_mock.assert_not_called()
+        hook.assert_not_called()
+
+    @patch("requests.Session.request")
+    def test_content_not_logged_unless_debug(self, request_mock):
+        request_mock.return_value = Mock(status_code=200)
+        client = Client(Account("key", "secret"), log_level=logging.WARNING)
+
+        with patch.object(client.logger, "debug") as debug_mock:
+            client.delete_records("test.com", "www")
+
+        debug_mock.assert_not_called()
@@ -0,0 +1,92 @@
+import pytest
+
+# noinspection PyPackageRequirements
+from mock import patch
+
+from godaddypy.client import BadResponse
+from godaddypy.jobs import DONE, DomainUpdateJob, Journal
+from godaddypy.report import FAILED, UNCHANGED, UPDATED
+from godaddypy.transport import SimulatedAccount
+
+
+class TestDomainUpdateJob(object):
+    @pytest.fixture(autouse=True)
+    def setup_client(self, make_client):
+        self.account = SimulatedAccount(domains=6, records_per_domain=0)
+        self.client = make_client(self.account)
+        self.domains = sorted(self.account.zones)
+
+    def make_job(self, path, **settings):
+        settings = settings or {"nameServers": ["ns1.example.net", "ns2.example.net"]}
+        return DomainUpdateJob(self.client, self.domains, str(path), max_workers=3, **settings)
+
+    def test_run_updates_every_domain(self, tmp_path):
+        report = self.make_job(tmp_path / "job.journal").run()
+
+        assert report.ok and len(report.updated) == 6
+        assert all(
+            info["nameServers"] == ["ns1.example.net", "ns2.example.net"] for info in self.account.domain_info.values()
+        )
+        assert self.account.requests == {"PATCH": 6}
+
+    def test_resume_skips_completed_domains(self, tmp_path):
+        path = tmp_path / "job.journal"
+        update_domain = self.client.update_domain
+
+        def fail_some(domain, **kwargs):
+            if domain in self.domains[3:5]:
+                raise BadResponse({"code": "TOO_MANY_REQUESTS"})
+            return update_domain(domain, **kwargs)
+
+        with patch.object(self.client, "update_domain", side_effect=fail_some):
+            first = self.make_job(path).run()
+        self.account.reset_counts()
+
+        job = self.make_job(path)
+        assert job.pending() == self.domains[3:5]
+        second = job.run()
+
+        assert sorted(r.domain for r in first.failed) == self.domains[3:5]
+        assert [r.domain for r in second.updated] == self.domains[3:5]
+        assert len(second.unchanged) == 4
+        assert self.account.requests == {"PATCH": 2}
+
+    def test_changed_settings_start_a_new_job(self, tmp_path):
+        path = tmp_path / "job.journal"
+        self.make_job(path).run()
+
+        job = self.make_job(path, locked=False)
+
+        assert job.pending() == self.domains
+
+    def test_journal_survives_a_truncated_entry(self, tmp_path):
+        path = tmp_path / "job.journal"
+        job = self.make_job(path)
+        path.write_text(
+            '{{"job": "{}", "domain": "{}", "status": "done"}}\n{{"job": '.format(job.job_id, self.domains[0])
+        )
+
+        report = job.run()
+
+        assert report[self.domains[0]].status == UNCHANGED
+        assert report[self.domains[1]].status == UPDATED
+        assert len(Journal(str(path)).completed(job.job_id)) == 6
+
+    def test_journal_records_failures(self, tmp_path):
+        journal = Journal(str(tmp_path / "job.journal"))
+        journal.append("job", "a.com", FAILED, BadResponse({"code": "UNKNOWN_DOMAIN"}))
+        journal.append("job", "b.com", DONE)
+        journal.close()
+
+        assert [entry["status"] for entry in journal.entries()] == [FAILED, DONE]
+        assert journal.completed("job") == {"b.com"}
+        assert "UNKNOWN_DOMAIN" in next(journal.entries())["error"]
+
+    def test_settings_are_required(self, tmp_path):
+        raised = False
+        try:
+            DomainUpdateJob(self.client, self.domains, str(tmp_path / "job.journal"))
+        except ValueError:
+            raised = True
+
+        assert raised
@@ -0,0 +1,53 @@
+# noinspection PyPackageRequirements
+from mock import patch
+
+from godaddypy import Account, Client
+from godaddypy.ratelimit import RateLimiter
+
+
+class TestRateLimiter(object):
+    def test_burst_then_paced(self, clock):
+        limiter = RateLimiter(requests_per_minute=60, burst=2, clock=clock, sleep=clock.sleep)
+
+        waits = [limiter.acquire() for _ in range(4)]
+
+        assert waits == [0.0, 0.0, 1.0, 1.0]
+        assert clock.now == 2.0
+
+    def test_refills_while_idle(self, clock):
+        limiter = RateLimiter(requests_per_minute=120, burst=1, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire()
+        clock.now += 10
+        assert limiter.acquire() == 0.0
+        assert limiter.reserve() == 0.5
+
+    def test_shared_per_api_key(self):
+        first = Client(Account("shared-key", "secret"), rate_limit=30)
+        delegated = Client(Account("shared-key", "secret", delegate="1234"), rate_limit=30)
+        other = Client(Account("other-key", "secret"), rate_limit=30)
+
+        assert first.rate_limiter is delegated.rate_limiter
+        assert first.rate_limiter is not other.rate_limiter
+        assert Client(Account("shared-key", "secret")).rate_limiter is None
+
+    def test_conflicting_settings_are_logged(self):
+        first = RateLimiter.for_account(Account("conflict-key", "secret"), 30)
+
+        with patch("godaddypy.ratelimit.logger") as logger_mock:
+            assert RateLimiter.for_account(Account("conflict-key", "secret"), 30) is first
+            logger_mock.warning.assert_not_called()
+
+            assert RateLimiter.for_account(Account("conflict-key", "secret"), 60, burst=5) is first
+            logger_mock.warning.assert_called_once()
+
+        assert (first.requests_per_minute, first.burst) == (30, 1)
+
+    @patch("requests.Session.request")
+    def test_request_submit_acquires(self, request_mock):
+        request_mock.return_value.status_code = 200
+        with patch.object(RateLimiter, "acquire") as acquire_mock:
+            client = Client(Account("key", "secret"), rate_limit=RateLimiter(60))
+            client.delete_records("test.com", "www")
+
+        acquire_mock.assert_called_once_with()
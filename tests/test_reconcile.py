@@ -0,0 +1,83 @@
+import logging
+
+# noinspection PyPackageRequirements
+from mock import Mock, patch
+
+from godaddypy import Account, Client
+from godaddypy.reconcile import ADD, DELETE, REPLACE, plan_zone_changes
+
+
+class TestReconcile(object):
+    client: Client
+
+    @classmethod
+    def setup_class(cls):
+        cls.client = Client(Account("key", "secret"), log_level=logging.WARNING)
+
+        cls.current = [
+            {"name": "@", "ttl": 600, "data": "ns1.godaddy.com", "type": "NS"},
+            {"name": "www", "ttl": 3600, "data": "1.1.1.1", "type": "A"},
+            {"name": "old", "ttl": 3600, "data": "2.2.2.2", "type": "A"},
+            {"name": "mail", "ttl": 3600, "data": "3.3.3.3", "type": "A"},
+        ]
+
+    def test_unchanged_zone_has_empty_plan(self):
+        desired = [r for r in self.current if r["type"] != "NS"]
+
+        assert not plan_zone_changes("test.com", self.current, desired)
+
+    def test_only_desired_fields_are_compared(self):
+        desired = [{"name": "www", "data": "1.1.1.1", "type": "A"}]
+
+        plan = plan_zone_changes("test.com", self.current[:2], desired)
+
+        assert not plan
+
+    def test_minimal_plan(self):
+        desired = [
+            {"name": "www", "ttl": 3600, "data": "9.9.9.9", "type": "A"},
+            {"name": "mail", "ttl": 3600, "data": "3.3.3.3", "type": "A"},
+            {"name": "new", "ttl": 3600, "data": "4.4.4.4", "type": "A"},
+        ]
+
+        plan = plan_zone_changes("test.com", self.current, desired)
+
+        assert [(c.action, c.name) for c in plan.changes] == [(REPLACE, "www"), (ADD, "new"), (DELETE, "old")]
+
+    @patch.object(Client, "delete_records")
+    @patch.object(Client, "add_records")
+    @patch.object(Client, "replace_records")
+    @patch.object(Client, "get_records")
+    def test_reconcile_applies_plan(self, get_mock, replace_mock, add_mock, delete_mock):
+        get_mock.return_value = self.current
+        desired = [
+            {"name": "www", "ttl": 3600, "data": "9.9.9.9", "type": "A"},
+            {"name": "mail", "ttl": 3600, "data": "3.3.3.3", "type": "A"},
+            {"name": "new", "ttl": 3600, "data": "4.4.4.4", "type": "A"},
+        ]
+
+        self.client.reconcile("test.com", desired)
+
+        get_mock.assert_called_once()
+        replace_mock.assert_called_once_with("test.com", [desired[0]], record_type="A", name="www")
+        add_mock.assert_called_once_with("test.com", [desired[2]])
+        delete_mock.assert_called_once_with("test.com", "old", record_type="A")
+
+    def test_type_change_deletes_first(self):
+        desired = self.current[2:] + [{"name": "www", "ttl": 3600, "data": "@", "type": "CNAME"}]
+        client = Mock()
+
+        plan_zone_changes("test.com", self.current, desired).apply(client)
+
+        assert [call[0] for call in client.method_calls] == ["delete_records", "add_records"]
+        client.delete_records.assert_called_once_with("test.com", "www", record_type="A")
+
+    @patch.object(Client, "replace_records")
+    @patch.object(Client, "get_records")
+    def test_reconcile_dry_run(self, get_mock, replace_mock):
+        get_mock.return_value = self.current
+
+        plan = self.client.reconcile("test.com", [{"name": "www", "data": "9.9.9.9", "type": "A"}], dry_run=True)
+
+        assert len(plan.changes) == 3 and not plan.applied
+        replace_mock.assert_not_called()
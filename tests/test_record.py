@@ -0,0 +1,46 @@
+import logging
+
+# noinspection PyPackageRequirements
+from callee import EndsWith
+
+# noinspection PyPackageRequirements
+from mock import patch
+
+from godaddypy import Account, Client, Record
+
+
+class TestRecord(object):
+    json = {"name": "_sip._tcp", "ttl": 3600, "data": "sip.test.com", "type": "SRV", "priority": 10, "port": 5060}
+
+    def test_round_trip(self):
+        record = Record.from_json(self.json)
+
+        assert record.name == "_sip._tcp" and record.port == 5060 and record.weight is None
+        assert record.to_json() == self.json
+        assert Record.from_json(record.to_json()) == record
+
+    def test_is_slotted(self):
+        record = Record("A", "www", "1.1.1.1")
+
+        assert not hasattr(record, "__dict__")
+        assert record.to_json() == {"type": "A", "name": "www", "data": "1.1.1.1"}
+
+    @patch.object(Client, "_get_json_from_response")
+    def test_read_as_records(self, get_mock):
+        client = Client(Account("key", "secret"), log_level=logging.WARNING)
+        get_mock.return_value = [self.json]
+
+        assert client.get_records("test.com", as_records=True) == [Record.from_json(self.json)]
+        assert list(client.iter_records("test.com", as_records=True)) == [Record.from_json(self.json)]
+
+    @patch.object(Client, "_put")
+    @patch.object(Client, "_patch")
+    def test_writes_accept_records(self, patch_mock, put_mock):
+        client = Client(Account("key", "secret"), log_level=logging.WARNING)
+        record = Record("A", "www", "1.1.1.1", ttl=600)
+
+        client.add_record("test.com", record)
+        client.update_record("test.com", record)
+
+        patch_mock.assert_called_once_with(EndsWith("/domains/test.com/records"), json=[record.to_json()])
+        put_mock.assert_called_once_with(EndsWith("/domains/test.com/records/A/www"), json=[record.to_json()])
@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import requests
+
+# noinspection PyPackageRequirements
+from mock import Mock, patch
+
+from godaddypy import Account, Client
+from godaddypy.client import BadResponse
+from godaddypy.deadline import DeadlineExceeded
+from godaddypy.retry import RetryPolicy
+
+
+def response(status, headers=None):
+    resp = Mock(status_code=status, headers=headers or {})
+    if status >= 400:
+        resp.raise_for_status.side_effect = requests.HTTPError(str(status))
+        resp.json.return_value = {"code": str(status)}
+    else:
+        resp.json.return_value = []
+    return resp
+
+
+class TestRetryPolicy(object):
+    def test_backoff_is_exponential_and_capped(self):
+        policy = RetryPolicy(backoff_base=1, backoff_cap=5, jitter=False)
+
+        assert [policy.backoff(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+
+    def test_retry_after_is_honored(self):
+        policy = RetryPolicy(jitter=False)
+
+        assert policy.backoff(1, response(429, {"Retry-After": "12"})) == 12.0
+
+    def test_retry_after_date(self):
+        policy = RetryPolicy(jitter=False)
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        for value in (format_datetime(retry_at, usegmt=True), format_datetime(retry_at.replace(tzinfo=None))):
+            assert 25 <= policy.backoff(1, response(429, {"Retry-After": value})) <= 30
+
+    def test_timeouts_are_retried_when_idempotent(self):
+        policy = RetryPolicy()
+
+        assert policy.should_retry("GET", 1, error=requests.ReadTimeout())
+        assert not policy.should_retry("PATCH", 1, error=requests.ReadTimeout())
+        assert policy.should_retry("PATCH", 1, error=requests.ConnectTimeout())
+        assert not policy.should_retry("GET", 1, error=DeadlineExceeded())
+
+    def test_non_idempotent_only_retried_on_429(self):
+        policy = RetryPolicy()
+
+        assert not policy.should_retry("PATCH", 1, response=response(503))
+        assert not policy.should_retry("PATCH", 1, error=requests.ConnectionError())
+        assert policy.should_retry("PATCH", 1, response=response(429))
+        assert policy.should_retry("PUT", 1, response=response(503))
+        assert not policy.should_retry("GET", 1, response=response(404))
+
+    def test_client_retry_argument(self):
+        account = Account("key", "secret")
+
+        assert Client(account, retry=True).retry.max_attempts == RetryPolicy().max_attempts
+        assert Client(account, retry=5).retry.max_attempts == 5
+        assert Client(account, retry=False).retry is None
+        assert Client(account, retry=None).retry is None
+
+    @patch("requests.Session.request")
+    def test_client_retries_until_success(self, request_mock):
+        request_mock.side_effect = [response(503), requests.ConnectionError(), requests.ReadTimeout(), response(200)]
+        sleep = Mock()
+        client = Client(Account("key", "secret"), retry=RetryPolicy(max_attempts=4, sleep=sleep))
+
+        assert client.get_records("test.com") == []
+        assert request_mock.call_count == 4
+        assert sleep.call_count == 3
+        assert client.retry.retries == 3
+
+    @patch("requests.Session.request")
+    def test_client_gives_up_after_max_attempts(self, request_mock):
+        request_mock.return_value = response(500)
+        client = Client(Account("key", "secret"), retry=RetryPolicy(max_attempts=2, sleep=Mock()))
+
+        raised = False
+        try:
+            client.get_records("test.com")
+        except BadResponse as e:
+            raised = True
+            assert e.message == {"code": "500"}
+
+        assert raised
+        assert request_mock.call_count == 2
+        assert client.retry.exhausted == 1
@@ -0,0 +1,141 @@
+import threading
+import time
+
+from godaddypy.deadline import DeadlineExceeded
+from godaddypy.jobs import DomainUpdateJob
+from godaddypy.ratelimit import RateLimiter
+from godaddypy.scheduler import BULK, INTERACTIVE, RequestScheduler
+from godaddypy.transport import SimulatedAccount
+
+
+class TestRequestScheduler(object):
+    def setup_method(self):
+        self.scheduler = RequestScheduler(max_in_flight=1)
+        self.order = []
+        self.threads = []
+
+    def queue(self, label, priority, flow=None):
+        """Starts a thread waiting for a slot and returns once it is queued."""
+        waiting = self.scheduler.waiting()
+
+        def request():
+            with self.scheduler.slot(priority, flow):
+                self.order.append(label)
+
+        thread = threading.Thread(target=request)
+        thread.start()
+        self.threads.append(thread)
+        while self.scheduler.waiting() == waiting:
+            time.sleep(0.001)
+
+    def run_queued(self):
+        self.scheduler.release()
+        for thread in self.threads:
+            thread.join(5)
+
+    def test_interactive_requests_jump_ahead(self):
+        self.scheduler.acquire(BULK)
+        self.queue("bulk1", BULK)
+        self.queue("bulk2", BULK)
+        self.queue("interactive", INTERACTIVE)
+
+        self.run_queued()
+
+        assert self.order == ["interactive", "bulk1", "bulk2"]
+        assert self.scheduler.granted == {INTERACTIVE: 1, BULK: 3}
+
+    def test_flows_are_served_round_robin(self):
+        self.scheduler.acquire(BULK)
+        self.queue("a1", BULK, "a")
+        self.queue("a2", BULK, "a")
+        self.queue("a3", BULK, "a")
+        self.queue("b1", BULK, "b")
+
+        self.run_queued()
+
+        assert self.order == ["a1", "b1", "a2", "a3"]
+
+    def test_timeout(self):
+        self.scheduler.acquire()
+
+        raised = False
+        try:
+            self.scheduler.acquire(BULK, timeout=0.01)
+        except DeadlineExceeded:
+            raised = True
+
+        assert raised
+        assert self.scheduler.waiting() == 0
+
+    def test_rate_limit_is_shared(self):
+        sleeps = []
+        limiter = RateLimiter(60, sleep=sleeps.append)
+        scheduler = RequestScheduler(limiter)
+
+        with scheduler.slot():
+            pass
+
+        assert limiter.peek() > 0
+        assert sleeps == []
+
+    def test_unknown_priority(self):
+        raised = False
+        try:
+            self.scheduler.acquire("urgent")
+        except ValueError:
+            raised = True
+
+        assert raised
+
+
+class TestClientPriority(object):
+    def test_requests_are_scheduled_by_priority(self, make_client):
+        client = make_client(SimulatedAccount(domains=1), max_concurrency=2, scheduler=True)
+
+        with client.priority(BULK):
+            client.get_domains()
+        client.get_domain_info("domain00000.example")
+
+        assert client.scheduler.max_in_flight == 2
+        assert client._concurrency is None
+        assert client.scheduler.granted == {INTERACTIVE: 1, BULK: 1}
+
+    def test_priority_carries_over_to_worker_threads(self, make_client, tmp_path):
+        account = SimulatedAccount(domains=4, records_per_domain=2)
+        client = make_client(account, scheduler=True)
+
+        with client.priority(BULK):
+            client.update_ip("192.0.2.1", max_workers=4)
+            list(client.iter_records("domain00000.example", page_size=1, prefetch=True))
+            DomainUpdateJob(client, sorted(account.zones), str(tmp_path / "job"), max_workers=2, locked=False).run()
+
+        # update_ip: 1 + 4 GETs and 4 PUTs, iter_records: 3 GETs, the job: 4 PATCHes
+        assert client.scheduler.granted == {INTERACTIVE: 0, BULK: 16}
+
+    def test_explicit_scheduler_is_used_as_is(self, make_client):
+        limiter = RateLimiter(60)
+        scheduler = RequestScheduler(limiter, max_in_flight=2)
+        client = make_client(SimulatedAccount(domains=1), rate_limit=limiter, max_concurrency=2, scheduler=scheduler)
+
+        client.get_domains()
+
+        assert client.scheduler is scheduler
+        assert limiter.peek() > 0
+
+    def test_scheduler_with_other_limits_is_rejected(self, make_client):
+        limiter = RateLimiter(60)
+        for kwargs in (
+            dict(rate_limit=limiter, scheduler=RequestScheduler()),
+            dict(rate_limit=limiter, scheduler=RequestScheduler(RateLimiter(120))),
+            dict(max_concurrency=2, scheduler=RequestScheduler(max_in_flight=4)),
+        ):
+            scheduler = kwargs["scheduler"]
+            raised = False
+            try:
+                make_client(**kwargs)
+            except ValueError:
+                raised = True
+
+            assert raised
+            # the caller's scheduler is left alone
+            assert scheduler.rate_limiter is not limiter
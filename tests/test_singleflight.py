@@ -0,0 +1,101 @@
+import logging
+import threading
+import time
+
+# noinspection PyPackageRequirements
+from mock import Mock
+
+from godaddypy import Account, Client
+from godaddypy.deadline import DeadlineExceeded
+from godaddypy.singleflight import SingleFlight
+from godaddypy.transport import Response
+
+
+def wait_for_followers(flights, count=3, timeout=5):
+    """Waits until count callers joined the in-flight call; fails instead of hanging if coalescing broke."""
+    expires = time.monotonic() + timeout
+    while flights.coalesced < count:
+        assert time.monotonic() < expires, "only {} of {} callers were coalesced".format(flights.coalesced, count)
+        time.sleep(0.001)
+
+
+class TestSingleFlight(object):
+    def test_concurrent_calls_share_one_result(self):
+        flights = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        func = Mock(side_effect=lambda: started.set() or release.wait(5) and "result")
+        results = []
+
+        leader = threading.Thread(target=lambda: results.append(flights.do("key", func)))
+        leader.start()
+        started.wait(5)
+        followers = [threading.Thread(target=lambda: results.append(flights.do("key", func))) for _ in range(3)]
+        for thread in followers:
+            thread.start()
+        wait_for_followers(flights)
+        release.set()
+        for thread in [leader] + followers:
+            thread.join()
+
+        assert results == ["result"] * 4
+        func.assert_called_once_with()
+
+    def test_errors_are_shared_and_not_cached(self):
+        flights = SingleFlight()
+        func = Mock(side_effect=[ValueError("boom"), "ok"])
+
+        raised = False
+        try:
+            flights.do("key", func)
+        except ValueError:
+            raised = True
+
+        assert raised
+        assert flights.do("key", func) == "ok"
+
+    def test_waiting_caller_times_out(self):
+        flights = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        leader = threading.Thread(target=flights.do, args=("key", lambda: started.set() or release.wait(5)))
+        leader.start()
+        started.wait(5)
+
+        raised = False
+        try:
+            flights.do("key", Mock(), timeout=0.01)
+        except DeadlineExceeded:
+            raised = True
+        release.set()
+        leader.join()
+
+        assert raised
+
+
+class TestClientCoalescing(object):
+    def test_identical_reads_are_coalesced(self):
+        release = threading.Event()
+        transport = Mock()
+        transport.request.side_effect = lambda *args, **kwargs: release.wait(5) and Response(
+            200, b'[{"name": "www", "ttl": 600, "data": "1.1.1.1", "type": "A"}]'
+        )
+        client = Client(Account("key", "secret"), log_level=logging.ERROR, transport=transport)
+        results = []
+
+        threads = [threading.Thread(target=lambda: results.append(client.get_records("a.com"))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        wait_for_followers(client._flights)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert transport.request.call_count == 1
+        assert len(results) == 4
+        # every caller gets its own copy
+        results[0][0]["data"] = "2.2.2.2"
+        assert results[1][0]["data"] == "1.1.1.1"
+
+    def test_coalescing_can_be_disabled(self):
+        client = Client(Account("key", "secret"), coalesce_reads=False)
+
+        assert client._flights is None
@@ -0,0 +1,48 @@
+import logging
+
+# noinspection PyPackageRequirements
+from mock import patch
+
+from godaddypy import Account, Client
+from godaddypy.snapshot import SnapshotStore
+
+
+class TestSnapshotStore(object):
+    records = [{"name": "www", "ttl": 600, "data": "1.1.1.1", "type": "A"}]
+
+    def test_put_and_get(self, tmp_path):
+        path = tmp_path / "zones.sqlite"
+        with SnapshotStore(path) as store:
+            assert store.put("a.com", self.records)
+            assert not store.put("a.com", self.records)
+
+        with SnapshotStore(path) as store:
+            snapshot = store.get("a.com")
+            assert store.domains() == ["a.com"]
+
+        assert snapshot.records == self.records
+        assert snapshot.digest == SnapshotStore.digest(self.records)
+
+    def test_stale_domains(self, clock):
+        store = SnapshotStore(":memory:", max_age=60, clock=clock)
+        store.put("a.com", self.records)
+        clock.now += 30
+        store.put("b.com", self.records)
+        clock.now += 40
+
+        assert store.stale_domains(["a.com", "b.com", "c.com"]) == ["a.com", "c.com"]
+
+    @patch.object(Client, "_put")
+    @patch.object(Client, "get_records")
+    def test_client_uses_fresh_snapshots(self, get_mock, put_mock):
+        store = SnapshotStore(":memory:", max_age=60)
+        client = Client(Account("key", "secret"), log_level=logging.WARNING, snapshots=store)
+        get_mock.return_value = self.records
+
+        assert client.get_zone("a.com") == self.records
+        assert client.get_zone("a.com") == self.records
+        assert client.refresh_snapshots(["a.com", "b.com"]) == ["b.com"]
+        assert get_mock.call_count == 2
+
+        client.replace_records("a.com", self.records)
+        assert store.get("a.com") is None
@@ -0,0 +1,47 @@
+import logging
+
+# noinspection PyPackageRequirements
+from mock import Mock, patch
+
+from godaddypy import Account, Client
+from godaddypy.instrumentation import RequestEvent
+from godaddypy.stats import LatencyHistogram, StatsCollector
+
+
+class TestStats(object):
+    def test_histogram_percentiles(self):
+        histogram = LatencyHistogram(buckets=(0.1, 0.2, 0.5))
+        for value in [0.05] * 50 + [0.15] * 45 + [0.4] * 5:
+            histogram.observe(value)
+
+        assert histogram.count == 100
+        assert 0 < histogram.percentile(50) <= 0.1
+        assert 0.1 < histogram.percentile(95) <= 0.2
+        assert 0.2 < histogram.percentile(99) <= 0.4
+        assert list(histogram.cumulative())[-1] == ("+Inf", 100)
+
+    def test_collector_snapshot_and_prometheus(self):
+        collector = StatsCollector()
+        endpoint = "/domains/{domain}/records"
+        collector(RequestEvent("GET", endpoint, "", status=200, latency=0.02, response_bytes=100))
+        collector(RequestEvent("GET", endpoint, "", attempt=2, status=503, latency=0.3, response_bytes=10))
+
+        stats = collector.snapshot()["GET " + endpoint]
+        assert stats["count"] == 2 and stats["errors"] == 1 and stats["retries"] == 1
+        assert stats["response_bytes"] == 110
+
+        text = collector.to_prometheus()
+        assert "# TYPE godaddypy_request_duration_seconds histogram" in text
+        assert 'godaddypy_request_duration_seconds_count{method="GET",endpoint="/domains/{domain}/records"} 2' in text
+        assert 'godaddypy_request_errors_total{method="GET",endpoint="/domains/{domain}/records"} 1' in text
+
+    @patch("requests.Session.request")
+    def test_client_stats(self, request_mock):
+        request_mock.return_value = Mock(status_code=200, content=b"[]")
+        request_mock.return_value.json.return_value = []
+        client = Client(Account("key", "secret"), log_level=logging.WARNING, stats=True)
+
+        client.get_records("a.com", record_type="A")
+        client.get_records("b.com", record_type="A")
+
+        assert client.stats()["GET /domains/{domain}/records/{type}"]["count"] == 2
@@ -0,0 +1,51 @@
+# noinspection PyPackageRequirements
+from mock import Mock
+
+from godaddypy import Account, Client
+from godaddypy.client import BadResponse
+from godaddypy.transport import RequestsTransport, SimulatedAccount, Transport
+
+
+class TestTransport(object):
+    def test_default_transport(self):
+        client = Client(Account("key", "secret"), pool_maxsize=4)
+
+        assert isinstance(client.transport, RequestsTransport)
+        assert client.session.get_adapter("https://api.godaddy.com/")._pool_maxsize == 4
+
+    def test_custom_transport(self, make_client):
+        transport = Mock(spec=Transport)
+        transport.request.return_value.status_code = 200
+        transport.request.return_value.json.return_value = {"domain": "a.com"}
+
+        with make_client(transport=transport) as client:
+            assert client.get_domain_info("a.com") == {"domain": "a.com"}
+            assert client.session is None
+
+        assert transport.request.call_args.args == ("GET",)
+        assert transport.request.call_args.kwargs["url"].endswith("/v1/domains/a.com")
+        transport.close.assert_called_once_with()
+
+    def test_in_memory_account(self, make_client):
+        account = SimulatedAccount({"a.com": [{"name": "www", "ttl": 600, "data": "1.1.1.1", "type": "A"}]})
+        client = make_client(account)
+
+        client.add_record("a.com", {"name": "dev", "ttl": 600, "data": "1.1.1.2", "type": "A"})
+        client.update_ip("2.2.2.2")
+        client.delete_records("a.com", "dev")
+
+        assert client.get_domains() == ["a.com"]
+        assert client.get_records("a.com") == [{"name": "www", "ttl": 600, "data": "2.2.2.2", "type": "A"}]
+        assert account.requests == {"GET": 4, "PATCH": 1, "PUT": 1, "DELETE": 1}
+
+    def test_in_memory_errors(self, make_client):
+        client = make_client(SimulatedAccount(domains=1))
+
+        raised = False
+        try:
+            client.get_records("missing.com")
+        except BadResponse as e:
+            raised = True
+            assert e.message["code"] == "UNKNOWN_DOMAIN"
+
+        assert raised
@@ -0,0 +1,106 @@
+from concurrent.futures import wait
+
+import pytest
+
+# noinspection PyPackageRequirements
+from mock import patch
+
+from godaddypy import Record
+from godaddypy.client import BadResponse
+from godaddypy.deadline import DeadlineExceeded
+from godaddypy.transport import SimulatedAccount
+from godaddypy.watch import PropagationWatcher
+
+
+class TestPropagationWatcher(object):
+    @pytest.fixture(autouse=True)
+    def setup_client(self, make_client):
+        self.account = SimulatedAccount(domains=3, records_per_domain=1)
+        self.client = make_client(self.account, cache=True)
+        self.domains = sorted(self.account.zones)
+
+    def make_watcher(self, **kwargs):
+        kwargs.setdefault("min_interval", 0.005)
+        kwargs.setdefault("max_interval", 0.02)
+        return PropagationWatcher(self.client, **kwargs)
+
+    def test_resolves_each_domain_once_it_converges(self):
+        polls = []
+        get_domain_info = self.client.get_domain_info
+
+        def apply_after_two_polls(domain):
+            polls.append(domain)
+            if polls.count(domain) == 2:
+                self.account.domain_info[domain]["locked"] = False
+            return get_domain_info(domain)
+
+        with patch.object(self.client, "get_domain_info", side_effect=apply_after_two_polls):
+            with self.make_watcher() as watcher:
+                futures = [watcher.watch_domain(domain, {"locked": False}, timeout=5) for domain in self.domains]
+                done, pending = wait(futures, timeout=5)
+
+        assert not pending
+        assert all(future.result()["locked"] is False for future in futures)
+        assert sorted(polls) == sorted(self.domains * 2)
+
+    def test_times_out(self):
+        with self.make_watcher() as watcher:
+            future = watcher.watch_domain(self.domains[0], lambda info: False, timeout=0.05)
+
+            assert isinstance(future.exception(timeout=5), DeadlineExceeded)
+
+    def test_watch_records(self):
+        domain = self.domains[0]
+        expected = Record("A", "dev", "192.0.2.1")
+
+        with self.make_watcher() as watcher:
+            future = watcher.watch_records(domain, [expected], record_type="A", timeout=5)
+            self.account.zones[domain].append({"name": "dev", "ttl": 600, "data": "192.0.2.1", "type": "A"})
+
+            assert {"name": "dev", "ttl": 600, "data": "192.0.2.1", "type": "A"} in future.result(timeout=5)
+
+    def test_poll_errors_are_retried(self):
+        get_domain_info = self.client.get_domain_info
+        side_effect = [BadResponse({"code": "TOO_MANY_REQUESTS"}), get_domain_info]
+
+        def flaky(domain):
+            effect = side_effect.pop(0) if side_effect else get_domain_info
+            if isinstance(effect, Exception):
+                raise effect
+            return effect(domain)
+
+        with patch.object(self.client, "get_domain_info", side_effect=flaky):
+            with self.make_watcher() as watcher:
+                future = watcher.watch_domain(self.domains[0], {"locked": True}, timeout=5)
+
+                assert future.result(timeout=5)["locked"] is True
+
+    def test_predicate_errors_fail_the_watch(self):
+        with self.make_watcher() as watcher:
+            future = watcher.watch_domain(self.domains[0], lambda info: info["missing"], timeout=5)
+
+            assert isinstance(future.exception(timeout=5), KeyError)
+            assert watcher.pending() == 0
+
+    def test_interval_backs_off_while_nothing_changes(self):
+        watcher = self.make_watcher(min_interval=1, max_interval=5, backoff=2)
+        watch = type("Watch", (), {})()
+        watch.interval, watch.last, watch.expires = 1, None, None
+        watch.key = self.domains[0]
+
+        with patch.object(watcher, "_schedule"):
+            intervals = []
+            for state in ["a", "a", "a", "a", "b", "b"]:
+                watcher._reschedule(watch, state)
+                intervals.append(watch.interval)
+        watcher.close()
+
+        assert intervals == [1, 2, 4, 5, 1, 2]
+
+    def test_close_cancels_pending_watches(self):
+        watcher = self.make_watcher(min_interval=60)
+        future = watcher.watch_domain(self.domains[0], {"locked": False})
+
+        watcher.close()
+
+        assert future.cancelled()
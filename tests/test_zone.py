@@ -0,0 +1,84 @@
+import logging
+
+# noinspection PyPackageRequirements
+from mock import patch
+
+from godaddypy import Account, Client, Record
+from godaddypy.client import BadResponse
+from godaddypy.zone import ZoneView
+
+
+class TestZoneView(object):
+    client: Client
+
+    @classmethod
+    def setup_class(cls):
+        cls.client = Client(Account("key", "secret"), log_level=logging.WARNING)
+
+    @staticmethod
+    def make_zone():
+        return ZoneView(
+            "test.com",
+            [
+                {"name": "www", "ttl": 600, "data": "1.1.1.1", "type": "A"},
+                {"name": "dev", "ttl": 600, "data": "1.1.1.2", "type": "A"},
+                {"name": "www", "ttl": 600, "data": "::1", "type": "AAAA"},
+                Record("MX", "@", "mail.test.com", ttl=600, priority=10),
+            ],
+        )
+
+    def test_indexes(self):
+        zone = self.make_zone()
+
+        assert len(zone) == 4 and zone.types() == {"A", "AAAA", "MX"}
+        assert [r["data"] for r in zone.by_name("www")] == ["1.1.1.1", "::1"]
+        assert [r["name"] for r in zone.by_type("A")] == ["www", "dev"]
+        assert zone.get("MX", "@") == [{"name": "@", "ttl": 600, "data": "mail.test.com", "type": "MX", "priority": 10}]
+        assert ("AAAA", "www") in zone and ("AAAA", "dev") not in zone
+
+    def test_filter(self):
+        zone = self.make_zone()
+
+        assert len(zone.filter()) == 4
+        assert sorted(r["data"] for r in zone.filter(types={"A", "AAAA"}, names=["www"])) == ["1.1.1.1", "::1"]
+        assert zone.filter(types="A", names="nope") == []
+
+    @patch.object(Client, "replace_records")
+    @patch.object(Client, "get_records")
+    def test_update_ip_from_zone_does_no_reads(self, get_mock, replace_mock):
+        zone = self.make_zone()
+
+        self.client.update_ip("9.9.9.9", zones=zone, subdomains=["www"])
+        self.client.update_record_ip("9.9.9.9", "test.com", "www", "AAAA", zone=zone)
+
+        get_mock.assert_not_called()
+        assert replace_mock.call_count == 2
+        assert [r["data"] for r in zone.by_name("www")] == ["9.9.9.9", "9.9.9.9"]
+        assert zone.get("A", "dev")[0]["data"] == "1.1.1.2"
+
+    @patch.object(Client, "replace_records")
+    def test_update_ip_from_zone_writes_per_name(self, replace_mock):
+        zone = self.make_zone()
+
+        self.client.update_ip("9.9.9.9", zones=zone)
+
+        assert sorted(c.kwargs["name"] for c in replace_mock.call_args_list) == ["dev", "www"]
+        assert all(c.kwargs["record_type"] == "A" for c in replace_mock.call_args_list)
+
+    @patch.object(Client, "replace_records")
+    def test_failed_write_leaves_zone_unchanged(self, replace_mock):
+        zone = self.make_zone()
+        replace_mock.side_effect = BadResponse({"code": "TOO_MANY_REQUESTS"})
+
+        for update in (
+            lambda: self.client.update_ip("9.9.9.9", zones=zone),
+            lambda: self.client.update_record_ip("9.9.9.9", "test.com", "www", "A", zone=zone),
+        ):
+            raised = False
+            try:
+                update()
+            except BadResponse:
+                raised = True
+            assert raised
+
+        assert [r["data"] for r in zone.by_type("A")] == ["1.1.1.1", "1.1.1.2"]
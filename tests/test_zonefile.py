@@ -0,0 +1,160 @@
+import io
+
+from godaddypy import Record
+from godaddypy.transport import SimulatedAccount
+from godaddypy.zonefile import (
+    ZoneFileParser,
+    export_zone,
+    export_zones,
+    format_record,
+    import_zone,
+    import_zones,
+    write_zone,
+)
+
+ZONE = """; a hand written zone
+$ORIGIN example.com.
+$TTL 1h
+@       IN  SOA ns1.example.com. admin.example.com. (
+                2024010101 ; serial
+                7200 3600 1209600 3600 )
+        IN  NS  ns1.example.com.
+@       600 IN  A   192.0.2.1
+www         IN  A   192.0.2.2
+            IN  AAAA 2001:db8::2
+mail.example.com. IN 300 MX 10 mx.example.net.
+alias       CNAME   www
+txt         TXT "v=spf1 include:example.net ~all" "second \\"part\\""
+_sip._tcp   SRV 10 20 5060 sip.example.com.
+"""
+
+
+class TestZoneFileParser(object):
+    def test_parse(self):
+        records = {(r.type, r.name): r for r in ZoneFileParser().parse(io.StringIO(ZONE))}
+
+        assert records["SOA", "@"].data.split()[:3] == ["ns1.example.com.", "admin.example.com.", "2024010101"]
+        assert records["A", "@"] == Record("A", "@", "192.0.2.1", 600)
+        assert records["AAAA", "www"] == Record("AAAA", "www", "2001:db8::2", 3600)
+        assert records["MX", "mail"] == Record("MX", "mail", "mx.example.net", 300, priority=10)
+        assert records["CNAME", "alias"].data == "www"
+        assert records["TXT", "txt"].data == "v=spf1 include:example.net ~all" + 'second "part"'
+        assert records["SRV", "@"] == Record(
+            "SRV", "@", "sip.example.com", 3600, priority=10, port=5060, weight=20, protocol="_tcp", service="_sip"
+        )
+
+    def test_names_outside_of_the_origin_are_rejected(self):
+        parser = ZoneFileParser(origin="example.com")
+
+        raised = False
+        try:
+            list(parser.parse(["www.example.org. IN A 192.0.2.1"]))
+        except ValueError:
+            raised = True
+
+        assert raised
+
+    def test_names_follow_origin_changes(self):
+        zone = [
+            "$ORIGIN example.com.",
+            "www IN A 192.0.2.1",
+            "$ORIGIN sub.example.com.",
+            "@ IN A 192.0.2.2",
+            "host IN A 192.0.2.3",
+            "$ORIGIN deeper",
+            "host IN A 192.0.2.4",
+            "abs.example.com. IN A 192.0.2.5",
+        ]
+
+        names = [record.name for record in ZoneFileParser().parse(zone)]
+
+        assert names == ["www", "sub", "host.sub", "host.deeper.sub", "abs"]
+
+    def test_origin_outside_of_the_domain_is_rejected(self):
+        parser = ZoneFileParser(origin="example.com")
+
+        raised = False
+        try:
+            list(parser.parse(["$ORIGIN example.org.", "www IN A 192.0.2.1"]))
+        except ValueError:
+            raised = True
+
+        assert raised
+
+    def test_round_trip(self):
+        records = [
+            Record("A", "@", "192.0.2.1", 600),
+            Record("MX", "@", "mx.example.net", 3600, priority=10),
+            Record("CNAME", "www", "@", 3600),
+            Record("TXT", "long", "x" * 300 + ' "quoted" \\', 3600),
+            Record(
+                "SRV", "eu", "sip.example.com", 3600, priority=1, port=5060, weight=5, protocol="_udp", service="_sip"
+            ),
+        ]
+        stream = io.StringIO()
+
+        assert write_zone(stream, "example.com", records) == len(records)
+        stream.seek(0)
+        assert list(ZoneFileParser().parse(stream)) == records
+
+    def test_long_txt_with_escapes_round_trips(self):
+        for data in ("a" * 254 + '"' + "b" * 10, "a" * 254 + "\\" + "b" * 300, '"' * 600):
+            line = format_record(Record("TXT", "txt", data, 3600))
+
+            assert [record.data for record in ZoneFileParser().parse([line])] == [data]
+
+    def test_format_record_accepts_dicts(self):
+        line = format_record({"type": "A", "name": "www", "data": "192.0.2.1", "ttl": 600})
+
+        assert line == "www\t600\tIN\tA\t192.0.2.1"
+
+
+class TestZoneImportExport(object):
+    def test_export_and_import_zones(self, tmp_path, make_client):
+        source = SimulatedAccount(domains=3, records_per_domain=20)
+        target = SimulatedAccount({domain: [] for domain in source.zones})
+
+        report = export_zones(make_client(source), tmp_path, max_workers=2, page_size=7)
+        assert report.ok and len(report) == 3
+        assert sorted(path.name for path in tmp_path.iterdir()) == sorted(d + ".zone" for d in source.zones)
+
+        report = import_zones(make_client(target), tmp_path, batch_size=8)
+        assert report.ok
+        assert target.zones == source.zones
+        # 20 records per zone in batches of 8: one PUT and two PATCHes
+        assert target.requests == {"PUT": 3, "PATCH": 6}
+
+    def test_import_skips_managed_types_and_uses_origin(self, make_client):
+        account = SimulatedAccount({"example.com": [{"name": "old", "ttl": 600, "data": "10.0.0.1", "type": "A"}]})
+
+        count = import_zone(make_client(account), io.StringIO(ZONE))
+
+        assert count == 7
+        zone = account.zones["example.com"]
+        assert {r["type"] for r in zone} == {"A", "AAAA", "MX", "CNAME", "TXT", "SRV"}
+        assert "old" not in {r["name"] for r in zone}
+
+    def test_import_without_replace_adds(self, make_client):
+        account = SimulatedAccount({"example.com": [{"name": "old", "ttl": 600, "data": "10.0.0.1", "type": "A"}]})
+
+        import_zone(make_client(account), ["new 600 IN A 10.0.0.2"], domain="example.com", replace=False)
+
+        assert [r["name"] for r in account.zones["example.com"]] == ["old", "new"]
+
+    def test_failed_export_leaves_no_file(self, tmp_path, make_client):
+        report = export_zones(make_client(SimulatedAccount({})), tmp_path, domains="missing.com")
+
+        assert not report.ok
+        assert list(tmp_path.iterdir()) == []
+
+    def test_export_zone_to_path(self, tmp_path, make_client):
+        account = SimulatedAccount(domains=1, records_per_domain=2)
+        path = tmp_path / "zone.txt"
+
+        assert export_zone(make_client(account), "domain00000.example", path) == 2
+        assert path.read_text().splitlines()[1:] == [
+            "$ORIGIN domain00000.example.",
+            "$TTL 3600",
+            "host0\t600\tIN\tA\t10.0.0.0",
+            "host1\t600\tIN\tA\t10.0.0.1",
+        ]